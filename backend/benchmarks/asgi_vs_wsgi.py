@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""
+WSGI(gunicorn) 배포와 ASGI(uvicorn) 배포의 처리량/지연 시간 비교 벤치마크
+
+같은 데이터베이스를 바라보는 두 서버를 미리 띄워 둔 뒤 실행합니다.
+    gunicorn qr_stamp_backend.wsgi:application --workers 4 --bind 127.0.0.1:8001
+    uvicorn qr_stamp_backend.asgi:application --workers 4 --port 8002
+
+    python benchmarks/asgi_vs_wsgi.py \
+        --wsgi-url http://127.0.0.1:8001 --asgi-url http://127.0.0.1:8002 \
+        --concurrency 1 10 50 100 --requests 500
+
+WSGI 서버는 기존 동기 API(/api/...), ASGI 서버는 비동기 API(/api/async/...)로 호출합니다.
+"""
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+# 시나리오: (이름, HTTP 메서드, 동기 경로, 비동기 경로)
+SCENARIOS = [
+    ('booth_list', 'GET', '/api/booths/', '/api/async/booths/'),
+    ('participant_stats', 'GET', '/api/participants/{pid}/stats/', '/api/async/participants/{pid}/stats/'),
+    ('participant_detail', 'GET', '/api/participants/{pid}/detail/', '/api/async/participants/{pid}/detail/'),
+    ('scan_qr', 'POST', '/api/scan/', '/api/async/scan/'),
+]
+
+_local = threading.local()
+
+
+def _session():
+    if not hasattr(_local, 'session'):
+        _local.session = requests.Session()
+    return _local.session
+
+
+def prepare_participant(base_url, booth_code):
+    """통계/상세 조회용 참여자 1명 생성"""
+    response = requests.post(f'{base_url}/api/scan/', json={'booth_code': booth_code}, timeout=10)
+    return response.json()['data']['participant_id']
+
+
+def run_scenario(base_url, method, path, booth_codes, concurrency, total):
+    """동시 접속 수(concurrency)로 total 건 요청 후 처리량/지연 시간 계산"""
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def one(i):
+        nonlocal errors
+        started = time.perf_counter()
+        try:
+            if method == 'POST':
+                response = _session().post(
+                    base_url + path,
+                    json={'booth_code': booth_codes[i % len(booth_codes)]},
+                    timeout=30
+                )
+            else:
+                response = _session().get(base_url + path, timeout=30)
+            ok = response.status_code < 500
+        except requests.RequestException:
+            ok = False
+        elapsed = (time.perf_counter() - started) * 1000
+        with lock:
+            latencies.append(elapsed)
+            if not ok:
+                errors += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(total)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'rps': total / wall,
+        'p50': statistics.median(latencies),
+        'p95': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        'p99': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        'errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WSGI vs ASGI 벤치마크')
+    parser.add_argument('--wsgi-url', required=True, help='gunicorn 서버 주소')
+    parser.add_argument('--asgi-url', required=True, help='uvicorn 서버 주소')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 10, 50, 100])
+    parser.add_argument('--requests', type=int, default=500, help='시나리오/동시 접속 수별 요청 수')
+    parser.add_argument('--booths', nargs='+', default=[f'BOOTH{i:03d}' for i in range(1, 18)])
+    args = parser.parse_args()
+
+    # 배포 이름: (서버 주소, 비동기 API 사용 여부)
+    targets = {
+        'WSGI': (args.wsgi_url.rstrip('/'), False),
+        'ASGI': (args.asgi_url.rstrip('/'), True),
+    }
+    participant_id = prepare_participant(args.wsgi_url.rstrip('/'), args.booths[0])
+
+    print('📊 WSGI vs ASGI 벤치마크')
+    print('=' * 86)
+    print(f"{'시나리오':<20}{'동시접속':>8}  {'배포':<6}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'오류':>8}")
+    print('-' * 86)
+    for name, method, sync_path, async_path in SCENARIOS:
+        for concurrency in args.concurrency:
+            for label, (base_url, use_async) in targets.items():
+                path = (async_path if use_async else sync_path).format(pid=participant_id)
+                result = run_scenario(base_url, method, path, args.booths, concurrency, args.requests)
+                print(
+                    f"{name:<20}{concurrency:>8}  {label:<6}{result['rps']:>10.1f}"
+                    f"{result['p50']:>10.1f}{result['p95']:>10.1f}{result['p99']:>10.1f}{result['errors']:>8}"
+                )
+        print('-' * 86)
+
+
+if __name__ == '__main__':
+    main()
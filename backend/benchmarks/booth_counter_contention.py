@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+부스 참여자 수 카운터 잠금 경합 스트레스 벤치마크
+
+한 인기 부스에 동시 스캔이 몰리는 상황을 스레드로 재현합니다.
+각 스레드는 스캔 트랜잭션처럼 카운터 UPDATE 후 --hold-ms 동안 트랜잭션을 유지하며,
+슬롯 1개(한 행)와 BOOTH_COUNTER_SHARDS 개 슬롯(분산)일 때의 UPDATE 대기 시간을 비교합니다.
+MySQL 에서는 InnoDB 행 잠금 대기 횟수/시간(Innodb_row_lock_waits/time)도 함께 출력합니다.
+SQLite 는 쓰기 시 데이터베이스 전체를 잠그므로 분산 효과가 나타나지 않습니다.
+
+    cd backend
+    python benchmarks/booth_counter_contention.py --threads 32 --scans 50 --shards 16
+"""
+import argparse
+import statistics
+import threading
+import time
+
+from common import test_database  # Django 설정 (django/stamps 모듈보다 먼저 import)
+
+from django.db import connection, transaction
+from django.test.utils import override_settings
+
+from stamps.models import Booth, BoothCounterShard
+
+
+def innodb_lock_status():
+    """(행 잠금 대기 횟수, 누적 대기 ms) — MySQL 이 아니면 None"""
+    if connection.vendor != 'mysql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SHOW GLOBAL STATUS WHERE Variable_name IN ('Innodb_row_lock_waits', 'Innodb_row_lock_time')")
+        status = dict(cursor.fetchall())
+    return int(status['Innodb_row_lock_waits']), int(status['Innodb_row_lock_time'])
+
+
+def run(booth_id, threads, scans, hold):
+    """(초당 스캔 수, UPDATE 대기 시간 목록 ms, 오류 수)"""
+    barrier = threading.Barrier(threads)
+    waits = []
+    errors = []
+    lock = threading.Lock()
+
+    def worker():
+        local = []
+        try:
+            barrier.wait()
+            for _ in range(scans):
+                with transaction.atomic():
+                    started = time.perf_counter()
+                    BoothCounterShard.add(booth_id)
+                    local.append((time.perf_counter() - started) * 1000)
+                    # 스캔 트랜잭션의 나머지 작업(참여자 UPDATE 등) 동안 잠금 유지
+                    time.sleep(hold)
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            connection.close()
+            with lock:
+                waits.extend(local)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return len(waits) / elapsed, waits, len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='부스 카운터 잠금 경합 벤치마크')
+    parser.add_argument('--threads', type=int, default=32, help='동시 스캔 스레드 수')
+    parser.add_argument('--scans', type=int, default=50, help='스레드당 스캔 수')
+    parser.add_argument('--shards', type=int, default=16, help='분산 카운터 슬롯 수')
+    parser.add_argument('--hold-ms', type=float, default=5, help='UPDATE 후 트랜잭션 유지 시간 (ms)')
+    args = parser.parse_args()
+
+    with test_database():
+        if connection.vendor == 'sqlite':
+            print('⚠️  SQLite 는 데이터베이스 단위로 쓰기를 잠그므로 MySQL 에서 실행해야 의미 있는 결과가 나옵니다.')
+        booth = Booth.objects.create(code='HOT001', name='인기 부스')
+
+        print('📊 부스 카운터 잠금 경합 벤치마크')
+        print(f'스레드 {args.threads}개 × 스캔 {args.scans}회, 트랜잭션 유지 {args.hold_ms}ms')
+        print('=' * 88)
+        print(
+            f"{'방식':<14}{'스캔/초':>10}{'대기 평균 ms':>14}{'p95 ms':>10}{'최대 ms':>10}"
+            f"{'잠금 대기':>10}{'잠금 ms':>10}{'오류':>6}"
+        )
+        print('-' * 88)
+        for label, shards in (('단일 행', 1), (f'분산 {args.shards}슬롯', args.shards)):
+            with override_settings(BOOTH_COUNTER_SHARDS=shards):
+                BoothCounterShard.objects.filter(booth=booth).delete()
+                BoothCounterShard.create_slots(booth.id)
+                before = innodb_lock_status()
+                throughput, waits, errors = run(booth.id, args.threads, args.scans, args.hold_ms / 1000)
+                after = innodb_lock_status()
+
+            lock_waits, lock_ms = ('-', '-')
+            if before and after:
+                lock_waits, lock_ms = after[0] - before[0], after[1] - before[1]
+            p95 = statistics.quantiles(waits, n=20)[-1] if len(waits) > 1 else 0
+            print(
+                f'{label:<14}{throughput:>10.1f}{statistics.mean(waits or [0]):>14.2f}{p95:>10.2f}'
+                f'{max(waits or [0]):>10.2f}{lock_waits:>10}{lock_ms:>10}{errors:>6}'
+            )
+            total = booth.get_participant_count()
+            if total != len(waits):
+                print(f'  ⚠️  카운터 합계 {total} != 성공한 스캔 {len(waits)}')
+
+
+if __name__ == '__main__':
+    main()
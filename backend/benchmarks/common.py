@@ -0,0 +1,30 @@
+"""
+벤치마크 공통 준비
+- import 시 backend 디렉터리를 import 경로에 넣고 Django 를 설정하므로
+  각 벤치마크는 django/stamps 모듈보다 먼저 import
+- test_database(): 임시 테스트 데이터베이스를 만들고 끝나면 삭제 (운영 데이터에는 영향 없음)
+"""
+import os
+import sys
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qr_stamp_backend.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+
+@contextmanager
+def test_database():
+    """임시 테스트 데이터베이스 안에서 실행"""
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""
+스탬프 기록 내보내기(/api/admin/export/stamps.*) 대용량 벤치마크
+
+합성 스탬프 기록을 --rows 행(기본 500만) 만든 뒤 NDJSON / CSV / gzip 내보내기를 끝까지 읽으며
+처리 속도와 전송 크기, 내보내는 동안의 최대 메모리(RSS) 증가량을 측정합니다.
+청크 단위 조회이므로 메모리 증가량은 행 수와 무관하게 EXPORT_CHUNK_SIZE 에 비례해야 합니다.
+
+    cd backend
+    python benchmarks/export_stream.py --rows 5000000 --chunk-size 5000
+"""
+import argparse
+import os
+import resource
+import sys
+import time
+import uuid
+
+from common import test_database  # Django 설정 (django/stamps 모듈보다 먼저 import)
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from stamps.models import Booth, Participant, StampRecord
+
+BOOTHS = 5
+INSERT_BATCH = 10000
+
+
+def rss_mb():
+    """현재 RSS (MB, /proc 가 없으면 최대 RSS)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+    except OSError:
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage / 1024 / 1024 if sys.platform == 'darwin' else usage / 1024
+
+
+def prepare(rows):
+    """참여자당 BOOTHS 개 스탬프로 rows 행 생성"""
+    booths = [Booth.objects.create(code=f'BOOTH{i:03d}', name=f'체험부스 {i}') for i in range(1, BOOTHS + 1)]
+    now = timezone.now()
+    created = 0
+    started = time.perf_counter()
+    while created < rows:
+        people = [
+            Participant(id=uuid.uuid4(), stamp_count=BOOTHS)
+            for _ in range(min(INSERT_BATCH, rows - created) // BOOTHS or 1)
+        ]
+        with transaction.atomic():
+            Participant.objects.bulk_create(people, batch_size=1000)
+            StampRecord.objects.bulk_create((
+                StampRecord(participant=person, booth=booth, stamped_at=now,
+                            ip_address='10.0.0.1', user_agent='Mozilla/5.0 (benchmark)')
+                for person in people for booth in booths
+            ), batch_size=1000)
+        created += len(people) * BOOTHS
+        print(f'\r  데이터 생성 {created:,}/{rows:,}행', end='', flush=True)
+    print(f' ({time.perf_counter() - started:.0f}초)')
+    return created
+
+
+def measure(client, url):
+    """(초, 전송 MB, 줄 수, 최대 RSS 증가 MB)"""
+    baseline = peak = rss_mb()
+    size = lines = 0
+    started = time.perf_counter()
+    response = client.get(url)
+    for block in response.streaming_content:
+        size += len(block)
+        lines += block.count(b'\n')
+        peak = max(peak, rss_mb())
+    response.close()
+    return time.perf_counter() - started, size / 1024 / 1024, lines, peak - baseline
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스탬프 기록 내보내기 대용량 벤치마크')
+    parser.add_argument('--rows', type=int, default=5_000_000, help='생성할 스탬프 기록 수')
+    parser.add_argument('--chunk-size', type=int, default=5000, help='EXPORT_CHUNK_SIZE')
+    args = parser.parse_args()
+
+    client = Client()
+    with test_database():
+        client.force_login(User.objects.create_superuser('benchmark', 'benchmark@example.com', None))
+        print('📊 스탬프 기록 내보내기 벤치마크')
+        rows = prepare(args.rows)
+        print(f'행 {rows:,}개, 청크 {args.chunk_size:,}행')
+        print('=' * 72)
+        print(f"{'형식':<18}{'초':>8}{'행/초':>12}{'MB':>10}{'MB/초':>10}{'RSS 증가 MB':>14}")
+        print('-' * 72)
+        with override_settings(EXPORT_CHUNK_SIZE=args.chunk_size):
+            for label, url in (
+                ('NDJSON', '/api/admin/export/stamps.ndjson'),
+                ('CSV', '/api/admin/export/stamps.csv'),
+                ('NDJSON + gzip', '/api/admin/export/stamps.ndjson?gzip=1'),
+            ):
+                seconds, size, lines, growth = measure(client, url)
+                print(
+                    f'{label:<18}{seconds:>8.1f}{rows / seconds:>12,.0f}{size:>10.1f}'
+                    f'{size / seconds:>10.1f}{growth:>14.1f}'
+                )
+                if label == 'NDJSON' and lines != rows:
+                    print(f'  ⚠️  내보낸 줄 {lines:,} != 생성한 행 {rows:,}')
+
+
+if __name__ == '__main__':
+    main()
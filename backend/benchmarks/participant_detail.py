@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""
+참여자 상세 API(get_participant_detail) 부스 수별 벤치마크
+
+부스를 한 개씩 직렬화하며 부스마다 COUNT(*) 를 실행하고 방문 기록을 선형 탐색하던
+이전 방식과, 방문 기록 색인 + 활성 부스 스냅샷을 사용하는 현재 방식을 비교합니다.
+
+    cd backend
+    python benchmarks/participant_detail.py --booths 17 50 100 250 500 --stamps 5
+"""
+import argparse
+import statistics
+import time
+
+from common import test_database  # Django 설정 (django/stamps 모듈보다 먼저 import)
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from stamps.booth_registry import booth_registry
+from stamps.models import Booth, Participant, StampRecord, VISIT_BITMAP_SIZE
+from stamps.serializers import BoothSerializer
+
+
+def legacy_detail(participant_id):
+    """이전 방식: 부스별 직렬화(COUNT 쿼리) + 방문 기록 선형 탐색"""
+    participant = Participant.objects.get(id=participant_id)
+    visited_records = participant.stamp_records.select_related('booth').all()
+    visited_booths = []
+    visited_booth_ids = set()
+    for record in visited_records:
+        visited_booths.append({'booth': BoothSerializer(record.booth).data, 'stamped_at': record.stamped_at})
+        visited_booth_ids.add(record.booth.id)
+
+    booths_with_status = []
+    for booth in Booth.objects.filter(is_active=True).order_by('code'):
+        booth_data = BoothSerializer(booth).data
+        booth_data['visited'] = booth.id in visited_booth_ids
+        if booth.id in visited_booth_ids:
+            visited_record = next((r for r in visited_records if r.booth.id == booth.id), None)
+            if visited_record:
+                booth_data['stamped_at'] = visited_record.stamped_at
+        booths_with_status.append(booth_data)
+    return visited_booths, booths_with_status
+
+
+def prepare(booth_count, stamp_count, participants):
+    """부스/참여자/스탬프 데이터 생성 후 측정 대상 참여자 ID 반환"""
+    StampRecord.objects.all().delete()
+    Participant.objects.all().delete()
+    Booth.objects.all().delete()
+    Booth.objects.bulk_create(
+        Booth(
+            code=f'BOOTH{i:03d}', name=f'체험부스 {i}',
+            visit_slot=i if i <= VISIT_BITMAP_SIZE else None,
+        )
+        for i in range(1, booth_count + 1)
+    )
+    booths = list(Booth.objects.order_by('code'))
+    people = Participant.objects.bulk_create(Participant() for _ in range(participants))
+    StampRecord.objects.bulk_create(
+        StampRecord(participant=person, booth=booths[(n + k * 7) % booth_count])
+        for n, person in enumerate(people)
+        for k in range(min(stamp_count, booth_count))
+    )
+    booth_registry.invalidate()
+    cache.clear()
+    return people[0].id
+
+
+def measure(func, repeat):
+    """(중앙값 ms, 쿼리 수)"""
+    func()  # 예열
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    with CaptureQueriesContext(connection) as ctx:
+        func()
+    return statistics.median(timings), len(ctx.captured_queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='참여자 상세 API 부스 수별 벤치마크')
+    parser.add_argument('--booths', type=int, nargs='+', default=[17, 50, 100, 250, 500])
+    parser.add_argument('--stamps', type=int, default=5, help='참여자당 스탬프 수')
+    parser.add_argument('--participants', type=int, default=200, help='부스별 참여자 수 집계용 참여자 수')
+    parser.add_argument('--repeat', type=int, default=30)
+    args = parser.parse_args()
+
+    client = APIClient()
+    with test_database():
+        print('📊 참여자 상세 API 벤치마크')
+        print('=' * 72)
+        print(f"{'부스 수':>8}  {'이전 ms':>10}{'이전 쿼리':>10}  {'현재 ms':>10}{'현재 쿼리':>10}{'개선':>10}")
+        print('-' * 72)
+        for booth_count in args.booths:
+            participant_id = prepare(booth_count, args.stamps, args.participants)
+            url = f'/api/participants/{participant_id}/detail/'
+            legacy_ms, legacy_queries = measure(lambda: legacy_detail(participant_id), args.repeat)
+            current_ms, current_queries = measure(lambda: client.get(url), args.repeat)
+            print(
+                f'{booth_count:>8}  {legacy_ms:>10.2f}{legacy_queries:>10}'
+                f'  {current_ms:>10.2f}{current_queries:>10}{legacy_ms / current_ms:>9.1f}x'
+            )
+
+
+if __name__ == '__main__':
+    main()
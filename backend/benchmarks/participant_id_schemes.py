@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""
+참여자 ID 방식별 삽입 처리량 / 색인 크기 벤치마크
+
+무작위 uuid4 CHAR(32) (기존), 시간 순 uuid7 CHAR(32), uuid7 BINARY(16) 세 방식으로
+참여자 테이블과 이를 참조하는 스탬프 기록 테이블(참여자당 --stamps 행)을 만들어
+--participants 명(기본 100만 명)을 삽입하는 속도와 테이블/색인 크기를 비교합니다.
+MySQL(InnoDB)에서 실행해야 클러스터형 색인 삽입 위치와 크기 차이가 제대로 나타납니다.
+
+    cd backend
+    python benchmarks/participant_id_schemes.py --participants 1000000 --stamps 3
+"""
+import argparse
+import time
+import uuid
+
+from common import test_database  # Django 설정 (django/stamps 모듈보다 먼저 import)
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from stamps.participant_ids import uuid7
+
+INSERT_BATCH = 5000
+
+# (이름, ID 생성, DB 값 변환, 컬럼 형식 {DB: 형식})
+SCHEMES = [
+    ('uuid4 CHAR(32)', uuid.uuid4, lambda value: value.hex, {'mysql': 'CHAR(32)', 'sqlite': 'CHAR(32)'}),
+    ('uuid7 CHAR(32)', uuid7, lambda value: value.hex, {'mysql': 'CHAR(32)', 'sqlite': 'CHAR(32)'}),
+    ('uuid7 BINARY(16)', uuid7, lambda value: value.bytes, {'mysql': 'BINARY(16)', 'sqlite': 'BLOB'}),
+]
+
+AUTO_ID = {'mysql': 'BIGINT AUTO_INCREMENT PRIMARY KEY', 'sqlite': 'INTEGER PRIMARY KEY AUTOINCREMENT'}
+
+
+def create_tables(suffix, id_type):
+    vendor = connection.vendor
+    participants, stamps = f'bench_participants_{suffix}', f'bench_stamps_{suffix}'
+    with connection.cursor() as cursor:
+        cursor.execute(f'CREATE TABLE {participants} (id {id_type} NOT NULL PRIMARY KEY, created_at DATETIME NOT NULL)')
+        cursor.execute(
+            f'CREATE TABLE {stamps} (id {AUTO_ID[vendor]}, participant_id {id_type} NOT NULL, '
+            f'booth_id INTEGER NOT NULL, stamped_at DATETIME NOT NULL, '
+            f'UNIQUE (participant_id, booth_id))'
+        )
+        cursor.execute(f'CREATE INDEX {stamps}_time ON {stamps} (participant_id, stamped_at)')
+    return participants, stamps
+
+
+def insert(participants_table, stamps_table, make_id, to_db, total, stamps_per):
+    """(초당 참여자 수, 초당 스탬프 수)"""
+    now = timezone.now().replace(tzinfo=None)
+    started = time.perf_counter()
+    for offset in range(0, total, INSERT_BATCH):
+        ids = [to_db(make_id()) for _ in range(min(INSERT_BATCH, total - offset))]
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {participants_table} (id, created_at) VALUES (%s, %s)',
+                [(value, now) for value in ids]
+            )
+            cursor.executemany(
+                f'INSERT INTO {stamps_table} (participant_id, booth_id, stamped_at) VALUES (%s, %s, %s)',
+                [(value, booth, now) for value in ids for booth in range(1, stamps_per + 1)]
+            )
+        print(f'\r  {offset + len(ids):,}/{total:,}명', end='', flush=True)
+    elapsed = time.perf_counter() - started
+    print('\r' + ' ' * 40 + '\r', end='')
+    return total / elapsed, total * stamps_per / elapsed
+
+
+def table_sizes(table):
+    """(데이터 MB, 보조 색인 MB) - MySQL 은 InnoDB 통계, SQLite 는 dbstat (지원 시)"""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'mysql':
+            cursor.execute(f'ANALYZE TABLE {table}')
+            cursor.fetchall()
+            cursor.execute(
+                'SELECT DATA_LENGTH, INDEX_LENGTH FROM information_schema.TABLES '
+                'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s',
+                [table]
+            )
+            data, index = cursor.fetchone()
+            return data / 1024 / 1024, index / 1024 / 1024
+        try:
+            cursor.execute('SELECT name, SUM(pgsize) FROM dbstat WHERE tbl_name = %s GROUP BY name', [table])
+        except Exception:
+            return None, None
+        sizes = dict(cursor.fetchall())
+    data = sizes.pop(table, 0)
+    return data / 1024 / 1024, sum(sizes.values()) / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='참여자 ID 방식별 삽입/색인 크기 벤치마크')
+    parser.add_argument('--participants', type=int, default=1_000_000, help='방식별 삽입할 참여자 수')
+    parser.add_argument('--stamps', type=int, default=3, help='참여자당 스탬프 기록 수')
+    args = parser.parse_args()
+
+    with test_database():
+        if connection.vendor == 'sqlite':
+            print('⚠️  SQLite 는 클러스터형 기본 키 색인이 없으므로 MySQL 에서 실행해야 의미 있는 결과가 나옵니다.')
+        print('📊 참여자 ID 방식별 벤치마크')
+        print(f'참여자 {args.participants:,}명 × 스탬프 {args.stamps}개')
+        print('=' * 96)
+        print(
+            f"{'방식':<18}{'참여자/초':>12}{'스탬프/초':>12}"
+            f"{'참여자 MB':>12}{'참여자 색인':>12}{'스탬프 MB':>12}{'스탬프 색인':>12}"
+        )
+        print('-' * 96)
+
+        def mb(value):
+            return '-' if value is None else f'{value:.1f}'
+
+        for suffix, (label, make_id, to_db, id_types) in enumerate(SCHEMES):
+            participants_table, stamps_table = create_tables(suffix, id_types[connection.vendor])
+            participant_rate, stamp_rate = insert(
+                participants_table, stamps_table, make_id, to_db, args.participants, args.stamps
+            )
+            participant_data, participant_index = table_sizes(participants_table)
+            stamp_data, stamp_index = table_sizes(stamps_table)
+            print(
+                f'{label:<18}{participant_rate:>12,.0f}{stamp_rate:>12,.0f}'
+                f'{mb(participant_data):>12}{mb(participant_index):>12}{mb(stamp_data):>12}{mb(stamp_index):>12}'
+            )
+
+
+if __name__ == '__main__':
+    main()
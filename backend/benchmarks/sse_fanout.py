@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+관리자 대시보드 실시간 이벤트(SSE) 팬아웃 지연 시간 측정 하네스
+
+대시보드 클라이언트 여러 개를 /api/admin/stream/ 에 동시에 연결한 뒤 스캔을 발생시키고,
+스캔 요청 시각부터 각 클라이언트가 해당 stamp 이벤트를 받기까지의 지연 시간을 측정합니다.
+서버는 ASGI(uvicorn)로 미리 띄워 둡니다. 측정용 참여자/스탬프가 실제로 저장되므로
+테스트용 데이터베이스를 사용하세요.
+
+    uvicorn qr_stamp_backend.asgi:application --workers 2 --port 8002
+    python benchmarks/sse_fanout.py --url http://127.0.0.1:8002 --booth-code BOOTH001 \\
+        --clients 200 --events 50
+"""
+import argparse
+import json
+import statistics
+import threading
+import time
+
+import requests
+
+
+def percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+class StreamClient(threading.Thread):
+    """SSE 연결 하나 (stamp 이벤트 수신 시각을 참여자 ID별로 기록)"""
+
+    def __init__(self, url, ready):
+        super().__init__(daemon=True)
+        self.url = url
+        self.ready = ready
+        self.received = {}
+        self.error = None
+        self._stop_event = threading.Event()
+
+    def run(self):
+        try:
+            with requests.get(self.url, stream=True, timeout=(10, 60)) as response:
+                response.raise_for_status()
+                event_type = None
+                for line in response.iter_lines(decode_unicode=True):
+                    if self._stop_event.is_set():
+                        break
+                    if line.startswith('retry:'):
+                        self.ready.release()
+                    elif line.startswith('event:'):
+                        event_type = line[6:].strip()
+                    elif line.startswith('data:') and event_type == 'stamp':
+                        event = json.loads(line[5:])
+                        self.received.setdefault(event['participant_id'], time.perf_counter())
+        except Exception as exc:
+            self.error = exc
+            self.ready.release()
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SSE 대시보드 팬아웃 지연 시간 측정')
+    parser.add_argument('--url', required=True, help='ASGI 서버 주소')
+    parser.add_argument('--booth-code', required=True, help='스캔에 사용할 활성 부스 코드')
+    parser.add_argument('--clients', type=int, default=100, help='동시 연결 대시보드 수')
+    parser.add_argument('--events', type=int, default=50, help='발생시킬 스캔 수')
+    parser.add_argument('--interval', type=float, default=0.1, help='스캔 간격 (초)')
+    parser.add_argument('--settle', type=float, default=3.0, help='마지막 스캔 후 수신 대기 시간 (초)')
+    args = parser.parse_args()
+
+    base_url = args.url.rstrip('/')
+    ready = threading.Semaphore(0)
+    clients = [StreamClient(f'{base_url}/api/admin/stream/', ready) for _ in range(args.clients)]
+    connect_started = time.perf_counter()
+    for client in clients:
+        client.start()
+    for _ in clients:
+        ready.acquire(timeout=30)
+    connect_ms = (time.perf_counter() - connect_started) * 1000
+    failed = [client for client in clients if client.error]
+
+    # 스캔 발생: 매번 새 참여자로 스캔하여 이벤트를 참여자 ID로 구분
+    sent = {}
+    session = requests.Session()
+    for _ in range(args.events):
+        started = time.perf_counter()
+        response = session.post(f'{base_url}/api/scan/', json={'booth_code': args.booth_code}, timeout=30)
+        if response.status_code == 201:
+            sent[str(response.json()['data']['participant_id'])[:8]] = started
+        time.sleep(args.interval)
+    time.sleep(args.settle)
+    for client in clients:
+        client.stop()
+
+    latencies = []
+    spreads = []
+    delivered = 0
+    for participant_id, started in sent.items():
+        arrivals = [client.received[participant_id] for client in clients if participant_id in client.received]
+        delivered += len(arrivals)
+        latencies.extend((arrival - started) * 1000 for arrival in arrivals)
+        if arrivals:
+            spreads.append((max(arrivals) - min(arrivals)) * 1000)
+
+    expected = len(sent) * (len(clients) - len(failed))
+    print('📊 SSE 대시보드 팬아웃 측정')
+    print('=' * 60)
+    print(f'연결: {len(clients) - len(failed)}/{len(clients)}개 ({connect_ms:.0f}ms), 스캔: {len(sent)}건')
+    print(f'전달: {delivered}/{expected}건')
+    if latencies:
+        print(f'스캔 → 수신 지연 ms: p50 {statistics.median(latencies):.1f}, '
+              f'p95 {percentile(latencies, 0.95):.1f}, p99 {percentile(latencies, 0.99):.1f}, '
+              f'최대 {max(latencies):.1f}')
+        print(f'이벤트별 첫 수신 ~ 마지막 수신 간격 ms: p50 {statistics.median(spreads):.1f}, '
+              f'최대 {max(spreads):.1f}')
+    for client in failed[:5]:
+        print(f'  ⚠️  연결 실패: {client.error}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,337 @@
+#!/usr/bin/env python
+"""
+QR 링크(stamp_view) HTML 렌더링 마이크로 벤치마크
+
+기존 stamp_view 의 f-string 페이지 생성(이전 방식), 템플릿으로 페이지 전체를 렌더링하는 방식,
+공통 틀을 캐시하고 진행 상황 조각만 렌더링하는 방식(stamps.stamp_pages)의
+렌더링 시간과 메모리 할당량을 비교합니다. DB 접근은 없습니다.
+
+    cd backend
+    python benchmarks/stamp_page_render.py --iterations 5000
+"""
+import argparse
+import time
+import tracemalloc
+
+import common  # noqa: F401  Django 설정 (django/stamps 모듈보다 먼저 import)
+
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+
+from stamps import stamp_pages
+
+VISITED_BOOTHS = [
+    {'name': f'체험부스 {i}', 'code': f'BOOTH{i:03d}', 'stamped_at': f'09/27 1{i}:00'}
+    for i in range(1, 4)
+]
+
+
+def render_original_page(message='체험부스 3에서 스탬프를 받았습니다!', stamp_count=3,
+                         visited_booths=VISITED_BOOTHS, total_booths=17):
+    """이전 방식: 기존 stamp_view 의 f-string 렌더링 코드 그대로 (요청마다 페이지 전체 생성)"""
+    target_stamps = 5  # 목표 스탬프 수
+    progress_percentage = min((stamp_count / target_stamps) * 100, 100)
+    remaining_stamps = max(target_stamps - stamp_count, 0)
+    is_completed = stamp_count >= target_stamps
+
+    # 스탬프 진행 상황 아이콘 생성
+    stamp_icons = ''
+    for i in range(target_stamps):
+        if i < stamp_count:
+            stamp_icons += '✅'
+        else:
+            stamp_icons += '⭕'
+
+    # 방문한 부스 HTML 생성
+    visited_booths_html = ''
+    if visited_booths:
+        visited_items_html = ''
+        for booth in visited_booths:
+            visited_items_html += f'<div class="visited-item"><span class="booth-name">{booth["name"]}</span><span class="visit-time">{booth["stamped_at"]}</span></div>'
+        visited_booths_html = f'<div class="visited-list">{visited_items_html}</div>'
+
+    # HTML 응답 생성
+    return HttpResponse(
+        f"""
+            <!DOCTYPE html>
+            <html lang="ko">
+            <head>
+                <meta charset="UTF-8">
+                <meta name="viewport" content="width=device-width, initial-scale=1.0">
+                <title>🏮 제46회 소양강문화제 - QR 스탬프 투어</title>
+                <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;600;700&display=swap" rel="stylesheet">
+                <style>
+                    body {{ 
+                        font-family: 'Noto Sans KR', Arial, sans-serif; 
+                        margin: 0; padding: 20px; 
+                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                        min-height: 100vh;
+                        color: #333;
+                    }}
+                    .container {{
+                        max-width: 420px;
+                        margin: 0 auto;
+                        background: white;
+                        border-radius: 16px;
+                        overflow: hidden;
+                        box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+                    }}
+                    .header {{
+                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                        color: white;
+                        padding: 20px;
+                        text-align: center;
+                    }}
+                    .header h1 {{ margin: 0; font-size: 20px; font-weight: 700; }}
+                    .header p {{ margin: 5px 0 0 0; opacity: 0.9; font-size: 14px; }}
+                    .content {{ padding: 30px 25px; }}
+                    .message {{ 
+                        background: #d4edda; 
+                        color: #155724; 
+                        padding: 15px; 
+                        border-radius: 10px; 
+                        margin-bottom: 25px; 
+                        font-weight: 600;
+                        text-align: center;
+                        border: 1px solid #c3e6cb;
+                    }}
+                    .progress-card {{
+                        background: linear-gradient(135deg, #ff6b9d, #f093fb);
+                        color: white;
+                        border-radius: 15px;
+                        padding: 25px;
+                        text-align: center;
+                        margin-bottom: 20px;
+                        box-shadow: 0 4px 15px rgba(240, 147, 251, 0.3);
+                    }}
+                    .progress-number {{
+                        font-size: 42px;
+                        font-weight: 700;
+                        margin: 10px 0;
+                    }}
+                    .progress-text {{ font-size: 16px; opacity: 0.9; }}
+                    .progress-bar {{
+                        background: rgba(255,255,255,0.3);
+                        height: 8px;
+                        border-radius: 4px;
+                        margin: 15px 0;
+                        overflow: hidden;
+                    }}
+                    .progress-fill {{
+                        background: white;
+                        height: 100%;
+                        width: {progress_percentage}%;
+                        border-radius: 4px;
+                        transition: width 0.5s ease;
+                    }}
+                    .stamp-status {{
+                        background: #f8f9fa;
+                        border-radius: 12px;
+                        padding: 20px;
+                        margin-bottom: 20px;
+                    }}
+                    .stamp-status h3 {{
+                        margin: 0 0 15px 0;
+                        color: #667eea;
+                        font-size: 18px;
+                        display: flex;
+                        align-items: center;
+                        gap: 8px;
+                    }}
+                    .stamp-icons {{
+                        font-size: 24px;
+                        letter-spacing: 8px;
+                        margin: 15px 0;
+                        text-align: center;
+                    }}
+                    .booth-stats {{
+                        background: #e3f2fd;
+                        border-radius: 10px;
+                        padding: 15px;
+                        margin-bottom: 20px;
+                        text-align: center;
+                    }}
+                    .booth-stats h4 {{ margin: 0 0 10px 0; color: #1976d2; }}
+                    .booth-stats-number {{ font-size: 28px; font-weight: 700; color: #1976d2; }}
+                    .visited-list {{
+                        max-height: 150px;
+                        overflow-y: auto;
+                        margin-top: 15px;
+                    }}
+                    .visited-item {{
+                        display: flex;
+                        justify-content: space-between;
+                        align-items: center;
+                        padding: 8px 12px;
+                        background: #f0f8ff;
+                        border-radius: 6px;
+                        margin-bottom: 5px;
+                        font-size: 14px;
+                    }}
+                    .visited-item .booth-name {{ font-weight: 600; color: #333; }}
+                    .visited-item .visit-time {{ color: #666; font-size: 12px; }}
+                    .admin-link {{
+                        text-align: center;
+                        margin-top: 20px;
+                        padding-top: 20px;
+                        border-top: 1px solid #eee;
+                    }}
+                    .admin-btn {{
+                        background: #6c757d;
+                        color: white;
+                        padding: 10px 20px;
+                        border: none;
+                        border-radius: 6px;
+                        font-size: 14px;
+                        text-decoration: none;
+                        display: inline-block;
+                        transition: all 0.3s ease;
+                    }}
+                    .admin-btn:hover {{ background: #5a6268; transform: translateY(-1px); }}
+                    .completion-badge {{
+                        background: linear-gradient(135deg, #28a745, #20c997);
+                        color: white;
+                        padding: 15px;
+                        border-radius: 10px;
+                        text-align: center;
+                        font-weight: 600;
+                        margin-bottom: 20px;
+                        animation: pulse 2s infinite;
+                    }}
+                    @keyframes pulse {{
+                        0% {{ transform: scale(1); }}
+                        50% {{ transform: scale(1.02); }}
+                        100% {{ transform: scale(1); }}
+                    }}
+                    .footer-info {{
+                        text-align: center;
+                        color: #6c757d;
+                        font-size: 13px;
+                        margin-top: 20px;
+                        line-height: 1.4;
+                    }}
+                </style>
+            </head>
+            <body>
+                <div class="container">
+                    <div class="header">
+                        <h1>🏮 제46회 소양강문화제</h1>
+                        <p>체험부스 스탬프 투어</p>
+                    </div>
+                    
+                    <div class="content">
+                        <div class="message">{message}</div>
+                        
+                        {'<div class="completion-badge">🎉 축하합니다! 스탬프 미션 완료! 🎉</div>' if is_completed else ''}
+                        
+                        <div class="progress-card">
+                            <div style="font-size: 16px; font-weight: 600; margin-bottom: 5px;">스탬프 수집 현황</div>
+                            <div class="progress-number">{stamp_count} / {target_stamps}</div>
+                            <div class="progress-text">{'미션 완료!' if is_completed else f'{remaining_stamps}개 더 수집하면 완료!'}</div>
+                            <div class="progress-bar">
+                                <div class="progress-fill"></div>
+                            </div>
+                            <div class="progress-text">{progress_percentage:.0f}% 완료</div>
+                        </div>
+                        
+                        <div class="stamp-status">
+                            <h3>📋 스탬프 수집 현황</h3>
+                            <div class="stamp-icons">{stamp_icons}</div>
+                            <div style="text-align: center; color: #6c757d; font-size: 14px;">
+                                {'완료' if is_completed else f'현재 {stamp_count}개 수집'} · {'목표 달성' if is_completed else f'{remaining_stamps}개 남음'}
+                            </div>
+                        </div>
+                        
+                        <div class="booth-stats">
+                            <h4>🏢 체험부스 참여 현황</h4>
+                            <div class="booth-stats-number">{stamp_count} / {total_booths}</div>
+                            <div style="color: #666; font-size: 14px;">개의 체험부스를 방문했습니다</div>
+                            
+                            {visited_booths_html if visited_booths else ''}
+                        </div>
+                        
+                        <div class="footer-info">
+                            17개 체험부스 중 5곳을 방문하여 스탬프를 모으고<br>
+                            기념품을 받아가세요!
+                        </div>
+                        
+                        <div class="admin-link">
+                            <a href="/admin/" class="admin-btn">⚙️ 관리자 페이지</a>
+                        </div>
+                    </div>
+                </div>
+            </body>
+            </html>
+            """
+    )
+
+
+def render_full_page():
+    """템플릿 전체 렌더링: 요청마다 공통 틀까지 렌더링"""
+    html = render_to_string('stamps/stamp_shell.html')
+    fragment = render_to_string('stamps/stamp_progress.html', {
+        'message': '체험부스 3에서 스탬프를 받았습니다!',
+        'stamp_count': 3,
+        'target_stamps': 5,
+        'remaining_stamps': 2,
+        'progress_percentage': 60.0,
+        'stamp_icons': '✅✅✅⭕⭕',
+        'total_booths': 17,
+        'visited_booths': VISITED_BOOTHS,
+    })
+    return HttpResponse(html.replace(stamp_pages.CONTENT_MARKER, fragment))
+
+
+def render_cached_page():
+    """현재 방식: 캐시된 공통 틀 + 진행 상황 조각"""
+    return stamp_pages.progress_response('체험부스 3에서 스탬프를 받았습니다!', 3, False, VISITED_BOOTHS, 17)
+
+
+def render_error_page():
+    """캐시된 오류 페이지"""
+    return stamp_pages.error_response(stamp_pages.UNKNOWN_BOOTH)
+
+
+def measure(func, iterations):
+    """(요청당 평균 시간 µs, 요청당 평균 할당 바이트)"""
+    func()  # 템플릿 로더/캐시 예열
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - started
+
+    # 호출 1회 동안의 최대 할당량(peak) 평균
+    sample = min(iterations, 500)
+    total = 0
+    tracemalloc.start()
+    for _ in range(sample):
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        func()
+        total += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    return elapsed / iterations * 1_000_000, total / sample
+
+
+def main():
+    parser = argparse.ArgumentParser(description='stamp_view HTML 렌더링 벤치마크')
+    parser.add_argument('--iterations', type=int, default=5000)
+    args = parser.parse_args()
+
+    print('📊 stamp_view HTML 렌더링 벤치마크')
+    print('=' * 60)
+    print(f"{'방식':<24}{'µs/요청':>12}{'할당 KB/요청':>16}")
+    print('-' * 60)
+    for label, func in (
+        ('f-string 전체 생성 (이전)', render_original_page),
+        ('템플릿 전체 렌더링', render_full_page),
+        ('틀 캐시 + 조각 렌더링', render_cached_page),
+        ('캐시된 오류 페이지', render_error_page),
+    ):
+        per_call, allocated = measure(func, args.iterations)
+        print(f'{label:<24}{per_call:>12.1f}{allocated / 1024:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,12 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+
+uvicorn 실행 예 (backend 디렉터리에서):
+    uvicorn qr_stamp_backend.asgi:application --host 0.0.0.0 --port 8000 --workers 4
+
+비동기 API는 /api/async/ 아래에 있습니다 (scan/, booths/,
+participants/<id>/stats/, participants/<id>/detail/).
 """
 
 import os
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 import os
+from corsheaders.defaults import default_headers
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -100,6 +101,70 @@ DATABASES = {
 }
 
 
+# Cache
+# 워커 간 공유 값(부스 레지스트리 버전 등)을 저장하므로, 다중 워커 환경에서는
+# DatabaseCache(createcachetable 필요)나 Redis 같은 공유 캐시를 지정해야 함
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'qr-stamp-cache'),
+    }
+}
+
+# 부스 레지스트리가 다른 워커의 부스 변경을 확인하는 주기 (초, 최대 반영 지연)
+BOOTH_REGISTRY_TTL = float(os.getenv('BOOTH_REGISTRY_TTL', '5'))
+
+# 활성 부스 목록(직렬화 + 참여자 수) 스냅샷 보관 시간 (초, 참여자 수 최대 반영 지연)
+BOOTH_SNAPSHOT_TTL = float(os.getenv('BOOTH_SNAPSHOT_TTL', '5'))
+
+# 부스 혼잡도 색인 (다음 방문 부스 추천용): 집계 구간, 버킷 크기, 워커별 갱신 주기 (초)
+BOOTH_LOAD_WINDOW = int(os.getenv('BOOTH_LOAD_WINDOW', '600'))
+BOOTH_LOAD_BUCKET = int(os.getenv('BOOTH_LOAD_BUCKET', '60'))
+BOOTH_LOAD_REFRESH = float(os.getenv('BOOTH_LOAD_REFRESH', '5'))
+
+# 참여자 ID 를 MySQL BINARY(16) 으로 저장 (기존 DB 는 convert_participant_ids 명령으로 변환 후 설정)
+PARTICIPANT_ID_BINARY = os.getenv('PARTICIPANT_ID_BINARY', 'False').lower() == 'true'
+
+# 부스 참여자 수 분산 카운터 슬롯 수 (인기 부스의 동시 스캔이 같은 행 잠금을 기다리지 않도록 분산)
+BOOTH_COUNTER_SHARDS = int(os.getenv('BOOTH_COUNTER_SHARDS', '16'))
+
+# 시간대별 부스 통계 롤업 슬롯 수 (같은 시간대 인기 부스의 롤업 행 UPDATE 분산)
+HOURLY_STAT_SHARDS = int(os.getenv('HOURLY_STAT_SHARDS', '4'))
+
+# 오프라인 스캔 일괄 동기화에서 인정하는 가장 오래된 스캔 시각 (현재 시각 기준, 시간)
+OFFLINE_SCAN_MAX_AGE_HOURS = int(os.getenv('OFFLINE_SCAN_MAX_AGE_HOURS', '24'))
+
+# 스탬프 기록 write-behind 적재 (스캔 즉시 응답 후 주기적으로 일괄 저장)
+STAMP_WRITE_BEHIND = os.getenv('STAMP_WRITE_BEHIND', 'False').lower() == 'true'
+STAMP_WRITE_BEHIND_INTERVAL = float(os.getenv('STAMP_WRITE_BEHIND_INTERVAL', '0.5'))  # 초
+STAMP_WRITE_BEHIND_BATCH_SIZE = int(os.getenv('STAMP_WRITE_BEHIND_BATCH_SIZE', '200'))
+STAMP_WRITE_BEHIND_JOURNAL_DIR = os.getenv(
+    'STAMP_WRITE_BEHIND_JOURNAL_DIR', os.path.join(BASE_DIR, 'stamp_journal')
+)
+
+# 부스 QR 서명 토큰 (키를 따로 두면 SECRET_KEY 교체 시에도 인쇄된 QR 유지, 비워 두면 SECRET_KEY 사용)
+BOOTH_TOKEN_KEY = os.getenv('BOOTH_TOKEN_KEY') or SECRET_KEY
+BOOTH_TOKEN_REQUIRED = os.getenv('BOOTH_TOKEN_REQUIRED', 'False').lower() == 'true'  # 서명 없는 부스 코드 거절
+
+# QR 링크 방문자의 진행 상황 서명 쿠키 유효 기간 (초, 기본 14일)
+PARTICIPANT_TOKEN_MAX_AGE = int(os.getenv('PARTICIPANT_TOKEN_MAX_AGE', 60 * 60 * 24 * 14))
+
+# Idempotency-Key 로 저장한 스캔 응답 보관 시간 (초)
+IDEMPOTENCY_TTL = int(os.getenv('IDEMPOTENCY_TTL', '3600'))
+
+# 관리자 조회 API(통계/기념품 대상자/상태 체크) 응답 캐시: 새 응답 유지 시간, 만료 후 이전 응답 보관 시간 (초)
+ADMIN_CACHE_TTL = float(os.getenv('ADMIN_CACHE_TTL', '5'))
+ADMIN_CACHE_STALE = float(os.getenv('ADMIN_CACHE_STALE', '60'))
+
+# 관리자 대시보드 실시간 이벤트(SSE): 이벤트 보관 시간, 워커별 이벤트 로그 조회 주기, 연결 유지 신호 주기 (초)
+LIVE_EVENT_TTL = int(os.getenv('LIVE_EVENT_TTL', '300'))
+LIVE_EVENT_POLL = float(os.getenv('LIVE_EVENT_POLL', '0.5'))
+LIVE_EVENT_HEARTBEAT = float(os.getenv('LIVE_EVENT_HEARTBEAT', '15'))
+
+# 데이터 내보내기(/api/admin/export/...) 한 번에 조회하는 행 수
+EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', '5000'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -163,6 +228,7 @@ REST_FRAMEWORK = {
 # CORS 설정
 CORS_ALLOWED_ORIGINS = os.getenv('CORS_ALLOWED_ORIGINS', '').split(',')
 CORS_ALLOW_ALL_ORIGINS = DEBUG  # 개발 환경에서만 모든 origin 허용
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key')  # 스캔 재시도용 멱등성 키
 
 # CSRF 설정 - 개발 및 프로덕션 환경
 CSRF_TRUSTED_ORIGINS = [
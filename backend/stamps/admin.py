@@ -1,18 +1,57 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.functional import cached_property
 from .models import Participant, Booth, StampRecord
+from .booth_registry import invalidate_booths
+
+# 이 행 수 이상인 테이블은 전체 목록의 COUNT(*) 대신 테이블 통계 추정값 사용
+ESTIMATED_COUNT_THRESHOLD = 100000
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    대용량 테이블 관리자 목록용 페이지네이터
+    - 필터/검색 없는 전체 목록은 InnoDB 테이블 통계(information_schema.TABLES.TABLE_ROWS) 추정값으로 페이지 수 계산
+    - 추정값은 실제 행 수와 다를 수 있으므로 (통계 갱신 주기) 작은 테이블, 필터 결과, MySQL 외 DB 는 정확한 COUNT(*)
+    """
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and not query.where and connection.vendor == 'mysql':
+            estimate = self._estimated_count(self.object_list.model._meta.db_table)
+            if estimate is not None and estimate >= ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+    def _estimated_count(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT TABLE_ROWS FROM information_schema.TABLES '
+                'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s',
+                [table]
+            )
+            row = cursor.fetchone()
+        return int(row[0]) if row and row[0] is not None else None
 
 
 @admin.register(Participant)
 class ParticipantAdmin(admin.ModelAdmin):
     list_display = ['id', 'get_stamp_count', 'is_completed', 'created_at', 'completed_at']
     list_filter = ['is_completed', 'created_at']
-    readonly_fields = ['id', 'created_at', 'completed_at']
+    readonly_fields = ['id', 'created_at', 'completed_at', 'stamp_count', 'visited_booths']
     search_fields = ['id']
     ordering = ['-created_at']
+    # 참여자가 수백만 명이어도 목록이 바로 열리도록 전체 행 COUNT(*) 생략
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     def get_stamp_count(self, obj):
+        # 비정규화된 stamp_count 컬럼 사용 (행별 COUNT 없음)
         return obj.get_stamp_count()
     get_stamp_count.short_description = '스탬프 개수'
+    get_stamp_count.admin_order_field = 'stamp_count'
 
 
 @admin.register(Booth)
@@ -22,9 +61,27 @@ class BoothAdmin(admin.ModelAdmin):
     search_fields = ['name', 'code']
     ordering = ['code']
     
+    def get_queryset(self, request):
+        # 목록의 참여자 수를 부스별 조회 없이 한 번에 집계
+        return super().get_queryset(request).with_participant_count()
+    
     def get_participant_count(self, obj):
         return obj.get_participant_count()
     get_participant_count.short_description = '참여자 수'
+    get_participant_count.admin_order_field = 'participant_count'
+    
+    # 부스 변경 시 워커별 부스 레지스트리 무효화
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        invalidate_booths()
+    
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        invalidate_booths()
+    
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        invalidate_booths()
 
 
 @admin.register(StampRecord)
@@ -34,3 +91,6 @@ class StampRecordAdmin(admin.ModelAdmin):
     search_fields = ['participant__id', 'booth__name']
     readonly_fields = ['stamped_at']
     ordering = ['-stamped_at']
+    list_select_related = ['participant', 'booth']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class StampsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'stamps'
+
+    def ready(self):
+        # 스탬프 삭제 시그널 등록
+        from . import signals  # noqa: F401
+        # 배포 설정 점검 등록
+        from . import checks  # noqa: F401
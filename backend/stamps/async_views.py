@@ -0,0 +1,291 @@
+"""
+비동기(ASGI) API 뷰
+- uvicorn 등 ASGI 서버에서 느린 모바일 클라이언트가 스레드를 점유하지 않도록
+  참여자/부스 조회는 Django 비동기 ORM(afirst, async for)으로 처리
+- 스캔 기록은 트랜잭션이 필요하므로 동기 스캔 서비스를 sync_to_async 로 호출
+  (Django 비동기 ORM은 트랜잭션을 지원하지 않음)
+- 응답 형식은 stamps.views 의 동기 뷰와 동일
+- 관리자 대시보드 실시간 이벤트 스트림(SSE)도 연결마다 스레드를 점유하지 않도록 비동기로 처리
+"""
+import json
+
+from asgiref.sync import sync_to_async
+from django.db.models import Sum
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+
+from .models import Participant, BoothCounterShard, TARGET_STAMPS
+from .serializers import BoothSerializer
+from .services import record_scan
+from . import ingest
+from .idempotency import idempotent
+from .booth_registry import get_booth, get_active_booths
+from .booth_tokens import resolve_booth_code, InvalidBoothToken
+from .booth_load import recommend_booths
+from .views import get_client_ip
+from .live_events import event_hub
+
+# 연결이 끊긴 대시보드의 재연결 대기 시간 (ms, SSE retry 필드)
+STREAM_RETRY_MS = 3000
+
+
+async def _participant_counts(booth_ids):
+    """부스별 참여자 수(분산 카운터 슬롯 합계)를 한 번의 GROUP BY 쿼리로 집계"""
+    rows = (
+        BoothCounterShard.objects.filter(booth_id__in=booth_ids)
+        .order_by()
+        .values('booth_id')
+        .annotate(count=Sum('count'))
+    )
+    return {row['booth_id']: row['count'] async for row in rows}
+
+
+def _not_found_participant():
+    return JsonResponse({
+        'success': False,
+        'message': '존재하지 않는 참여자입니다.'
+    }, status=404)
+
+
+async def _progress(participant_id):
+    """참여자와 방문 기록(부스 포함) 조회"""
+    participant = await Participant.objects.filter(id=participant_id).afirst()
+    if participant is None:
+        return None, []
+    visited_records = [
+        record async for record in
+        participant.stamp_records.select_related('booth').order_by('-stamped_at')
+    ]
+    return participant, visited_records
+
+
+@csrf_exempt
+@idempotent('scan')
+@require_POST
+async def scan_qr(request):
+    """
+    QR 스캔 통합 API (비동기)
+    참여자가 존재하지 않으면 생성하고, 스탬프 기록 생성
+    """
+    try:
+        data = json.loads(request.body or b'{}')
+    except ValueError:
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    participant_id = data.get('participant_id')
+    booth_code = data.get('booth_code')
+    booth_token = data.get('booth_token')
+
+    if not booth_code and not booth_token:
+        return JsonResponse({
+            'success': False,
+            'message': '부스 코드가 필요합니다.'
+        }, status=400)
+
+    # 서명 토큰 검증 (DB 조회 없이 위조 QR 거절)
+    try:
+        booth_code = resolve_booth_code(booth_code, booth_token)
+    except InvalidBoothToken as e:
+        return JsonResponse({
+            'success': False,
+            'message': str(e)
+        }, status=403)
+
+    booth = await sync_to_async(get_booth)(booth_code)
+    if booth is None:
+        return JsonResponse({
+            'success': False,
+            'message': '존재하지 않거나 비활성화된 부스입니다.'
+        }, status=404)
+
+    record = ingest.get_ingestor().submit if ingest.is_enabled() else record_scan
+    result = await sync_to_async(record)(
+        booth,
+        participant_id=participant_id,
+        ip_address=get_client_ip(request),
+        user_agent=request.META.get('HTTP_USER_AGENT', '')
+    )
+    participant = result.participant
+
+    if not result.created:
+        return JsonResponse({
+            'success': False,
+            'message': '이미 이 부스에서 스탬프를 받았습니다.',
+            'data': {
+                'participant_id': participant.id,
+                'booth_name': booth.name,
+                'stamp_count': result.stamp_count,
+                'is_completed': participant.is_completed
+            }
+        }, status=400)
+
+    message = f'{booth.name}에서 스탬프를 받았습니다!'
+    if result.is_new_participant:
+        message = f'새로운 참여자로 등록되었습니다. {message}'
+
+    return JsonResponse({
+        'success': True,
+        'message': message,
+        'data': {
+            'participant_id': participant.id,
+            'booth_name': booth.name,
+            'stamp_count': result.stamp_count,
+            'is_completed': participant.is_completed,
+            'completed_at': participant.completed_at,
+            'is_new_participant': result.is_new_participant
+        }
+    }, status=201)
+
+
+@require_GET
+async def get_participant_stats(request, participant_id):
+    """
+    참여자 진행 상황 통계 (비동기)
+    """
+    participant, visited_records = await _progress(participant_id)
+    if participant is None:
+        return _not_found_participant()
+
+    stamp_count = participant.stamp_count
+    progress_percentage = min((stamp_count / TARGET_STAMPS) * 100, 100)
+    remaining_stamps = max(TARGET_STAMPS - stamp_count, 0)
+
+    visited_booth_ids = {record.booth_id for record in visited_records}
+    active_booths = await sync_to_async(get_active_booths)()
+    next_booths = await sync_to_async(recommend_booths)(active_booths, visited_booth_ids)
+
+    counts = await _participant_counts(
+        visited_booth_ids | {booth.id for booth in next_booths}
+    )
+    context = {'participant_counts': counts}
+
+    return JsonResponse({
+        'success': True,
+        'data': {
+            'id': participant.id,
+            'stamp_count': stamp_count,
+            'is_completed': participant.is_completed,
+            'progress_percentage': round(progress_percentage, 1),
+            'remaining_stamps': remaining_stamps,
+            'next_booths': BoothSerializer(next_booths, many=True, context=context).data,
+            'visited_booths': [
+                {
+                    'booth': BoothSerializer(record.booth, context=context).data,
+                    'stamped_at': record.stamped_at
+                }
+                for record in visited_records
+            ]
+        }
+    })
+
+
+@require_GET
+async def get_participant_detail(request, participant_id):
+    """
+    참여자 상세 정보 (비동기, 전체 부스 목록 및 방문 여부 포함)
+    """
+    participant, visited_records = await _progress(participant_id)
+    if participant is None:
+        return _not_found_participant()
+
+    stamp_count = participant.stamp_count
+    progress_percentage = min((stamp_count / TARGET_STAMPS) * 100, 100)
+    remaining_stamps = max(TARGET_STAMPS - stamp_count, 0)
+
+    active_booths = await sync_to_async(get_active_booths)()
+    stamped_at_by_booth = {record.booth_id: record.stamped_at for record in visited_records}
+    counts = await _participant_counts(
+        set(stamped_at_by_booth) | {booth.id for booth in active_booths}
+    )
+    context = {'participant_counts': counts}
+
+    booths_with_status = []
+    for booth_data in BoothSerializer(active_booths, many=True, context=context).data:
+        booth_data['visited'] = booth_data['id'] in stamped_at_by_booth
+        if booth_data['visited']:
+            booth_data['stamped_at'] = stamped_at_by_booth[booth_data['id']]
+        booths_with_status.append(booth_data)
+
+    return JsonResponse({
+        'success': True,
+        'data': {
+            'id': participant.id,
+            'stamp_count': stamp_count,
+            'is_completed': participant.is_completed,
+            'progress_percentage': round(progress_percentage, 1),
+            'remaining_stamps': remaining_stamps,
+            'visited_booths': [
+                {
+                    'booth': BoothSerializer(record.booth, context=context).data,
+                    'stamped_at': record.stamped_at
+                }
+                for record in visited_records
+            ],
+            'all_booths': booths_with_status
+        }
+    })
+
+
+@require_GET
+async def booth_list(request):
+    """
+    활성화된 부스 목록 조회 (비동기)
+    """
+    booths = await sync_to_async(get_active_booths)()
+    counts = await _participant_counts([booth.id for booth in booths])
+    return JsonResponse({
+        'success': True,
+        'data': BoothSerializer(booths, many=True, context={'participant_counts': counts}).data
+    })
+
+
+def _sse(event):
+    """이벤트 하나를 SSE 메시지로 변환"""
+    data = json.dumps(event, ensure_ascii=False, separators=(',', ':'))
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n"
+
+
+def _last_event_id(request):
+    value = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+@require_GET
+async def admin_stream(request):
+    """
+    관리자 대시보드 실시간 이벤트 스트림 (text/event-stream)
+    - participant: 신규 참여자 (첫 스탬프), stamp: 새 스탬프 (부스 코드 포함), completion: 완주
+    - 이벤트가 없으면 LIVE_EVENT_HEARTBEAT 초마다 주석 줄로 연결 유지
+    - WSGI 배포에서는 연결마다 워커를 점유하므로 503 (대시보드는 주기 조회로 전환)
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({
+            'success': False,
+            'message': '실시간 스트림은 ASGI(uvicorn) 배포에서만 사용할 수 있습니다.'
+        }, status=503)
+
+    after = _last_event_id(request)
+
+    async def stream():
+        subscriber, backlog = await event_hub.subscribe(after)
+        try:
+            yield f'retry: {STREAM_RETRY_MS}\n\n'
+            for event in backlog:
+                yield _sse(event)
+            while not subscriber.finished:
+                event = await subscriber.next(settings.LIVE_EVENT_HEARTBEAT)
+                yield ': ping\n\n' if event is None else _sse(event)
+        finally:
+            event_hub.unsubscribe(subscriber)
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream; charset=utf-8')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx 프록시 버퍼링 해제
+    return response
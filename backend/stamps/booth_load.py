@@ -0,0 +1,104 @@
+"""
+부스 혼잡도 색인
+- 부스별 최근 스캔 수를 슬라이딩 윈도우(BOOTH_LOAD_WINDOW 초)로 집계
+- 윈도우는 BOOTH_LOAD_BUCKET 초 단위 버킷으로 나누고, 버킷별 카운터는 공유 캐시에 보관
+  (워커 간 공유, 만료된 버킷은 캐시 타임아웃으로 자동 삭제)
+- 각 워커는 BOOTH_LOAD_REFRESH 초마다 공유 캐시에서 다시 읽어 메모리에 보관
+- "다음 방문 추천"은 방문하지 않은 부스 중 최근 스캔이 적은 부스를 고름 (DB 조회 없음)
+"""
+import heapq
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+COUNTER_KEY = 'stamps:booth_load:{}:{}'  # 버킷 번호, 부스 ID
+
+
+class BoothLoadIndex:
+    """워커 단위 부스 혼잡도 색인 (공유 캐시 버킷 카운터 기반)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loads = {}
+        self._booth_ids = frozenset()
+        self._loaded_at = None
+
+    def _bucket_range(self, now):
+        """현재 윈도우에 포함되는 버킷 번호 범위"""
+        size = settings.BOOTH_LOAD_BUCKET
+        current = int(now // size)
+        count = max(1, int(settings.BOOTH_LOAD_WINDOW // size))
+        return range(current - count + 1, current + 1)
+
+    def record(self, booth_id, at=None):
+        """부스 스캔 1건 기록 (at: 스캔 시각 timestamp, 윈도우 밖이면 무시)"""
+        now = time.time()
+        bucket = int((now if at is None else at) // settings.BOOTH_LOAD_BUCKET)
+        if bucket not in self._bucket_range(now):
+            return
+
+        key = COUNTER_KEY.format(bucket, booth_id)
+        timeout = settings.BOOTH_LOAD_WINDOW + settings.BOOTH_LOAD_BUCKET
+        if not cache.add(key, 1, timeout):
+            try:
+                cache.incr(key)
+            except ValueError:
+                # 다른 워커와의 경합으로 키가 만료된 경우
+                cache.set(key, 1, timeout)
+
+        # 현재 워커에는 바로 반영
+        with self._lock:
+            if booth_id in self._loads:
+                self._loads[booth_id] += 1
+
+    def loads(self, booth_ids):
+        """부스 ID별 최근 스캔 수"""
+        booth_ids = frozenset(booth_ids)
+        now = time.monotonic()
+        if (
+            self._loaded_at is not None
+            and now - self._loaded_at < settings.BOOTH_LOAD_REFRESH
+            and booth_ids <= self._booth_ids
+        ):
+            return self._loads
+
+        keys = {
+            COUNTER_KEY.format(bucket, booth_id): booth_id
+            for bucket in self._bucket_range(time.time())
+            for booth_id in booth_ids
+        }
+        loads = dict.fromkeys(booth_ids, 0)
+        for key, value in cache.get_many(list(keys)).items():
+            loads[keys[key]] += value
+        with self._lock:
+            self._loads = loads
+            self._booth_ids = booth_ids
+            self._loaded_at = now
+        return loads
+
+    def least_loaded(self, booths, limit, exclude_ids=()):
+        """exclude_ids 를 제외한 부스 중 최근 스캔이 가장 적은 limit 개 (같으면 코드 순)"""
+        loads = self.loads(booth.id for booth in booths)
+        candidates = (booth for booth in booths if booth.id not in exclude_ids)
+        return heapq.nsmallest(limit, candidates, key=lambda booth: (loads.get(booth.id, 0), booth.code))
+
+    def reset(self):
+        """현재 워커의 메모리 색인 초기화 (다음 조회 시 공유 캐시에서 다시 읽음)"""
+        with self._lock:
+            self._loads = {}
+            self._booth_ids = frozenset()
+            self._loaded_at = None
+
+
+booth_load = BoothLoadIndex()
+
+
+def record_booth_scan(booth_id, at=None):
+    booth_load.record(booth_id, at=at)
+
+
+def recommend_booths(booths, visited_booth_ids, limit=3):
+    """방문하지 않은 부스 중 덜 붐비는 부스 추천"""
+    return booth_load.least_loaded(booths, limit, exclude_ids=visited_booth_ids)
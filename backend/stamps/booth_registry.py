@@ -0,0 +1,122 @@
+"""
+부스 레지스트리
+- 워커 프로세스 메모리에 부스 목록을 코드/ID 기준으로 보관하는 읽기 전용 캐시
+- 부스 변경 시 공유 캐시의 버전 값을 갱신하고, 각 워커는 BOOTH_REGISTRY_TTL 초마다
+  버전을 확인하여 달라졌으면 다시 적재 (최대 반영 지연 = BOOTH_REGISTRY_TTL)
+- 레지스트리가 돌려주는 Booth 인스턴스는 워커 내에서 공유되므로 수정하지 말 것
+"""
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Booth
+
+VERSION_CACHE_KEY = 'stamps:booth_registry:version'
+
+
+class BoothRegistry:
+    """워커 단위 부스 캐시 (버전 스탬프 기반 무효화)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_code = {}
+        self._by_id = {}
+        self._active = []
+        self._version = None
+        self._checked_at = None
+
+    def _shared_version(self):
+        """공유 캐시의 현재 버전 (없으면 새로 발급)"""
+        version = cache.get(VERSION_CACHE_KEY)
+        if version is None:
+            cache.add(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+            version = cache.get(VERSION_CACHE_KEY)
+        return version
+
+    def _ensure_fresh(self):
+        now = time.monotonic()
+        ttl = getattr(settings, 'BOOTH_REGISTRY_TTL', 5)
+        if self._checked_at is not None and now - self._checked_at < ttl:
+            return
+
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < ttl:
+                return
+            version = self._shared_version()
+            if version != self._version or self._checked_at is None:
+                self._load(version)
+            self._checked_at = now
+
+    def _load(self, version):
+        booths = list(Booth.objects.all().order_by('code'))
+        self._by_code = {booth.code: booth for booth in booths}
+        self._by_id = {booth.id: booth for booth in booths}
+        self._active = [booth for booth in booths if booth.is_active]
+        self._version = version
+
+    def get_by_code(self, code, active_only=True):
+        """부스 코드로 조회 (없거나 비활성화면 None, 문자열이 아닌 요청 값도 None)"""
+        if not isinstance(code, str):
+            return None
+        self._ensure_fresh()
+        booth = self._by_code.get(code)
+        if booth is None or (active_only and not booth.is_active):
+            return None
+        return booth
+
+    def get_by_id(self, booth_id, active_only=True):
+        """부스 ID로 조회 (없거나 비활성화면 None)"""
+        self._ensure_fresh()
+        booth = self._by_id.get(booth_id)
+        if booth is None or (active_only and not booth.is_active):
+            return None
+        return booth
+
+    def active_booths(self):
+        """활성화된 부스 목록 (코드 순)"""
+        self._ensure_fresh()
+        return list(self._active)
+
+    def version(self):
+        """현재 적재된 부스 목록의 버전 (부스 기반 캐시 키에 사용)"""
+        self._ensure_fresh()
+        return self._version
+
+    def invalidate(self):
+        """모든 워커의 레지스트리 무효화 (버전 갱신)"""
+        cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+        # 현재 워커는 다음 조회 시 바로 다시 적재
+        self._checked_at = None
+
+
+booth_registry = BoothRegistry()
+
+
+def get_booth(code, active_only=True):
+    return booth_registry.get_by_code(code, active_only=active_only)
+
+
+def visit_bit_for(booth_id):
+    """부스 ID의 방문 비트맵 비트 (비활성 부스 포함, 없는 부스나 슬롯 없는 부스는 0)"""
+    booth = booth_registry.get_by_id(booth_id, active_only=False)
+    if booth is None:
+        # 다른 워커에서 방금 추가되어 레지스트리에 아직 없는 부스
+        booth = Booth.objects.filter(pk=booth_id).only('id', 'visit_slot').first()
+    return booth.visit_bit if booth is not None else 0
+
+
+def get_booth_by_id(booth_id, active_only=True):
+    return booth_registry.get_by_id(booth_id, active_only=active_only)
+
+
+def get_active_booths():
+    return booth_registry.active_booths()
+
+
+def invalidate_booths():
+    """부스 변경 커밋 후 레지스트리 무효화 예약"""
+    transaction.on_commit(booth_registry.invalidate)
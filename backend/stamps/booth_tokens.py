@@ -0,0 +1,76 @@
+"""
+부스 QR 서명 토큰
+- QR URL(/stamp?booth=<code>&t=<token>)에 부스 코드와 선택적 사용 기간을 HMAC 서명한 토큰을 포함
+- 서버는 django.core.signing 으로 CPU 연산만 사용해 검증 (DB 조회 없음)
+- 위조/만료 토큰은 ORM 작업 전에 거절
+- BOOTH_TOKEN_REQUIRED=True 이면 서명 없는 부스 코드 요청도 거절
+"""
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core import signing
+from django.utils import timezone
+
+SALT = 'stamps.booth-token'
+
+
+class InvalidBoothToken(Exception):
+    """검증에 실패한 부스 토큰"""
+
+
+def _key():
+    return getattr(settings, 'BOOTH_TOKEN_KEY', None) or settings.SECRET_KEY
+
+
+def make_booth_token(booth_code, valid_from=None, valid_until=None):
+    """부스 코드(와 사용 기간)를 서명한 토큰 생성"""
+    payload = {'b': booth_code}
+    if valid_from is not None:
+        payload['nbf'] = int(valid_from.timestamp())
+    if valid_until is not None:
+        payload['exp'] = int(valid_until.timestamp())
+    return signing.dumps(payload, key=_key(), salt=SALT, compress=True)
+
+
+def verify_booth_token(token, booth_code=None, now=None):
+    """토큰을 검증하고 서명된 부스 코드 반환 (실패 시 InvalidBoothToken)"""
+    if not isinstance(token, str):
+        raise InvalidBoothToken('서명이 올바르지 않은 QR 코드입니다.')
+    try:
+        payload = signing.loads(token, key=_key(), salt=SALT)
+    except signing.BadSignature:
+        raise InvalidBoothToken('서명이 올바르지 않은 QR 코드입니다.')
+
+    signed_code = payload.get('b') if isinstance(payload, dict) else None
+    if not signed_code:
+        raise InvalidBoothToken('서명이 올바르지 않은 QR 코드입니다.')
+    if booth_code and booth_code != signed_code:
+        raise InvalidBoothToken('QR 코드의 부스 정보가 일치하지 않습니다.')
+
+    timestamp = (now or timezone.now()).timestamp()
+    if 'nbf' in payload and timestamp < payload['nbf']:
+        raise InvalidBoothToken('아직 사용할 수 없는 QR 코드입니다.')
+    if 'exp' in payload and timestamp >= payload['exp']:
+        raise InvalidBoothToken('사용 기간이 지난 QR 코드입니다.')
+    return signed_code
+
+
+def resolve_booth_code(booth_code, token):
+    """
+    요청의 부스 코드/토큰 확인 후 사용할 부스 코드 반환
+    토큰이 있으면 검증, 없으면 BOOTH_TOKEN_REQUIRED 설정에 따라 거절
+    """
+    if token:
+        return verify_booth_token(token, booth_code)
+    if getattr(settings, 'BOOTH_TOKEN_REQUIRED', False):
+        raise InvalidBoothToken('서명된 QR 코드가 필요합니다.')
+    return booth_code
+
+
+def build_stamp_url(base_url, booth_code, valid_from=None, valid_until=None):
+    """QR 코드에 넣을 서명된 스탬프 URL"""
+    query = urlencode({
+        'booth': booth_code,
+        't': make_booth_token(booth_code, valid_from, valid_until),
+    })
+    return f"{base_url.rstrip('/')}/stamp?{query}"
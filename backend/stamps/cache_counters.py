@@ -0,0 +1,29 @@
+"""
+공유 캐시 누적 카운터
+- 여러 워커가 함께 증가시키는 만료 없는 카운터 (system_health_check 에서 확인)
+- 증가는 cache.incr 로 처리하므로 원자적 incr 를 지원하는 캐시 백엔드(Redis, Memcached)가 필요
+"""
+from django.core.cache import cache
+
+
+class CacheCounters:
+    """key_format 의 {} 자리에 카운터 이름을 넣은 키로 보관하는 카운터 묶음"""
+
+    def __init__(self, key_format, names):
+        self.key_format = key_format
+        self.names = tuple(names)
+
+    def incr(self, name, amount=1):
+        key = self.key_format.format(name)
+        cache.add(key, 0, None)
+        try:
+            cache.incr(key, amount)
+        except ValueError:
+            # 다른 워커와의 경합으로 키가 사라진 경우
+            cache.set(key, amount, None)
+
+    def values(self):
+        """{카운터 이름: 값} (아직 증가하지 않은 카운터는 0)"""
+        keys = {name: self.key_format.format(name) for name in self.names}
+        stored = cache.get_many(keys.values())
+        return {name: stored.get(key, 0) for name, key in keys.items()}
@@ -0,0 +1,25 @@
+"""
+배포 설정 점검 (python manage.py check --deploy)
+"""
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# cache.incr 가 읽기 후 쓰기로 처리되어 동시 증가가 유실되는 캐시 백엔드
+NON_ATOMIC_CACHE_BACKENDS = (
+    'django.core.cache.backends.db.DatabaseCache',
+    'django.core.cache.backends.filebased.FileBasedCache',
+)
+
+
+@register(Tags.caches, deploy=True)
+def check_atomic_cache(app_configs, **kwargs):
+    """부스 혼잡도, 응답 캐시/멱등성 카운터는 원자적 incr 를 지원하는 공유 캐시 필요"""
+    backend = settings.CACHES['default']['BACKEND']
+    if backend not in NON_ATOMIC_CACHE_BACKENDS:
+        return []
+    return [Warning(
+        f'{backend} 는 cache.incr 가 원자적이지 않고, 스캔마다 캐시 조회가 DB 쿼리가 됩니다.',
+        hint='CACHE_BACKEND 를 Redis(django.core.cache.backends.redis.RedisCache) 또는 '
+             'Memcached(django.core.cache.backends.memcached.PyMemcacheCache)로 지정하세요.',
+        id='stamps.W001',
+    )]
@@ -0,0 +1,142 @@
+"""
+스탬프 기록 / 참여자 전체 내보내기 (GET /api/admin/export/<stamps|participants>.<ndjson|csv>)
+- 기본 키 순서로 EXPORT_CHUNK_SIZE 행씩 나눠 조회(키셋)하여 테이블 크기와 무관하게 메모리 사용량 일정
+  (mysqlclient 는 QuerySet.iterator() 결과도 클라이언트에 전부 받아 두므로 청크 단위 쿼리 사용)
+- values_list 로 모델 인스턴스를 만들지 않고 행을 바로 직렬화, 청크 단위로 전송
+- gzip 사용 시 압축하면서 전송 (.gz 파일로 다운로드)
+"""
+import csv
+import zlib
+from datetime import datetime, time
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import Participant, StampRecord
+
+FORMAT_NDJSON = 'ndjson'
+FORMAT_CSV = 'csv'
+
+CONTENT_TYPES = {
+    FORMAT_NDJSON: 'application/x-ndjson; charset=utf-8',
+    FORMAT_CSV: 'text/csv; charset=utf-8',
+}
+
+# 내보내기 대상: (모델, since 기준 필드, [(열 이름, values_list 조회 경로)])
+TABLES = {
+    'stamps': (StampRecord, 'stamped_at', [
+        ('id', 'id'),
+        ('participant_id', 'participant_id'),
+        ('booth_id', 'booth_id'),
+        ('booth_code', 'booth__code'),
+        ('stamped_at', 'stamped_at'),
+        ('ip_address', 'ip_address'),
+        ('user_agent', 'user_agent'),
+    ]),
+    'participants': (Participant, 'created_at', [
+        ('id', 'id'),
+        ('created_at', 'created_at'),
+        ('is_completed', 'is_completed'),
+        ('completed_at', 'completed_at'),
+        ('stamp_count', 'stamp_count'),
+    ]),
+}
+
+
+class InvalidSince(ValueError):
+    """형식이 올바르지 않은 since 값"""
+
+
+def parse_since(value):
+    """since 값 (ISO 시각 또는 날짜, TIME_ZONE 기준) → 시각"""
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        date = parse_date(value)
+        if date is None:
+            raise InvalidSince(value)
+        parsed = datetime.combine(date, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def iter_rows(table, since=None, chunk_size=None):
+    """기본 키 순서로 행 목록을 청크 단위로 반환 (청크마다 쿼리 1개)"""
+    model, since_field, columns = TABLES[table]
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    queryset = model.objects.order_by('pk')
+    if since is not None:
+        queryset = queryset.filter(**{f'{since_field}__gte': since})
+    queryset = queryset.values_list(*(lookup for _, lookup in columns))
+
+    last_pk = None
+    while True:
+        page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        rows = list(page[:chunk_size])
+        if not rows:
+            return
+        yield rows
+        if len(rows) < chunk_size:
+            return
+        # 첫 번째 열은 기본 키
+        last_pk = rows[-1][0]
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class _Lines:
+    """csv.writer 가 쓴 줄을 모아 두는 버퍼"""
+
+    def __init__(self):
+        self.lines = []
+
+    def write(self, value):
+        self.lines.append(value)
+
+
+def _encode_ndjson(headers, chunks):
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for rows in chunks:
+        yield ''.join(
+            encoder.encode(dict(zip(headers, row))) + '\n' for row in rows
+        ).encode('utf-8')
+
+
+def _encode_csv(headers, chunks):
+    buffer = _Lines()
+    writer = csv.writer(buffer)
+    # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+    writer.writerow(headers)
+    yield ('\ufeff' + ''.join(buffer.lines)).encode('utf-8')
+    for rows in chunks:
+        buffer.lines = []
+        writer.writerows([_csv_value(value) for value in row] for row in rows)
+        yield ''.join(buffer.lines).encode('utf-8')
+
+
+def _gzip(blocks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for block in blocks:
+        compressed = compressor.compress(block)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_stream(table, export_format, since=None, compress=False, chunk_size=None):
+    """내보내기 본문 (bytes 블록 생성기)"""
+    headers = [name for name, _ in TABLES[table][2]]
+    chunks = iter_rows(table, since, chunk_size)
+    encode = _encode_ndjson if export_format == FORMAT_NDJSON else _encode_csv
+    blocks = encode(headers, chunks)
+    return _gzip(blocks) if compress else blocks
@@ -0,0 +1,129 @@
+"""
+멱등성 키(Idempotency-Key) 처리
+- 클라이언트가 같은 키로 요청을 재시도하면 첫 응답을 그대로(바이트 단위) 재전송
+- 첫 요청이 처리 중일 때 들어온 재시도는 409 로 응답하여 중복 처리를 방지
+- 응답은 공유 캐시에 (상태 코드, Content-Type, 본문) 형태로 IDEMPOTENCY_TTL 초 동안 보관
+"""
+import hashlib
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+
+from .cache_counters import CacheCounters
+
+HEADER = 'HTTP_IDEMPOTENCY_KEY'
+MAX_KEY_LENGTH = 255
+# 처리 중 표시(잠금) 유지 시간 (초) - 요청 처리 시간보다 충분히 길게
+LOCK_TIMEOUT = 30
+
+COUNTER_NAMES = ('stored', 'replayed', 'conflicts')
+COUNTER_KEY = 'stamps:idempotency:counter:{}'
+counters = CacheCounters(COUNTER_KEY, COUNTER_NAMES)
+
+
+def get_counters():
+    """멱등성 처리 카운터 (저장/재전송/충돌 횟수)"""
+    return counters.values()
+
+
+def _begin(request, scope):
+    """
+    요청 처리 전 확인
+    반환값: (바로 돌려줄 응답 또는 None, 응답 저장 키, 잠금 키)
+    """
+    key = request.META.get(HEADER)
+    if not key:
+        return None, None, None
+    if len(key) > MAX_KEY_LENGTH:
+        return JsonResponse({
+            'success': False,
+            'message': 'Idempotency-Key 가 너무 깁니다.'
+        }, status=400), None, None
+
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+    response_key = f'stamps:idempotency:{scope}:{digest}'
+    lock_key = f'{response_key}:lock'
+
+    stored = cache.get(response_key)
+    if stored is None and not cache.add(lock_key, 1, LOCK_TIMEOUT):
+        # 같은 키의 첫 요청이 아직 처리 중
+        stored = cache.get(response_key)
+        if stored is None:
+            counters.incr('conflicts')
+            return JsonResponse({
+                'success': False,
+                'message': '같은 요청을 처리하고 있습니다. 잠시 후 다시 시도해주세요.'
+            }, status=409), None, None
+    if stored is not None:
+        counters.incr('replayed')
+        return _replay(stored), None, None
+    return None, response_key, lock_key
+
+
+def _finish(response, response_key, lock_key):
+    """첫 응답 저장 및 잠금 해제"""
+    try:
+        if response is not None:
+            if hasattr(response, 'render') and not getattr(response, 'is_rendered', True):
+                response.render()
+            # 서버 오류는 재시도 시 다시 처리되도록 저장하지 않음
+            if response.status_code < 500:
+                cache.set(response_key, (
+                    response.status_code,
+                    response.get('Content-Type'),
+                    bytes(response.content),
+                ), settings.IDEMPOTENCY_TTL)
+                counters.incr('stored')
+    finally:
+        cache.delete(lock_key)
+    return response
+
+
+def idempotent(scope):
+    """
+    Idempotency-Key 헤더가 있는 요청의 첫 응답을 저장하고 재시도 시 재전송하는 데코레이터
+    - 동기/비동기 뷰 모두 지원
+    - DRF api_view 바깥에 적용해야 렌더링된 응답 본문을 저장할 수 있음
+    """
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                early, response_key, lock_key = await sync_to_async(_begin)(request, scope)
+                if early is not None:
+                    return early
+                if response_key is None:
+                    return await view_func(request, *args, **kwargs)
+                response = None
+                try:
+                    response = await view_func(request, *args, **kwargs)
+                finally:
+                    await sync_to_async(_finish)(response, response_key, lock_key)
+                return response
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            early, response_key, lock_key = _begin(request, scope)
+            if early is not None:
+                return early
+            if response_key is None:
+                return view_func(request, *args, **kwargs)
+            response = None
+            try:
+                response = view_func(request, *args, **kwargs)
+            finally:
+                _finish(response, response_key, lock_key)
+            return response
+        return wrapper
+    return decorator
+
+
+def _replay(stored):
+    status_code, content_type, content = stored
+    response = HttpResponse(content, status=status_code, content_type=content_type)
+    response['Idempotent-Replayed'] = 'true'
+    return response
@@ -0,0 +1,455 @@
+"""
+스탬프 기록 write-behind 적재 (선택 기능, STAMP_WRITE_BEHIND=True 일 때 사용)
+- 스캔은 메모리에 캐시된 참여자 진행 현황으로 검증 후 즉시 응답
+- 수락된 스탬프는 버퍼에 모았다가 일정 주기 또는 배치가 차면 bulk_create 로 일괄 저장
+- 수락 즉시 저널 파일(JSON Lines)에 기록하여, 저장 전에 프로세스가 종료되어도 재적재 가능
+  (fsync 는 스캔마다 하지 않고 flush 스레드가 주기마다 한 번에 수행하는 group commit)
+- 참여자/부스 중복 방지: 워커 내 방문 비트맵 + 공유 캐시 선점 키 + DB unique 제약
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Participant, StampRecord, BoothCounterShard, TARGET_STAMPS
+from .services import ScanResult, _parse_participant_id, sync_participant_progress, on_stamps_saved
+from .booth_load import record_booth_scan
+from .participant_ids import uuid7
+
+logger = logging.getLogger(__name__)
+
+# 다른 워커와의 중복 수락을 막는 선점 키 유지 시간 (초)
+CLAIM_TIMEOUT = 300
+# 워커 메모리에 보관한 참여자 진행 현황의 최대 유지 시간 (초, CLAIM_TIMEOUT 보다 짧아야 함)
+PARTICIPANT_STATE_TTL = 60
+PARTICIPANT_STATE_MAX = 10000
+# 워커가 발급했지만 아직 저장되지 않은 참여자 ID (다른 워커가 이어서 받을 수 있도록 공유 캐시에 표시)
+MINTED_KEY = 'stamps:ingest:minted:{}'
+# 재적재를 위해 선점한 저널 세그먼트 이름 표시 (stamps-<선점한 PID>-replay-<임의값>.jsonl)
+CLAIMED_MARK = 'replay'
+
+
+class StampIngestor:
+    """스탬프 기록 group-commit 적재기"""
+
+    def __init__(self, batch_size=200, interval=0.5, journal_dir=None, autostart=True):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.journal_dir = journal_dir
+        self.autostart = autostart
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._stopped = False
+        self._exit_hook_registered = False
+
+        self._pending = []
+        self._new_participants = set()
+        self._oldest_accepted = None
+        self._participants = OrderedDict()
+
+        self._journal = None
+        self._journal_path = None
+        self._segments = []
+        self._segment_seq = 0
+
+        self._stats = {
+            'accepted': 0,
+            'duplicates': 0,
+            'flushes': 0,
+            'rows_flushed': 0,
+            'failed_flushes': 0,
+            'last_batch_size': 0,
+            'max_batch_size': 0,
+            'last_flush_lag_ms': 0.0,
+            'max_flush_lag_ms': 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # 스캔 수락
+    # ------------------------------------------------------------------
+    def submit(self, booth, participant_id=None, ip_address=None, user_agent=''):
+        """스캔 한 건을 검증하고 버퍼에 추가 (DB 쓰기 없이 즉시 결과 반환)"""
+        if self.autostart:
+            self.start()
+
+        parsed_id = _parse_participant_id(participant_id)
+        participant = self._get_participant(parsed_id) if parsed_id else None
+        # DB 에 없는 ID 는 다른 워커가 발급하고 아직 저장하지 않은 경우에만 유지 (클라이언트가 ID 를 정할 수 없음)
+        pending_id = parsed_id if participant is None and parsed_id and cache.get(MINTED_KEY.format(parsed_id)) else None
+
+        with self._lock:
+            is_new_participant = participant is None
+            if is_new_participant:
+                participant = Participant(id=pending_id or uuid7())
+                self._new_participants.add(participant.id)
+                self._remember(participant)
+                if pending_id is None:
+                    cache.set(MINTED_KEY.format(participant.id), 1, CLAIM_TIMEOUT)
+
+            claim_key = f'stamps:ingest:claim:{participant.id}:{booth.id}'
+            if participant.has_visited(booth) or not cache.add(claim_key, 1, CLAIM_TIMEOUT):
+                self._stats['duplicates'] += 1
+                return ScanResult(
+                    participant=participant,
+                    booth=booth,
+                    created=False,
+                    is_new_participant=is_new_participant,
+                    stamp_count=participant.stamp_count,
+                )
+
+            now = timezone.now()
+            participant.stamp_count += 1
+            participant.visited_booths |= booth.visit_bit
+            completed_mission = participant.stamp_count >= TARGET_STAMPS and not participant.is_completed
+            if completed_mission:
+                participant.is_completed = True
+                participant.completed_at = now
+
+            item = {
+                'participant_id': str(participant.id),
+                'booth_id': booth.id,
+                'stamped_at': now.isoformat(),
+                'ip_address': ip_address,
+                'user_agent': user_agent or '',
+                'new_participant': is_new_participant,
+            }
+            self._write_journal(item)
+            if not self._pending:
+                self._oldest_accepted = time.monotonic()
+            self._pending.append(item)
+            self._stats['accepted'] += 1
+            batch_full = len(self._pending) >= self.batch_size
+
+        if batch_full:
+            self._wakeup.set()
+        record_booth_scan(booth.id)
+
+        return ScanResult(
+            participant=participant,
+            booth=booth,
+            created=True,
+            is_new_participant=is_new_participant,
+            stamp_count=participant.stamp_count,
+            completed_mission=completed_mission,
+        )
+
+    def _get_participant(self, participant_id):
+        """워커 메모리의 참여자 진행 현황 (없거나 오래되면 DB에서 1회 조회)"""
+        with self._lock:
+            entry = self._participants.get(participant_id)
+            if entry and time.monotonic() - entry[0] < PARTICIPANT_STATE_TTL:
+                self._participants.move_to_end(participant_id)
+                return entry[1]
+            if entry and participant_id in self._new_participants:
+                return entry[1]
+
+        participant = (
+            Participant.objects.filter(id=participant_id)
+            .only('id', 'stamp_count', 'visited_booths', 'is_completed', 'completed_at')
+            .first()
+        )
+        if participant is not None:
+            with self._lock:
+                self._remember(participant)
+        return participant
+
+    def _remember(self, participant):
+        self._participants[participant.id] = (time.monotonic(), participant)
+        self._participants.move_to_end(participant.id)
+        while len(self._participants) > PARTICIPANT_STATE_MAX:
+            self._participants.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # 저널
+    # ------------------------------------------------------------------
+    def _open_segment(self):
+        if not self.journal_dir:
+            return
+        os.makedirs(self.journal_dir, exist_ok=True)
+        self._segment_seq += 1
+        self._journal_path = os.path.join(
+            self.journal_dir, f'stamps-{os.getpid()}-{self._segment_seq:06d}.jsonl'
+        )
+        self._journal = open(self._journal_path, 'a', encoding='utf-8')
+
+    def _write_journal(self, item):
+        if not self.journal_dir:
+            return
+        if self._journal is None:
+            self._open_segment()
+        # 운영체제 버퍼까지만 기록 (프로세스 종료에는 안전, 디스크 동기화는 flush 스레드에서)
+        self._journal.write(json.dumps(item, ensure_ascii=False) + '\n')
+        self._journal.flush()
+
+    def _rotate_journal(self):
+        """현재 저널 세그먼트를 떼어 내고 다음 쓰기는 새 세그먼트로 (떼어 낸 파일 객체 반환)"""
+        journal = self._journal
+        if journal is not None:
+            self._segments.append(self._journal_path)
+            self._journal = None
+            self._journal_path = None
+        return journal
+
+    # ------------------------------------------------------------------
+    # 일괄 저장
+    # ------------------------------------------------------------------
+    def flush(self):
+        """버퍼의 스탬프를 한 번의 트랜잭션으로 저장"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                new_participants, self._new_participants = self._new_participants, set()
+                oldest_accepted, self._oldest_accepted = self._oldest_accepted, None
+                journal = self._rotate_journal()
+                segments = list(self._segments)
+
+            if journal is not None:
+                # 주기 동안 쌓인 스캔을 fsync 한 번으로 디스크에 반영 (스캔 잠금 밖에서 수행)
+                os.fsync(journal.fileno())
+                journal.close()
+
+            if batch:
+                try:
+                    write_batch(batch)
+                except Exception:
+                    # 다음 주기에 다시 시도 (저널 세그먼트는 보존)
+                    with self._lock:
+                        self._pending = batch + self._pending
+                        self._new_participants |= new_participants
+                        self._oldest_accepted = oldest_accepted
+                        self._stats['failed_flushes'] += 1
+                    raise
+
+            for path in segments:
+                if os.path.exists(path):
+                    os.remove(path)
+
+            with self._lock:
+                self._segments = [path for path in self._segments if path not in segments]
+                if batch:
+                    lag_ms = round((time.monotonic() - oldest_accepted) * 1000, 2)
+                    self._stats['flushes'] += 1
+                    self._stats['rows_flushed'] += len(batch)
+                    self._stats['last_batch_size'] = len(batch)
+                    self._stats['max_batch_size'] = max(self._stats['max_batch_size'], len(batch))
+                    self._stats['last_flush_lag_ms'] = lag_ms
+                    self._stats['max_flush_lag_ms'] = max(self._stats['max_flush_lag_ms'], lag_ms)
+            return len(batch)
+
+    def stats(self):
+        """flush 지연 시간과 배치 크기 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['pending'] = len(self._pending)
+        stats['avg_batch_size'] = (
+            round(stats['rows_flushed'] / stats['flushes'], 1) if stats['flushes'] else 0
+        )
+        return stats
+
+    # ------------------------------------------------------------------
+    # 백그라운드 스레드
+    # ------------------------------------------------------------------
+    def start(self):
+        """워커 프로세스에서 처음 사용할 때 flush 스레드 시작 (fork 이후 시작되도록 지연)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name='stamp-ingestor', daemon=True
+            )
+            self._thread.start()
+            if not self._exit_hook_registered:
+                atexit.register(self.stop)
+                self._exit_hook_registered = True
+
+    def stop(self):
+        self._stopped = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 4)
+        self.flush()
+
+    def _run(self):
+        from django.db import close_old_connections
+
+        # 종료된 워커의 저널은 요청 처리 경로가 아닌 flush 스레드 시작 시 재적재
+        try:
+            replay_orphaned_segments(self.journal_dir)
+        except Exception:
+            logger.exception('저널 재적재 실패 (replay_stamp_journal 명령으로 재시도 가능)')
+        finally:
+            close_old_connections()
+
+        while not self._stopped:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('스탬프 일괄 저장 실패 (다음 주기에 재시도)')
+            finally:
+                close_old_connections()
+
+
+def write_batch(items):
+    """
+    저널/버퍼 항목을 DB에 일괄 저장 (재실행해도 결과가 같음)
+    - 이미 저장된 (참여자, 부스) 조합은 부스 카운터/롤업/실시간 이벤트에서 제외
+    - 저장 후 다시 읽어 획득 시간이 같은 행만 이번에 저장된 것으로 봄
+      (조회와 저장 사이에 다른 요청이 먼저 저장해 무시된 행은 제외)
+    """
+    new_participant_ids = {
+        uuid.UUID(item['participant_id']) for item in items if item.get('new_participant')
+    }
+    records = [
+        StampRecord(
+            participant_id=uuid.UUID(item['participant_id']),
+            booth_id=item['booth_id'],
+            stamped_at=datetime.fromisoformat(item['stamped_at']),
+            ip_address=item.get('ip_address'),
+            user_agent=item.get('user_agent', ''),
+        )
+        for item in items
+    ]
+
+    with transaction.atomic():
+        previous_counts = {}
+        existing = set()
+        stored_rows = (
+            StampRecord.objects.filter(participant_id__in={record.participant_id for record in records})
+            .order_by()
+            .values_list('participant_id', 'booth_id')
+        )
+        for participant_id, booth_id in stored_rows:
+            previous_counts[participant_id] = previous_counts.get(participant_id, 0) + 1
+            existing.add((participant_id, booth_id))
+
+        if new_participant_ids:
+            Participant.objects.bulk_create(
+                [Participant(id=participant_id) for participant_id in new_participant_ids],
+                ignore_conflicts=True,
+            )
+        # 다른 워커와 겹친 중복은 unique 제약으로 무시
+        StampRecord.objects.bulk_create(records, ignore_conflicts=True)
+        sync_participant_progress(record.participant_id for record in records)
+
+        stored = {
+            (participant_id, booth_id): stamped_at
+            for participant_id, booth_id, stamped_at in (
+                StampRecord.objects.filter(participant_id__in={record.participant_id for record in records})
+                .order_by()
+                .values_list('participant_id', 'booth_id', 'stamped_at')
+            )
+        }
+        inserted = []
+        for record in records:
+            key = (record.participant_id, record.booth_id)
+            if key not in existing and stored.get(key) == record.stamped_at:
+                existing.add(key)
+                inserted.append((record.participant_id, record.booth_id, record.stamped_at))
+        booth_deltas = {}
+        for _, booth_id, _ in inserted:
+            booth_deltas[booth_id] = booth_deltas.get(booth_id, 0) + 1
+        BoothCounterShard.add_many(booth_deltas)
+        on_stamps_saved(inserted, previous_counts)
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def replay_orphaned_segments(journal_dir, include_live=False):
+    """
+    종료된 프로세스가 남긴 저널 세그먼트를 DB에 재적재하고 삭제
+    - 세그먼트는 먼저 이 프로세스 이름으로 os.rename 하여 선점 (여러 워커가 같은 세그먼트를 중복 재적재하지 않음)
+    - 선점한 프로세스가 재적재 도중 종료되면 선점된 세그먼트도 다음 재적재 대상
+    반환값: (처리한 세그먼트 수, 항목 수)
+    """
+    if not journal_dir or not os.path.isdir(journal_dir):
+        return 0, 0
+
+    replayed_segments = 0
+    replayed_items = 0
+    for name in sorted(os.listdir(journal_dir)):
+        if not (name.startswith('stamps-') and name.endswith('.jsonl')):
+            continue
+        try:
+            pid = int(name.split('-')[1])
+        except (IndexError, ValueError):
+            continue
+        claimed = name.split('-')[2:3] == [CLAIMED_MARK]
+        if pid == os.getpid():
+            # 이 프로세스가 쓰고 있는 세그먼트는 제외 (이전에 선점했다가 실패한 세그먼트는 재시도)
+            if not (include_live or claimed):
+                continue
+        elif not include_live and _pid_alive(pid):
+            continue
+
+        path = os.path.join(journal_dir, f'stamps-{os.getpid()}-{CLAIMED_MARK}-{uuid.uuid4().hex}.jsonl')
+        try:
+            os.rename(os.path.join(journal_dir, name), path)
+        except FileNotFoundError:
+            # 다른 프로세스가 먼저 선점
+            continue
+
+        items = []
+        with open(path, encoding='utf-8') as journal:
+            for line in journal:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    items.append(json.loads(line))
+                except ValueError:
+                    # 기록 도중 종료되어 잘린 마지막 줄
+                    continue
+        if items:
+            write_batch(items)
+        os.remove(path)
+        replayed_segments += 1
+        replayed_items += len(items)
+    return replayed_segments, replayed_items
+
+
+_ingestor = None
+_ingestor_lock = threading.Lock()
+
+
+def get_ingestor():
+    """설정 기반 프로세스 단위 적재기"""
+    global _ingestor
+    if _ingestor is None:
+        with _ingestor_lock:
+            if _ingestor is None:
+                _ingestor = StampIngestor(
+                    batch_size=settings.STAMP_WRITE_BEHIND_BATCH_SIZE,
+                    interval=settings.STAMP_WRITE_BEHIND_INTERVAL,
+                    journal_dir=settings.STAMP_WRITE_BEHIND_JOURNAL_DIR,
+                )
+    return _ingestor
+
+
+def is_enabled():
+    return getattr(settings, 'STAMP_WRITE_BEHIND', False)
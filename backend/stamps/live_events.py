@@ -0,0 +1,217 @@
+"""
+관리자 대시보드 실시간 이벤트 (Server-Sent Events, GET /api/admin/stream/)
+- 스탬프 저장이 커밋되면 신규 참여자 / 스탬프(부스 코드) / 완주 이벤트를
+  공유 캐시의 이벤트 로그에 기록 (순번은 DB 행(EventSequence)에서 발급, 순번별 키에 LIVE_EVENT_TTL 초 보관)
+  (DatabaseCache 의 incr 는 원자적이지 않아 워커끼리 같은 순번을 받아 이벤트를 덮어쓸 수 있음)
+- 연결된 대시보드가 없으면(공유 캐시의 구독 표시가 없으면) 스캔 경로에서 순번 발급/기록을 건너뜀
+  (대시보드를 보지 않는 동안 스캔마다 순번 행을 갱신하지 않음)
+- 워커마다 발행기(EventHub) 하나가 LIVE_EVENT_POLL 초마다 이벤트 로그를 읽어
+  연결된 모든 대시보드에 나눠 줌 (대시보드 수와 무관하게 워커당 한 번 조회)
+- 연결이 끊긴 대시보드는 Last-Event-ID 로 놓친 이벤트부터 이어받음
+"""
+import asyncio
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .booth_registry import get_booth_by_id
+from .models import EventSequence, TARGET_STAMPS
+
+logger = logging.getLogger(__name__)
+
+SEQUENCE_NAME = 'live_events'
+EVENT_KEY = 'stamps:live_events:{}'
+# 구독자가 있는 발행기가 주기적으로 갱신하는 구독 표시 (유지 시간, 갱신 간격 초)
+LISTENING_KEY = 'stamps:live_events:listening'
+LISTENING_TTL = 30
+LISTENING_REFRESH = 10
+
+EVENT_PARTICIPANT = 'participant'
+EVENT_STAMP = 'stamp'
+EVENT_COMPLETION = 'completion'
+
+# 구독자별 대기 이벤트 최대 수 (넘치면 연결을 끊고 Last-Event-ID 로 재연결하도록 함)
+SUBSCRIBER_QUEUE_SIZE = 1000
+# 한 번에 읽는 최대 이벤트 수 / 재연결 시 이어받는 최대 이벤트 수
+READ_BATCH = 500
+# 순번은 발급됐지만 아직 기록되지 않은 이벤트를 기다리는 조회 횟수
+GAP_RETRIES = 3
+
+
+def publish(events):
+    """이벤트 목록을 이벤트 로그에 기록 (반환값: 마지막 순번)"""
+    if not events:
+        return None
+    last = EventSequence.allocate(SEQUENCE_NAME, len(events))
+    first = last - len(events) + 1
+    cache.set_many(
+        {EVENT_KEY.format(seq): dict(event, id=seq) for seq, event in enumerate(events, start=first)},
+        settings.LIVE_EVENT_TTL,
+    )
+    return last
+
+
+def stamp_events(entries):
+    """
+    새로 저장된 스탬프의 이벤트 목록
+    entries: [(participant_id, booth_id, stamped_at, 참여자의 몇 번째 스탬프인지)]
+    """
+    events = []
+    for participant_id, booth_id, stamped_at, nth in entries:
+        booth = get_booth_by_id(booth_id, active_only=False)
+        stamped_at = timezone.localtime(stamped_at)
+        common = {
+            'participant_id': str(participant_id)[:8],
+            'booth_code': booth.code if booth else None,
+            'at': stamped_at.isoformat(),
+            'hour': stamped_at.strftime('%H:00'),
+        }
+        if nth == 1:
+            events.append({'type': EVENT_PARTICIPANT, **common})
+        events.append({'type': EVENT_STAMP, 'stamp_count': nth, **common})
+        if nth == TARGET_STAMPS:
+            events.append({'type': EVENT_COMPLETION, **common})
+    return events
+
+
+def publish_stamps(entries):
+    """새 스탬프 이벤트 발행 (커밋 후 호출, 구독 중인 대시보드가 없으면 생략, 실패해도 스캔에는 영향 없음)"""
+    try:
+        if not cache.get(LISTENING_KEY):
+            return
+        publish(stamp_events(entries))
+    except Exception:
+        logger.exception('대시보드 실시간 이벤트 발행 실패')
+
+
+async def _read(after, upto):
+    """after 초과 upto 이하 순번의 이벤트 {순번: 이벤트}"""
+    keys = {EVENT_KEY.format(seq): seq for seq in range(after + 1, upto + 1)}
+    found = await cache.aget_many(list(keys))
+    return {keys[key]: event for key, event in found.items()}
+
+
+class Subscriber:
+    """대시보드 연결 하나의 이벤트 대기열"""
+
+    def __init__(self):
+        self.queue = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+        self.overflowed = False
+
+    @property
+    def finished(self):
+        return self.overflowed and self.queue.empty()
+
+    async def next(self, timeout):
+        """다음 이벤트 (timeout 초 동안 없으면 None)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventHub:
+    """워커 단위 이벤트 발행기 (이벤트 로그 조회 1개 → 구독자 N개)"""
+
+    def __init__(self):
+        self._subscribers = set()
+        self._task = None
+        self._last_seq = None
+        self._gap_retries = 0
+        self._listening_at = None
+
+    async def _mark_listening(self):
+        """다른 워커의 스캔 경로가 이벤트를 발행하도록 구독 표시 갱신"""
+        now = time.monotonic()
+        if self._listening_at is None or now - self._listening_at >= LISTENING_REFRESH:
+            await cache.aset(LISTENING_KEY, True, LISTENING_TTL)
+            self._listening_at = now
+
+    async def subscribe(self, after=None):
+        """
+        구독 시작
+        after: 마지막으로 받은 이벤트 순번 (Last-Event-ID, 그 이후 보관 중인 이벤트를 먼저 전달)
+        반환값: (구독자, 먼저 전달할 이벤트 목록)
+        """
+        await self._mark_listening()
+        if self._last_seq is None:
+            self._last_seq = await EventSequence.acurrent(SEQUENCE_NAME)
+        subscriber = Subscriber()
+        self._subscribers.add(subscriber)
+        upto = self._last_seq
+        self._ensure_running()
+
+        backlog = []
+        if after is not None and after < upto:
+            events = await _read(max(after, upto - READ_BATCH), upto)
+            backlog = [events[seq] for seq in sorted(events)]
+        return subscriber, backlog
+
+    def unsubscribe(self, subscriber):
+        self._subscribers.discard(subscriber)
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def _ensure_running(self):
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._run())
+
+    async def _run(self):
+        while self._subscribers:
+            await asyncio.sleep(settings.LIVE_EVENT_POLL)
+            try:
+                await self._mark_listening()
+                events = await self._poll()
+            except Exception:
+                logger.exception('대시보드 실시간 이벤트 조회 실패')
+                continue
+            for event in events:
+                self._fan_out(event)
+        # 구독자가 없으면 중지, 다음 구독은 그 시점부터 시작 (구독 표시는 LISTENING_TTL 후 만료)
+        self._last_seq = None
+        self._listening_at = None
+
+    async def _poll(self):
+        """이벤트 로그에서 새 이벤트를 순번 순서대로 읽음"""
+        current = await EventSequence.acurrent(SEQUENCE_NAME)
+        if current < self._last_seq:
+            # 순번 행이 초기화된 경우
+            self._last_seq = current
+            return []
+        upto = min(current, self._last_seq + READ_BATCH)
+        if upto == self._last_seq:
+            return []
+
+        found = await _read(self._last_seq, upto)
+        events = []
+        for seq in range(self._last_seq + 1, upto + 1):
+            event = found.get(seq)
+            if event is None:
+                if self._gap_retries < GAP_RETRIES:
+                    # 다른 워커가 순번만 받고 아직 기록하지 않은 경우 다음 조회에서 다시 확인
+                    self._gap_retries += 1
+                    break
+                # 만료되었거나 기록되지 못한 이벤트는 건너뜀
+            else:
+                events.append(event)
+            self._gap_retries = 0
+            self._last_seq = seq
+        return events
+
+    def _fan_out(self, event):
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # 느린 구독자는 연결을 끊어 재연결(Last-Event-ID)하도록 함
+                subscriber.overflowed = True
+                self._subscribers.discard(subscriber)
+
+
+event_hub = EventHub()
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from stamps.models import Participant
+from stamps.participant_ids import convert_mysql_storage, stored_as_binary
+
+
+class Command(BaseCommand):
+    """
+    참여자 ID 저장 형식 확인/변환 (MySQL 전용)
+    - 옵션 없이 실행하면 현재 저장 형식만 출력
+    - --binary: CHAR(32) → BINARY(16), 변환 후 PARTICIPANT_ID_BINARY=True 로 설정하고 서버 재시작
+    - --char: BINARY(16) → CHAR(32), 변환 후 PARTICIPANT_ID_BINARY=False 로 설정하고 서버 재시작
+    - 참여자/스탬프 기록 테이블 전체를 다시 쓰므로 서버를 내린 점검 시간에 실행
+    """
+    help = '참여자 ID 컬럼을 MySQL BINARY(16) / CHAR(32) 저장 형식으로 변환합니다.'
+
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group()
+        target.add_argument('--binary', action='store_true', help='BINARY(16) 으로 변환')
+        target.add_argument('--char', action='store_true', help='CHAR(32) 로 변환')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'mysql':
+            raise CommandError('참여자 ID 저장 형식 변환은 MySQL 에서만 지원합니다.')
+
+        columns = [(Participant._meta.db_table, Participant._meta.pk.column)] + [
+            (relation.related_model._meta.db_table, relation.field.column)
+            for relation in Participant._meta.related_objects
+        ]
+        current = 'BINARY(16)' if stored_as_binary(connection) else 'CHAR(32)'
+        if not options['binary'] and not options['char']:
+            self.stdout.write(f'현재 저장 형식: {current}')
+            return
+
+        target = 'BINARY(16)' if options['binary'] else 'CHAR(32)'
+        if current == target:
+            self.stdout.write(f'이미 {target} 형식입니다.')
+            return
+
+        with connection.schema_editor() as schema_editor:
+            convert_mysql_storage(schema_editor, columns, to_binary=options['binary'])
+        self.stdout.write(self.style.SUCCESS(
+            f"{', '.join(f'{table}.{column}' for table, column in columns)} 을(를) {target} 로 변환했습니다. "
+            f"PARTICIPANT_ID_BINARY={'True' if options['binary'] else 'False'} 로 설정한 뒤 서버를 재시작하세요."
+        ))
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from stamps.booth_tokens import build_stamp_url
+from stamps.models import Booth
+
+
+def _parse_datetime(value):
+    """ISO 8601 날짜/시간 (시간대가 없으면 TIME_ZONE 기준)"""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f'날짜 형식이 올바르지 않습니다: {value}')
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class Command(BaseCommand):
+    """
+    서명된 부스 QR URL 생성
+    - 활성화된 부스마다 /stamp?booth=<code>&t=<token> 형태의 URL 출력
+    - 사용 기간을 지정하면 기간 밖의 스캔은 DB 조회 없이 거절됨
+    """
+    help = '활성화된 부스의 서명된 QR 코드 URL을 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', required=True, help='프론트엔드 주소 (예: https://stamp.example.com)')
+        parser.add_argument('--valid-from', help='사용 시작 시각 (ISO 8601, 예: 2025-09-26T09:00)')
+        parser.add_argument('--valid-until', help='사용 종료 시각 (ISO 8601, 예: 2025-09-28T18:00)')
+        parser.add_argument('--output', help='URL 목록을 저장할 파일 경로')
+
+    def handle(self, *args, **options):
+        valid_from = _parse_datetime(options['valid_from']) if options['valid_from'] else None
+        valid_until = _parse_datetime(options['valid_until']) if options['valid_until'] else None
+        if valid_from and valid_until and valid_from >= valid_until:
+            raise CommandError('사용 시작 시각이 종료 시각보다 빨라야 합니다.')
+
+        lines = []
+        for booth in Booth.objects.filter(is_active=True).order_by('code'):
+            url = build_stamp_url(options['base_url'], booth.code, valid_from, valid_until)
+            lines.append(f'{booth.code} ({booth.name}): {url}')
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+            self.stdout.write(self.style.SUCCESS(
+                f'부스 {len(lines)}개의 URL을 {options["output"]}에 저장했습니다.'
+            ))
+        else:
+            for line in lines:
+                self.stdout.write(line)
@@ -0,0 +1,93 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from stamps.models import Booth, BoothCounterShard, Participant, StampRecord, booth_bit
+
+
+class Command(BaseCommand):
+    """
+    참여자 비정규화 진행 현황 재계산/검증
+    - stamp_count, visited_booths 를 stamp_records 기준으로 다시 계산
+    - 부스별 분산 카운터 슬롯 합계도 stamp_records 기준으로 검증/재설정
+    - --verify 옵션 사용 시 수정 없이 불일치만 보고
+    """
+    help = 'stamp_records 로부터 참여자 스탬프 수, 방문 비트맵, 부스 참여자 수를 재계산하고 검증합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='수정하지 않고 불일치 여부만 확인 (불일치 시 오류 종료)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번에 읽고 갱신할 행 수 (기본값: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        verify_only = options['verify']
+        batch_size = options['batch_size']
+
+        # 스탬프 기록 기준 기대값 계산 (부스별 방문 비트맵 슬롯 기준)
+        booth_bits = {
+            booth_id: booth_bit(visit_slot)
+            for booth_id, visit_slot in Booth.objects.values_list('id', 'visit_slot')
+        }
+        expected = {}
+        records = StampRecord.objects.order_by().values_list('participant_id', 'booth_id')
+        for participant_id, booth_id in records.iterator(chunk_size=batch_size):
+            count, bitmap = expected.get(participant_id, (0, 0))
+            expected[participant_id] = (count + 1, bitmap | booth_bits.get(booth_id, 0))
+
+        # 현재 저장된 값과 비교
+        mismatched = []
+        participants = Participant.objects.order_by().only('id', 'stamp_count', 'visited_booths')
+        checked = 0
+        for participant in participants.iterator(chunk_size=batch_size):
+            checked += 1
+            count, bitmap = expected.get(participant.id, (0, 0))
+            if participant.stamp_count != count or participant.visited_booths != bitmap:
+                participant.stamp_count = count
+                participant.visited_booths = bitmap
+                mismatched.append(participant)
+
+        self.stdout.write(f'검사한 참여자: {checked}명, 불일치: {len(mismatched)}명')
+
+        # 부스별 카운터 슬롯 합계 비교
+        booth_expected = dict(
+            Booth.objects.annotate(total=Count('stamp_records')).values_list('id', 'total')
+        )
+        booth_actual = dict(
+            BoothCounterShard.objects.order_by().values('booth_id')
+            .annotate(total=Sum('count')).values_list('booth_id', 'total')
+        )
+        mismatched_booths = {
+            booth_id: total for booth_id, total in booth_expected.items()
+            if booth_actual.get(booth_id, 0) != total
+        }
+        self.stdout.write(f'검사한 부스: {len(booth_expected)}개, 불일치: {len(mismatched_booths)}개')
+
+        if verify_only:
+            if mismatched or mismatched_booths:
+                for participant in mismatched[:20]:
+                    self.stdout.write(f'  - {participant.id}')
+                for booth_id in list(mismatched_booths)[:20]:
+                    self.stdout.write(f'  - 부스 {booth_id}')
+                raise CommandError('비정규화 진행 현황이 스탬프 기록과 일치하지 않습니다.')
+            self.stdout.write(self.style.SUCCESS('모든 참여자와 부스의 진행 현황이 일치합니다.'))
+            return
+
+        with transaction.atomic():
+            Participant.objects.bulk_update(
+                mismatched, ['stamp_count', 'visited_booths'], batch_size=batch_size
+            )
+            # 불일치 부스는 슬롯을 다시 만들어 0번 슬롯에 참여자 수를 담음
+            BoothCounterShard.objects.filter(booth_id__in=mismatched_booths).delete()
+            for booth_id, total in mismatched_booths.items():
+                BoothCounterShard.create_slots(booth_id, initial=total)
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(mismatched)}명의 진행 현황과 {len(mismatched_booths)}개 부스의 참여자 수를 재계산했습니다.'
+        ))
@@ -0,0 +1,71 @@
+from datetime import datetime, time, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from stamps import rollups
+
+
+class Command(BaseCommand):
+    """
+    시간대별 부스 통계 롤업 재계산/검증
+    - --since/--until 구간(정각 단위로 확장)의 롤업을 stamp_records 기준으로 다시 계산
+    - 구간을 생략하면 전체 기간
+    - --verify 옵션 사용 시 수정 없이 불일치만 보고
+    - 재계산 중 들어온 스캔의 증가분은 누락될 수 있으므로 스캔이 적은 시간에 실행하고 --verify 로 확인
+    """
+    help = 'stamp_records 로부터 시간대별 부스 통계 롤업을 재계산하고 검증합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--since',
+            help='시작 시각 (예: 2025-09-27 또는 2025-09-27T13:00, TIME_ZONE 기준)'
+        )
+        parser.add_argument(
+            '--until',
+            help='종료 시각 (미포함, 형식은 --since 와 같음)'
+        )
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='수정하지 않고 불일치 여부만 확인 (불일치 시 오류 종료)'
+        )
+
+    def _parse(self, value, name, round_up=False):
+        """옵션 값을 정각으로 맞춘 시각으로 변환 (round_up: 정각이 아니면 다음 정각)"""
+        if not value:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None:
+            date = parse_date(value)
+            if date is None:
+                raise CommandError(f'{name} 형식이 올바르지 않습니다: {value}')
+            parsed = datetime.combine(date, time.min)
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        hour = rollups.hour_of(parsed)
+        if round_up and hour != parsed:
+            hour += timedelta(hours=1)
+        return hour
+
+    def handle(self, *args, **options):
+        since = self._parse(options['since'], '--since')
+        until = self._parse(options['until'], '--until', round_up=True)
+        if since and until and since >= until:
+            raise CommandError('--since 는 --until 보다 이전이어야 합니다.')
+
+        period = f"{since or '처음'} ~ {until or '현재'}"
+
+        if options['verify']:
+            mismatches = rollups.verify(since, until)
+            self.stdout.write(f'검사 구간: {period}, 불일치: {len(mismatches)}건')
+            if mismatches:
+                for hour, booth_id, expected, actual in mismatches[:20]:
+                    self.stdout.write(f'  - {hour:%Y-%m-%d %H}시 부스 {booth_id}: 기대 {expected}, 저장 {actual}')
+                raise CommandError('시간대별 통계 롤업이 스탬프 기록과 일치하지 않습니다.')
+            self.stdout.write(self.style.SUCCESS('시간대별 통계 롤업이 스탬프 기록과 일치합니다.'))
+            return
+
+        rows = rollups.rebuild(since, until)
+        self.stdout.write(self.style.SUCCESS(f'{period} 구간의 롤업 {rows}행을 재계산했습니다.'))
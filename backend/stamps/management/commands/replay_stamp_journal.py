@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from stamps.ingest import replay_orphaned_segments
+
+
+class Command(BaseCommand):
+    """
+    write-behind 저널 재적재
+    - 저장되기 전에 종료된 워커가 남긴 스탬프 기록을 DB에 반영
+    - 재적재는 unique 제약으로 중복이 무시되므로 여러 번 실행해도 안전
+    """
+    help = 'write-behind 저널에 남은 스탬프 기록을 DB에 재적재합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--journal-dir',
+            default=settings.STAMP_WRITE_BEHIND_JOURNAL_DIR,
+            help='저널 디렉터리 (기본값: STAMP_WRITE_BEHIND_JOURNAL_DIR)'
+        )
+        parser.add_argument(
+            '--include-live',
+            action='store_true',
+            help='실행 중인 프로세스의 저널도 포함 (서버 중지 후 사용)'
+        )
+
+    def handle(self, *args, **options):
+        segments, items = replay_orphaned_segments(
+            options['journal_dir'], include_live=options['include_live']
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'저널 세그먼트 {segments}개, 스탬프 기록 {items}건을 재적재했습니다.'
+        ))
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.5 on 2026-10-18 01:17
+
+from django.db import migrations, models
+
+VISIT_BITMAP_SIZE = 63
+
+
+def populate_progress(apps, schema_editor):
+    """기존 스탬프 기록으로 참여자 진행 현황 채우기"""
+    Participant = apps.get_model('stamps', 'Participant')
+    StampRecord = apps.get_model('stamps', 'StampRecord')
+
+    progress = {}
+    records = StampRecord.objects.order_by().values_list('participant_id', 'booth_id')
+    for participant_id, booth_id in records.iterator():
+        count, bitmap = progress.get(participant_id, (0, 0))
+        if 0 < booth_id <= VISIT_BITMAP_SIZE:
+            bitmap |= 1 << (booth_id - 1)
+        progress[participant_id] = (count + 1, bitmap)
+
+    for participant_id, (count, bitmap) in progress.items():
+        Participant.objects.filter(pk=participant_id).update(
+            stamp_count=count, visited_booths=bitmap
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stamps', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='participant',
+            name='stamp_count',
+            field=models.PositiveIntegerField(default=0, help_text='획득한 스탬프 수 (stamp_records 비정규화)'),
+        ),
+        migrations.AddField(
+            model_name='participant',
+            name='visited_booths',
+            field=models.BigIntegerField(default=0, help_text='방문한 부스 비트맵 (부스 ID 기준, stamp_records 비정규화)'),
+        ),
+        migrations.RunPython(populate_progress, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-18 01:19
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stamps', '0002_participant_progress'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='stamprecord',
+            name='stamped_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, help_text='스탬프 획득 시간'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.5 on 2026-10-18 09:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+TARGET_STAMPS = 5
+
+
+def populate_hourly_stats(apps, schema_editor):
+    """기존 스탬프 기록으로 시간대별 부스 통계 채우기 (rebuild_rollups 전체 재계산과 같은 집계)"""
+    StampRecord = apps.get_model('stamps', 'StampRecord')
+    HourlyBoothStat = apps.get_model('stamps', 'HourlyBoothStat')
+
+    counts = {}
+    current, nth = None, 0
+    records = (
+        StampRecord.objects.order_by('participant_id', 'stamped_at', 'id')
+        .values_list('participant_id', 'booth_id', 'stamped_at')
+    )
+    for participant_id, booth_id, stamped_at in records.iterator(chunk_size=2000):
+        if participant_id != current:
+            current, nth = participant_id, 0
+        nth += 1
+        hour = timezone.localtime(stamped_at).replace(minute=0, second=0, microsecond=0)
+        row = counts.setdefault((hour, booth_id), [0, 0, 0])
+        row[0] += 1
+        if nth == 1:
+            row[1] += 1
+        if nth == TARGET_STAMPS:
+            row[2] += 1
+
+    HourlyBoothStat.objects.bulk_create(
+        (
+            HourlyBoothStat(
+                hour=hour, booth_id=booth_id,
+                stamps=stamps, first_participants=first_participants, completions=completions,
+            )
+            for (hour, booth_id), (stamps, first_participants, completions) in counts.items()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stamps', '0003_stamprecord_stamped_at_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HourlyBoothStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(help_text='집계 시간대 시작 시각 (정각)')),
+                ('stamps', models.PositiveIntegerField(default=0, help_text='스탬프 수')),
+                ('first_participants', models.PositiveIntegerField(default=0, help_text='첫 스탬프를 받은 참여자 수')),
+                ('completions', models.PositiveIntegerField(default=0, help_text='목표 개수째 스탬프로 완주한 참여자 수')),
+                ('booth', models.ForeignKey(help_text='체험부스', on_delete=django.db.models.deletion.CASCADE, related_name='hourly_stats', to='stamps.booth')),
+            ],
+            options={
+                'verbose_name': '시간대별 부스 통계',
+                'verbose_name_plural': '시간대별 부스 통계들',
+                'db_table': 'hourly_booth_stats',
+                'ordering': ['hour', 'booth'],
+                'unique_together': {('hour', 'booth')},
+            },
+        ),
+        migrations.RunPython(populate_hourly_stats, migrations.RunPython.noop),
+    ]
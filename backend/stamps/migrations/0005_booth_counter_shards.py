@@ -0,0 +1,47 @@
+# Generated by Django 5.2.5 on 2026-10-18 10:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_counters(apps, schema_editor):
+    """기존 스탬프 기록으로 부스별 카운터 슬롯 채우기 (기존 참여자 수는 0번 슬롯)"""
+    Booth = apps.get_model('stamps', 'Booth')
+    BoothCounterShard = apps.get_model('stamps', 'BoothCounterShard')
+
+    counts = dict(
+        Booth.objects.annotate(total=Count('stamp_records')).values_list('id', 'total')
+    )
+    BoothCounterShard.objects.bulk_create(
+        BoothCounterShard(booth_id=booth_id, slot=slot, count=total if slot == 0 else 0)
+        for booth_id, total in counts.items()
+        for slot in range(settings.BOOTH_COUNTER_SHARDS)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stamps', '0004_hourly_booth_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoothCounterShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slot', models.PositiveSmallIntegerField(help_text='슬롯 번호')),
+                ('count', models.IntegerField(default=0, help_text='이 슬롯에 더해진 참여자 수')),
+                ('booth', models.ForeignKey(help_text='체험부스', on_delete=django.db.models.deletion.CASCADE, related_name='counter_shards', to='stamps.booth')),
+            ],
+            options={
+                'verbose_name': '부스 참여자 수 카운터',
+                'verbose_name_plural': '부스 참여자 수 카운터들',
+                'db_table': 'booth_counter_shards',
+                'unique_together': {('booth', 'slot')},
+            },
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stamps', '0005_booth_counter_shards'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='participant',
+            index=models.Index(fields=['created_at'], name='participant_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='participant',
+            index=models.Index(fields=['completed_at', 'id'], name='participant_completion_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stamprecord',
+            index=models.Index(fields=['participant', 'stamped_at'], name='stamp_participant_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stamprecord',
+            index=models.Index(fields=['stamped_at'], name='stamp_stamped_at_idx'),
+        ),
+    ]
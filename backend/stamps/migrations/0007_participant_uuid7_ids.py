@@ -0,0 +1,45 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:40
+
+import stamps.participant_ids
+from django.db import migrations
+
+from stamps.participant_ids import binary_storage, convert_mysql_storage, stored_as_binary
+
+PARTICIPANT_ID_COLUMNS = [('participants', 'id'), ('stamp_records', 'participant_id')]
+
+
+def use_binary_storage(apps, schema_editor):
+    """PARTICIPANT_ID_BINARY 이면 기존 CHAR(32) 참여자 ID 를 BINARY(16) 으로 변환 (MySQL 전용, 값 유지)"""
+    connection = schema_editor.connection
+    if binary_storage(connection) and not stored_as_binary(connection):
+        convert_mysql_storage(schema_editor, PARTICIPANT_ID_COLUMNS, to_binary=True)
+
+
+def use_char_storage(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'mysql' and stored_as_binary(connection):
+        convert_mysql_storage(schema_editor, PARTICIPANT_ID_COLUMNS, to_binary=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stamps', '0006_hot_query_indexes'),
+    ]
+
+    operations = [
+        # CHAR(32) 저장은 기존 UUIDField 와 같은 컬럼이므로 스키마 변경 없이 필드/기본값만 교체
+        # (기존 참여자 ID 는 쿠키/QR 에 저장되어 있으므로 v7 로 다시 발급하지 않음)
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='participant',
+                    name='id',
+                    field=stamps.participant_ids.ParticipantIdField(default=stamps.participant_ids.uuid7, editable=False, help_text='참여자 고유 식별자 (시간 순 UUID v7)', primary_key=True, serialize=False),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(use_binary_storage, use_char_storage),
+            ],
+        ),
+    ]
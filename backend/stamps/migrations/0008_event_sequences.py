@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-18 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stamps', '0007_participant_uuid7_ids'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventSequence',
+            fields=[
+                ('name', models.CharField(help_text='순번 이름', max_length=50, primary_key=True, serialize=False)),
+                ('value', models.BigIntegerField(default=0, help_text='마지막으로 발급한 순번')),
+            ],
+            options={
+                'verbose_name': '순번',
+                'verbose_name_plural': '순번들',
+                'db_table': 'event_sequences',
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-18 13:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stamps', '0008_event_sequences'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='hourlyboothstat',
+            options={'ordering': ['hour', 'booth', 'slot'], 'verbose_name': '시간대별 부스 통계', 'verbose_name_plural': '시간대별 부스 통계들'},
+        ),
+        migrations.AlterUniqueTogether(
+            name='hourlyboothstat',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='hourlyboothstat',
+            name='slot',
+            field=models.PositiveSmallIntegerField(default=0, help_text='슬롯 번호'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='hourlyboothstat',
+            unique_together={('hour', 'booth', 'slot')},
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.5 on 2026-10-18 13:40
+
+from django.db import migrations, models
+from django.db.models import F
+
+VISIT_BITMAP_SIZE = 63
+
+
+def assign_visit_slots(apps, schema_editor):
+    """
+    기존 부스에 방문 비트맵 슬롯 배정
+    - ID 1~63 부스는 지금까지 쓰던 비트를 그대로 유지하도록 슬롯 = ID
+    - 그 밖의 부스는 남은 슬롯을 배정하고 스탬프 기록으로 해당 비트를 다시 채움
+    """
+    Booth = apps.get_model('stamps', 'Booth')
+    Participant = apps.get_model('stamps', 'Participant')
+    StampRecord = apps.get_model('stamps', 'StampRecord')
+
+    booths = list(Booth.objects.order_by('id'))
+    used = {booth.id for booth in booths if booth.id <= VISIT_BITMAP_SIZE}
+    free_slots = iter([slot for slot in range(1, VISIT_BITMAP_SIZE + 1) if slot not in used])
+
+    for booth in booths:
+        if booth.id <= VISIT_BITMAP_SIZE:
+            booth.visit_slot = booth.id
+            continue
+        booth.visit_slot = next(free_slots, None)
+        if booth.visit_slot is None:
+            continue
+        bit = 1 << (booth.visit_slot - 1)
+        # 삭제된 부스가 남긴 비트를 지운 뒤 이 부스 방문자에게 비트 설정
+        Participant.objects.update(visited_booths=F('visited_booths').bitand(~bit))
+        Participant.objects.filter(
+            id__in=StampRecord.objects.filter(booth_id=booth.id).values('participant_id')
+        ).update(visited_booths=F('visited_booths').bitor(bit))
+
+    Booth.objects.bulk_update(booths, ['visit_slot'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stamps', '0009_hourly_stat_slots'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booth',
+            name='visit_slot',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, help_text='참여자 방문 비트맵 슬롯 (1~63, 빈 슬롯이 없으면 비움)', null=True, unique=True),
+        ),
+        migrations.RunPython(assign_visit_slots, migrations.RunPython.noop),
+    ]
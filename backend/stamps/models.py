@@ -1,7 +1,26 @@
-import uuid
-from django.db import models
+import random
+from django.conf import settings
+from django.db import models, transaction, IntegrityError
+from django.db.models import F, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from .participant_ids import ParticipantIdField, uuid7
+
+# 미션 완료에 필요한 스탬프 수
+TARGET_STAMPS = 5
+
+# 방문 비트맵 슬롯 수 (BigIntegerField 부호 비트 제외)
+# 부스마다 1~63 중 빈 슬롯을 배정하므로 부스 ID가 커져도 동시에 존재하는 부스 63개까지 비트맵 사용
+VISIT_BITMAP_SIZE = 63
+
+
+def booth_bit(visit_slot):
+    """방문 비트맵 슬롯에 해당하는 비트 (슬롯이 없으면 0)"""
+    if visit_slot and 0 < visit_slot <= VISIT_BITMAP_SIZE:
+        return 1 << (visit_slot - 1)
+    return 0
+
 
 class Participant(models.Model):
     """
@@ -9,11 +28,11 @@ class Participant(models.Model):
     - QR 스캔 시 자동으로 생성되는 고유 참여자
     - UUID를 통해 익명성 보장
     """
-    id = models.UUIDField(
+    id = ParticipantIdField(
         primary_key=True, 
-        default=uuid.uuid4, 
+        default=uuid7, 
         editable=False,
-        help_text="참여자 고유 식별자 (UUID)"
+        help_text="참여자 고유 식별자 (시간 순 UUID v7)"
     )
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -28,30 +47,96 @@ class Participant(models.Model):
         blank=True,
         help_text="미션 완료 시간"
     )
+    stamp_count = models.PositiveIntegerField(
+        default=0,
+        help_text="획득한 스탬프 수 (stamp_records 비정규화)"
+    )
+    visited_booths = models.BigIntegerField(
+        default=0,
+        help_text="방문한 부스 비트맵 (부스 ID 기준, stamp_records 비정규화)"
+    )
 
     class Meta:
         db_table = 'participants'
         verbose_name = '참여자'
         verbose_name_plural = '참여자들'
         ordering = ['-created_at']
+        indexes = [
+            # 가입 시각 순 목록(관리자), 기간 조회(내보내기)
+            models.Index(fields=['created_at'], name='participant_created_idx'),
+            # 기념품 대상자 목록: 완주자를 (완주 시간, ID) 순으로 조회
+            # completed_at 은 완주 시에만 기록되므로 is_completed 는 키에 넣지 않음
+            # (is_completed=True 조건은 불리언 컬럼 그대로 비교되어 복합 색인 앞부분으로 쓰이지 않음)
+            models.Index(fields=['completed_at', 'id'], name='participant_completion_idx'),
+        ]
 
     def __str__(self):
         return f"참여자 {str(self.id)[:8]}..."
 
     def get_stamp_count(self):
         """참여자의 현재 스탬프 개수 반환"""
-        return self.stamp_records.count()
+        return self.stamp_count
+
+    def has_visited(self, booth):
+        """부스 방문 여부 (비트맵 범위 밖의 부스는 스탬프 기록 조회)"""
+        bit = booth.visit_bit
+        if bit:
+            return bool(self.visited_booths & bit)
+        return self.stamp_records.filter(booth=booth).exists()
+
+    def add_stamp(self, booth):
+        """스탬프 1개를 비정규화 필드에 원자적으로 반영"""
+        bit = booth.visit_bit
+        updates = {'stamp_count': F('stamp_count') + 1}
+        if bit:
+            updates['visited_booths'] = F('visited_booths').bitor(bit)
+        Participant.objects.filter(pk=self.pk).update(**updates)
+        self.stamp_count += 1
+        self.visited_booths |= bit
+
+    @classmethod
+    def clear_visit_bit(cls, bit):
+        """모든 참여자 방문 비트맵에서 해당 비트 제거 (삭제된 부스의 슬롯을 재사용하기 전 호출)"""
+        if bit:
+            cls.objects.update(visited_booths=F('visited_booths').bitand(~bit))
+
+    @classmethod
+    def remove_stamp(cls, participant_id, bit):
+        """스탬프 1개 삭제를 비정규화 필드에 원자적으로 반영 (삭제 시그널에서 호출, bit 는 부스 방문 비트)"""
+        updates = {'stamp_count': F('stamp_count') - 1}
+        if bit:
+            updates['visited_booths'] = F('visited_booths').bitand(~bit)
+        cls.objects.filter(pk=participant_id, stamp_count__gt=0).update(**updates)
+
+    def mark_completed(self):
+        """
+        목표 스탬프 수 도달 시 완주 처리 (조건부 UPDATE 한 번)
+        - WHERE is_completed=False AND stamp_count>=목표 조건을 DB가 판단하므로
+          동시에 들어온 스캔 중 정확히 한 요청만 완주 처리됨
+        반환값: 이번 호출로 완주 처리되었는지 여부
+        """
+        completed_at = timezone.now()
+        updated = Participant.objects.filter(
+            pk=self.pk, is_completed=False, stamp_count__gte=TARGET_STAMPS
+        ).update(is_completed=True, completed_at=completed_at)
+        if updated:
+            self.is_completed = True
+            self.completed_at = completed_at
+        return bool(updated)
 
     def check_completion(self):
         """5개 부스 완주 확인 및 완료 처리"""
-        stamp_count = self.get_stamp_count()
-        if stamp_count >= 5 and not self.is_completed:
-            self.is_completed = True
-            self.completed_at = timezone.now()
-            self.save()
+        if not self.is_completed:
+            self.mark_completed()
         return self.is_completed
 
 
+class BoothQuerySet(models.QuerySet):
+    def with_participant_count(self):
+        """부스별 참여자 수(분산 카운터 슬롯 합계)를 participant_count 로 annotate"""
+        return self.annotate(participant_count=Coalesce(Sum('counter_shards__count'), 0))
+
+
 class Booth(models.Model):
     """
     체험부스 모델
@@ -74,9 +159,18 @@ class Booth(models.Model):
         default=True,
         help_text="부스 활성화 여부"
     )
+    visit_slot = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        unique=True,
+        editable=False,
+        help_text="참여자 방문 비트맵 슬롯 (1~63, 빈 슬롯이 없으면 비움)"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BoothQuerySet.as_manager()
+
     class Meta:
         db_table = 'booths'
         verbose_name = '체험부스'
@@ -86,9 +180,125 @@ class Booth(models.Model):
     def __str__(self):
         return f"{self.code} - {self.name}"
 
+    def save(self, *args, **kwargs):
+        """
+        새 부스 저장 시
+        - 비어 있는 가장 낮은 방문 비트맵 슬롯 배정 (63개가 모두 사용 중이면 비워 두고 스탬프 기록 조회로 대체)
+        - 분산 카운터 슬롯을 미리 생성 (증가 시 UPDATE 한 번으로 처리)
+        """
+        adding = self._state.adding
+        with transaction.atomic():
+            if adding and self.visit_slot is None:
+                self.visit_slot = self.free_visit_slot()
+                # 삭제된 부스가 쓰던 슬롯일 수 있으므로 남은 비트를 먼저 지움
+                Participant.clear_visit_bit(booth_bit(self.visit_slot))
+            super().save(*args, **kwargs)
+            if adding:
+                BoothCounterShard.create_slots(self.pk)
+
+    @staticmethod
+    def free_visit_slot():
+        """비어 있는 가장 낮은 방문 비트맵 슬롯 (없으면 None)"""
+        used = set(
+            Booth.objects.filter(visit_slot__isnull=False).values_list('visit_slot', flat=True)
+        )
+        return next((slot for slot in range(1, VISIT_BITMAP_SIZE + 1) if slot not in used), None)
+
     def get_participant_count(self):
-        """이 부스를 방문한 참여자 수"""
-        return self.stamp_records.count()
+        """이 부스를 방문한 참여자 수 (분산 카운터 슬롯 합계)"""
+        participant_count = getattr(self, 'participant_count', None)
+        if participant_count is not None:
+            return participant_count
+        return self.counter_shards.aggregate(total=Coalesce(Sum('count'), 0))['total']
+
+    @property
+    def visit_bit(self):
+        """참여자 방문 비트맵에서 이 부스가 차지하는 비트 (슬롯이 없으면 0)"""
+        return booth_bit(self.visit_slot)
+
+
+class BoothCounterShard(models.Model):
+    """
+    부스 참여자 수 분산 카운터
+    - 부스 × BOOTH_COUNTER_SHARDS 개 슬롯, 증감 시 슬롯을 무작위로 골라 UPDATE
+      (인기 부스에 몰린 스캔 트랜잭션들이 한 행의 잠금을 기다리지 않음)
+    - 참여자 수는 슬롯 합계, stamp_records 와의 일치 여부는 rebuild_progress 명령으로 검증
+    """
+    booth = models.ForeignKey(
+        Booth,
+        on_delete=models.CASCADE,
+        related_name='counter_shards',
+        help_text="체험부스"
+    )
+    slot = models.PositiveSmallIntegerField(
+        help_text="슬롯 번호"
+    )
+    count = models.IntegerField(
+        default=0,
+        help_text="이 슬롯에 더해진 참여자 수"
+    )
+
+    class Meta:
+        db_table = 'booth_counter_shards'
+        verbose_name = '부스 참여자 수 카운터'
+        verbose_name_plural = '부스 참여자 수 카운터들'
+        unique_together = ['booth', 'slot']
+
+    def __str__(self):
+        return f"{self.booth_id}#{self.slot}: {self.count}"
+
+    @classmethod
+    def create_slots(cls, booth_id, initial=0):
+        """부스의 슬롯 생성 (initial 은 0번 슬롯에 담음, 이미 있는 슬롯은 무시)"""
+        cls.objects.bulk_create(
+            [
+                cls(booth_id=booth_id, slot=slot, count=initial if slot == 0 else 0)
+                for slot in range(settings.BOOTH_COUNTER_SHARDS)
+            ],
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def add(cls, booth_id, delta=1):
+        """무작위 슬롯 하나에 delta 를 더함 (슬롯이 없으면 생성)"""
+        cls.add_many({booth_id: delta})
+
+    @classmethod
+    def add_many(cls, deltas):
+        """
+        부스별 delta 를 부스마다 무작위 슬롯 하나에 더함 (UPDATE 한 번)
+        deltas: {부스 ID: 증감 수}
+        """
+        slots = {
+            booth_id: random.randrange(settings.BOOTH_COUNTER_SHARDS)
+            for booth_id, delta in deltas.items() if delta
+        }
+        if not slots:
+            return
+        condition = models.Q()
+        for booth_id, slot in slots.items():
+            condition |= models.Q(booth_id=booth_id, slot=slot)
+        if len(slots) == 1:
+            increment = next(delta for delta in deltas.values() if delta)
+        else:
+            increment = models.Case(
+                *(models.When(booth_id=booth_id, then=deltas[booth_id]) for booth_id in slots),
+                output_field=models.IntegerField(),
+            )
+        if cls.objects.filter(condition).update(count=F('count') + increment) == len(slots):
+            return
+
+        # 슬롯이 없는 부스 (bulk_create 로 만든 부스, 슬롯 수 증가 등)
+        existing = set(cls.objects.filter(condition).values_list('booth_id', 'slot'))
+        for booth_id, slot in slots.items():
+            if (booth_id, slot) in existing:
+                continue
+            try:
+                with transaction.atomic():
+                    cls.objects.create(booth_id=booth_id, slot=slot, count=deltas[booth_id])
+            except IntegrityError:
+                # 다른 요청이 먼저 슬롯을 만든 경우
+                cls.objects.filter(booth_id=booth_id, slot=slot).update(count=F('count') + deltas[booth_id])
 
 
 class StampRecord(models.Model):
@@ -110,7 +320,8 @@ class StampRecord(models.Model):
         help_text="체험부스"
     )
     stamped_at = models.DateTimeField(
-        auto_now_add=True,
+        default=timezone.now,
+        editable=False,
         help_text="스탬프 획득 시간"
     )
     ip_address = models.GenericIPAddressField(
@@ -130,12 +341,124 @@ class StampRecord(models.Model):
         ordering = ['-stamped_at']
         # 중복 방지: 한 참여자는 같은 부스에 한 번만 스탬프 가능
         unique_together = ['participant', 'booth']
+        indexes = [
+            # 참여자별 방문 기록을 스탬프 순서대로 조회 (상세/진행 현황, 롤업 재계산)
+            models.Index(fields=['participant', 'stamped_at'], name='stamp_participant_time_idx'),
+            # 기간 조회 (롤업 재계산 구간, 내보내기, 관리자 목록)
+            models.Index(fields=['stamped_at'], name='stamp_stamped_at_idx'),
+        ]
 
     def __str__(self):
         return f"{self.participant} -> {self.booth.name}"
 
-    def save(self, *args, **kwargs):
-        """스탬프 저장 시 참여자 완주 상태 자동 체크"""
+    def save(self, *args, check_completion=True, **kwargs):
+        """
+        스탬프 저장 시 참여자 진행 현황 갱신 및 완주 상태 자동 체크
+        - 부스 참여자 수는 분산 카운터의 무작위 슬롯에 반영
+        - 완주 체크는 새 기록으로 스탬프 수가 목표에 도달한 경우에만 조건부 UPDATE 로 처리
+        - completed_mission: 이 스탬프로 미션이 완료되었는지 여부
+        """
+        adding = self._state.adding
         super().save(*args, **kwargs)
-        # 스탬프 저장 후 참여자 완주 체크
-        self.participant.check_completion()
+        self.completed_mission = False
+        if adding:
+            participant = self.participant
+            participant.add_stamp(self.booth)
+            BoothCounterShard.add(self.booth_id)
+            # 스캔 서비스는 직접 처리하므로 check_completion=False 로 호출
+            if (check_completion and not participant.is_completed
+                    and participant.stamp_count >= TARGET_STAMPS):
+                self.completed_mission = participant.mark_completed()
+
+
+class HourlyBoothStat(models.Model):
+    """
+    시간대별 부스 통계 롤업
+    - 정각(TIME_ZONE 기준) × 부스 단위로 스탬프 수, 첫 스탬프 참여자 수, 완주자 수를 보관
+    - 스캔 시 증가분으로 갱신하고, rebuild_rollups 명령으로 stamp_records 기준 재계산/검증
+    - 같은 (정각, 부스)에 몰리는 갱신은 HOURLY_STAT_SHARDS 개 슬롯 중 하나를 무작위로 골라 UPDATE
+      (조회 시 슬롯 합계, 재계산 결과는 0번 슬롯에 저장)
+    """
+    hour = models.DateTimeField(
+        help_text="집계 시간대 시작 시각 (정각)"
+    )
+    booth = models.ForeignKey(
+        Booth,
+        on_delete=models.CASCADE,
+        related_name='hourly_stats',
+        help_text="체험부스"
+    )
+    slot = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="슬롯 번호"
+    )
+    stamps = models.PositiveIntegerField(
+        default=0,
+        help_text="스탬프 수"
+    )
+    first_participants = models.PositiveIntegerField(
+        default=0,
+        help_text="첫 스탬프를 받은 참여자 수"
+    )
+    completions = models.PositiveIntegerField(
+        default=0,
+        help_text="목표 개수째 스탬프로 완주한 참여자 수"
+    )
+
+    class Meta:
+        db_table = 'hourly_booth_stats'
+        verbose_name = '시간대별 부스 통계'
+        verbose_name_plural = '시간대별 부스 통계들'
+        ordering = ['hour', 'booth', 'slot']
+        unique_together = ['hour', 'booth', 'slot']
+
+    def __str__(self):
+        return f"{self.hour:%m/%d %H}시 {self.booth_id}: {self.stamps}"
+
+
+class EventSequence(models.Model):
+    """
+    순번 발급용 행 (이름별 마지막 순번)
+    - 여러 워커가 같은 범위를 받지 않도록 행 잠금(F() UPDATE 후 같은 트랜잭션에서 읽기)으로 발급
+      (DatabaseCache 의 incr 는 조회 후 저장이라 원자적이지 않음)
+    """
+    name = models.CharField(
+        max_length=50,
+        primary_key=True,
+        help_text="순번 이름"
+    )
+    value = models.BigIntegerField(
+        default=0,
+        help_text="마지막으로 발급한 순번"
+    )
+
+    class Meta:
+        db_table = 'event_sequences'
+        verbose_name = '순번'
+        verbose_name_plural = '순번들'
+
+    def __str__(self):
+        return f"{self.name}: {self.value}"
+
+    @classmethod
+    def allocate(cls, name, count=1):
+        """count 개의 순번을 발급하고 마지막 순번을 반환 (발급 범위: 반환값-count+1 ~ 반환값)"""
+        with transaction.atomic():
+            if not cls.objects.filter(name=name).update(value=F('value') + count):
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(name=name, value=count)
+                    return count
+                except IntegrityError:
+                    # 다른 워커가 먼저 행을 만든 경우
+                    cls.objects.filter(name=name).update(value=F('value') + count)
+            return cls.objects.values_list('value', flat=True).get(name=name)
+
+    @classmethod
+    def current(cls, name):
+        """마지막으로 발급한 순번 (없으면 0)"""
+        return cls.objects.filter(name=name).values_list('value', flat=True).first() or 0
+
+    @classmethod
+    async def acurrent(cls, name):
+        return await cls.objects.filter(name=name).values_list('value', flat=True).afirst() or 0
@@ -0,0 +1,133 @@
+"""
+참여자 ID
+- 시간 순 UUID(RFC 9562 버전 7) 발급: 앞 48비트가 밀리초 타임스탬프라 새 참여자가 기본 키 색인 끝에 추가됨
+  (무작위 uuid4 는 클러스터형 색인의 임의 위치에 삽입되어 페이지 분할이 잦음)
+- MySQL 에서 PARTICIPANT_ID_BINARY=True 이면 참여자 ID 와 이를 참조하는 외래 키를
+  CHAR(32) 대신 BINARY(16) 으로 저장 (스탬프 기록마다 16바이트 절약)
+- 기존 CHAR(32) 컬럼은 값을 유지한 채 변환 (참여자 쿠키/QR 의 ID 는 그대로 사용 가능)
+"""
+import secrets
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, models
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7():
+    """
+    시간 순 UUID (버전 7)
+    같은 밀리초 안에서는 12비트 카운터(rand_a)를 증가시켜 한 프로세스 안에서 항상 증가하는 값 발급
+    """
+    global _last_ms, _counter
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms = ms
+            # 상위 1비트는 0으로 두어 같은 밀리초에 카운터가 증가할 여유 확보
+            _counter = secrets.randbits(11)
+        else:
+            # 같은 밀리초 (또는 시계가 뒤로 간 경우)
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+        ms, counter = _last_ms, _counter
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | secrets.randbits(62)
+    )
+    return uuid.UUID(int=value)
+
+
+def binary_storage(connection):
+    """참여자 ID 를 BINARY(16) 으로 저장하는지 여부"""
+    return connection.vendor == 'mysql' and settings.PARTICIPANT_ID_BINARY
+
+
+class ParticipantIdField(models.UUIDField):
+    """참여자 ID 컬럼 (MySQL + PARTICIPANT_ID_BINARY 이면 BINARY(16), 그 외에는 UUIDField 와 같음)"""
+
+    def db_type(self, connection):
+        if binary_storage(connection):
+            return 'binary(16)'
+        return super().db_type(connection)
+
+    def get_internal_type(self):
+        # BINARY(16) 저장 시 MySQL 백엔드의 UUID 문자열 변환을 거치지 않도록 함
+        if binary_storage(connections[DEFAULT_DB_ALIAS]):
+            return 'BinaryField'
+        return super().get_internal_type()
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not binary_storage(connection):
+            return super().get_db_prep_value(value, connection, prepared)
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = self.to_python(value)
+        return value.bytes
+
+    def from_db_value(self, value, expression, connection):
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return uuid.UUID(bytes=bytes(value))
+        return value
+
+    def to_python(self, value):
+        if isinstance(value, (bytes, bytearray, memoryview)) and len(value) == 16:
+            return uuid.UUID(bytes=bytes(value))
+        return super().to_python(value)
+
+
+def stored_as_binary(connection, table='participants', column='id'):
+    """MySQL 의 실제 참여자 ID 컬럼이 BINARY 인지 여부"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT DATA_TYPE FROM information_schema.COLUMNS '
+            'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s',
+            [table, column]
+        )
+        row = cursor.fetchone()
+    return bool(row) and row[0].lower() == 'binary'
+
+
+def convert_mysql_storage(schema_editor, columns, to_binary):
+    """
+    MySQL 참여자 ID 컬럼 저장 형식 변환 (값 유지)
+    columns: [(테이블, 컬럼)] - 첫 항목은 참여자 기본 키, 나머지는 이를 참조하는 외래 키
+    외래 키 제약을 잠시 내리고 VARBINARY 를 거쳐 UNHEX/HEX 로 값을 바꾼 뒤 다시 연결
+    테이블 전체를 다시 쓰므로 스캔이 없는 점검 시간에 실행
+    """
+    connection = schema_editor.connection
+    quote = schema_editor.quote_name
+    (pk_table, pk_column), references = columns[0], columns[1:]
+
+    foreign_keys = []
+    with connection.cursor() as cursor:
+        for table, column in references:
+            for name, info in connection.introspection.get_constraints(cursor, table).items():
+                if info['foreign_key'] and info['columns'] == [column]:
+                    foreign_keys.append((table, column, name))
+    for table, column, name in foreign_keys:
+        schema_editor.execute(f'ALTER TABLE {quote(table)} DROP FOREIGN KEY {quote(name)}')
+
+    target = 'BINARY(16)' if to_binary else 'CHAR(32)'
+    for table, column in columns:
+        converted = f'UNHEX({quote(column)})' if to_binary else f'LOWER(HEX({quote(column)}))'
+        schema_editor.execute(f'ALTER TABLE {quote(table)} MODIFY {quote(column)} VARBINARY(32) NOT NULL')
+        schema_editor.execute(f'UPDATE {quote(table)} SET {quote(column)} = {converted}')
+        schema_editor.execute(f'ALTER TABLE {quote(table)} MODIFY {quote(column)} {target} NOT NULL')
+
+    for table, column, name in foreign_keys:
+        schema_editor.execute(
+            f'ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} '
+            f'FOREIGN KEY ({quote(column)}) REFERENCES {quote(pk_table)} ({quote(pk_column)})'
+        )
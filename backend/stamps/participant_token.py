@@ -0,0 +1,75 @@
+"""
+참여자 진행 상황 서명 쿠키
+- QR 링크(stamp_view) 방문자의 참여자 ID, 방문 부스 비트맵, 스탬프 수, 완주 여부를
+  서명된 쿠키 하나에 담아 DB 기반 세션(django_session) 조회/저장을 대체
+- 이미 스탬프를 받은 부스의 재스캔은 쿠키만으로 응답 (DB 조회 없음)
+- 스탬프 처리 후 매번 최신 진행 상황으로 다시 발급
+"""
+from dataclasses import dataclass
+import uuid
+
+from django.conf import settings
+from django.core import signing
+
+COOKIE_NAME = 'stamp_progress'
+SALT = 'stamps.participant-progress'
+
+
+@dataclass(frozen=True)
+class ProgressToken:
+    """쿠키에 담긴 참여자 진행 상황"""
+    participant_id: str
+    visited_booths: int
+    stamp_count: int
+    is_completed: bool
+
+    def has_visited(self, booth):
+        bit = booth.visit_bit
+        return bool(bit) and bool(self.visited_booths & bit)
+
+
+def _encode(participant):
+    # <참여자 ID 16진수>.<비트맵 16진수>.<스탬프 수>.<완주 여부> 형태로 최대한 짧게
+    return '.'.join((
+        participant.id.hex,
+        format(participant.visited_booths, 'x'),
+        str(participant.stamp_count),
+        '1' if participant.is_completed else '0',
+    ))
+
+
+def _decode(value):
+    participant_hex, visited, stamp_count, completed = value.split('.')
+    return ProgressToken(
+        participant_id=str(uuid.UUID(hex=participant_hex)),
+        visited_booths=int(visited, 16),
+        stamp_count=int(stamp_count),
+        is_completed=completed == '1',
+    )
+
+
+def read_progress(request):
+    """요청 쿠키의 진행 상황 (없거나 위조/만료되었으면 None)"""
+    value = request.get_signed_cookie(
+        COOKIE_NAME, default=None, salt=SALT, max_age=settings.PARTICIPANT_TOKEN_MAX_AGE
+    )
+    if not value:
+        return None
+    try:
+        return _decode(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def set_progress(response, participant):
+    """응답에 참여자의 최신 진행 상황 쿠키 발급"""
+    response.set_signed_cookie(
+        COOKIE_NAME,
+        _encode(participant),
+        salt=SALT,
+        max_age=settings.PARTICIPANT_TOKEN_MAX_AGE,
+        secure=settings.SESSION_COOKIE_SECURE,
+        httponly=True,
+        samesite='Lax',
+    )
+    return response
@@ -0,0 +1,118 @@
+"""
+관리자 조회 API 응답 캐시
+- 렌더링된 응답을 공유 캐시에 (만료 시각, 상태 코드, Content-Type, 본문) 형태로 보관
+- 만료(ADMIN_CACHE_TTL 초)된 응답은 ADMIN_CACHE_STALE 초 동안 더 보관하고,
+  잠금을 얻은 요청 하나만 다시 계산하는 동안 나머지 요청에는 이전 응답을 그대로 반환
+- 보관된 응답이 없으면 잠금을 가진 요청의 계산 결과를 잠시 기다렸다가 사용
+- X-Cache(HIT/STALE/MISS), Cache-Control 헤더 추가
+- 적중/미스/재계산 시간 카운터는 system_health_check 에서 확인
+"""
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from .cache_counters import CacheCounters
+
+# 재계산 잠금 유지 시간 (초) - 재계산 시간보다 충분히 길게
+LOCK_TIMEOUT = 30
+# 보관된 응답이 없을 때 다른 요청의 재계산을 기다리는 최대 시간과 확인 간격 (초)
+LOCK_WAIT = 2.0
+LOCK_POLL = 0.05
+
+COUNTER_NAMES = ('hits', 'stale_hits', 'misses', 'recomputes', 'recompute_ms')
+COUNTER_KEY = 'stamps:response_cache:counter:{}'
+counters = CacheCounters(COUNTER_KEY, COUNTER_NAMES)
+
+
+def get_counters():
+    """응답 캐시 카운터 (적중/이전 응답 반환/미스/재계산 횟수, 재계산 시간 합계와 평균 ms)"""
+    values = counters.values()
+    values['avg_recompute_ms'] = (
+        round(values['recompute_ms'] / values['recomputes'], 1) if values['recomputes'] else 0
+    )
+    return values
+
+
+def _replay(entry, state):
+    expires_at, status_code, content_type, content = entry
+    response = HttpResponse(content, status=status_code, content_type=content_type)
+    return _mark(response, state, max(int(expires_at - time.time()), 0))
+
+
+def _mark(response, state, max_age):
+    response['X-Cache'] = state
+    response['Cache-Control'] = f'private, max-age={max_age}'
+    return response
+
+
+def _recompute(view_func, request, args, kwargs, key, lock_key, ttl):
+    """뷰를 실행하고 성공 응답을 보관 (잠금 해제 포함)"""
+    started = time.perf_counter()
+    try:
+        response = view_func(request, *args, **kwargs)
+        if hasattr(response, 'render') and not getattr(response, 'is_rendered', True):
+            response.render()
+        if response.status_code == 200:
+            cache.set(key, (
+                time.time() + ttl,
+                response.status_code,
+                response.get('Content-Type'),
+                bytes(response.content),
+            ), ttl + settings.ADMIN_CACHE_STALE)
+    finally:
+        if lock_key:
+            cache.delete(lock_key)
+    counters.incr('recomputes')
+    counters.incr('recompute_ms', round((time.perf_counter() - started) * 1000))
+    if response.status_code != 200:
+        response['X-Cache'] = 'MISS'
+        response['Cache-Control'] = 'no-store'
+        return response
+    return _mark(response, 'MISS', int(ttl))
+
+
+def cached_response(scope, ttl=None):
+    """
+    GET 응답을 공유 캐시에 보관하는 데코레이터 (재계산은 한 요청만)
+    - ttl: 응답을 새 응답으로 보는 시간 (초, 기본값 ADMIN_CACHE_TTL)
+    - 캐시 키는 scope 와 쿼리 문자열을 포함한 경로
+    - DRF api_view 바깥에 적용해야 렌더링된 응답 본문을 보관할 수 있음
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method != 'GET':
+                return view_func(request, *args, **kwargs)
+
+            fresh_for = settings.ADMIN_CACHE_TTL if ttl is None else ttl
+            digest = hashlib.sha256(request.get_full_path().encode('utf-8')).hexdigest()
+            key = f'stamps:response_cache:{scope}:{digest}'
+            lock_key = f'{key}:lock'
+
+            entry = cache.get(key)
+            if entry is not None and entry[0] > time.time():
+                counters.incr('hits')
+                return _replay(entry, 'HIT')
+
+            counters.incr('misses')
+            if cache.add(lock_key, 1, LOCK_TIMEOUT):
+                return _recompute(view_func, request, args, kwargs, key, lock_key, fresh_for)
+            if entry is not None:
+                # 다른 요청이 재계산 중이면 이전 응답 반환
+                counters.incr('stale_hits')
+                return _replay(entry, 'STALE')
+
+            # 처음 계산 중인 요청의 결과를 기다림
+            deadline = time.monotonic() + LOCK_WAIT
+            while time.monotonic() < deadline:
+                time.sleep(LOCK_POLL)
+                entry = cache.get(key)
+                if entry is not None:
+                    return _replay(entry, 'HIT')
+            return _recompute(view_func, request, args, kwargs, key, None, fresh_for)
+        return wrapper
+    return decorator
@@ -0,0 +1,234 @@
+"""
+시간대별 부스 통계 롤업 (HourlyBoothStat)
+- 집계 기준은 stamp_records 하나: 정각(TIME_ZONE 기준) × 부스별
+  스탬프 수 / 참여자의 첫 스탬프 수 / 참여자의 목표 개수째 스탬프(완주) 수
+- 스캔 경로는 새로 저장된 스탬프의 증가분을 커밋 후(services.on_stamps_saved) UPDATE 로 반영
+  (스캔 트랜잭션이 롤업 행 잠금을 기다리지 않도록 분리)
+- (정각, 부스)마다 HOURLY_STAT_SHARDS 개 슬롯 행 중 하나를 무작위로 골라 갱신 (인기 부스 행 잠금 분산)
+- 반영에 실패한 증가분은 워커 메모리에 남겨 다음 반영 때 함께 재시도하고,
+  공유 캐시에 재계산 필요 표시(헬스 체크 rollups 항목)를 남김
+- 스탬프 삭제, 관리자 화면에서 직접 만든 기록, 재시도 전에 종료된 워커의 증가분은
+  rebuild_rollups 명령으로 기간을 지정해 재계산/검증
+"""
+import logging
+import random
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import HourlyBoothStat, StampRecord, TARGET_STAMPS
+
+logger = logging.getLogger(__name__)
+
+METRICS = ('stamps', 'first_participants', 'completions')
+
+# 반영 실패 후 전체 재계산(rebuild_rollups) 전까지 유지되는 표시
+DIRTY_KEY = 'stamps:rollups:dirty'
+
+_lock = threading.Lock()
+# 반영에 실패해 다음 반영 때 재시도할 증가분 {(정각, 부스 ID): [스탬프, 첫 스탬프, 완주]}
+_retry = {}
+_stats = {'applied': 0, 'failed': 0}
+
+
+def hour_of(value):
+    """시각이 속한 정각 (TIME_ZONE 기준)"""
+    return timezone.localtime(value).replace(minute=0, second=0, microsecond=0)
+
+
+def _counts():
+    return defaultdict(lambda: [0, 0, 0])
+
+
+def _add_stamp(counts, booth_id, stamped_at, nth):
+    """참여자의 nth 번째 스탬프 한 건을 집계에 반영"""
+    row = counts[(hour_of(stamped_at), booth_id)]
+    row[0] += 1
+    if nth == 1:
+        row[1] += 1
+    if nth == TARGET_STAMPS:
+        row[2] += 1
+
+
+def number_stamps(stamps, previous_counts):
+    """
+    새로 저장된 스탬프에 참여자별 순번을 붙임
+    stamps: [(participant_id, booth_id, stamped_at)]
+    previous_counts: {participant_id: 이번 저장 전 스탬프 수}
+    반환값: [(participant_id, booth_id, stamped_at, 참여자의 몇 번째 스탬프인지)]
+    (새 스탬프가 기존 스탬프보다 나중이라고 가정, 오프라인 스캔 시각이 더 이른 경우는 재계산으로 보정)
+    """
+    by_participant = defaultdict(list)
+    for participant_id, booth_id, stamped_at in stamps:
+        by_participant[participant_id].append((stamped_at, booth_id))
+
+    entries = []
+    for participant_id, items in by_participant.items():
+        previous = previous_counts.get(participant_id, 0)
+        for nth, (stamped_at, booth_id) in enumerate(sorted(items), start=previous + 1):
+            entries.append((participant_id, booth_id, stamped_at, nth))
+    return entries
+
+
+def record(entries):
+    """순번을 붙인 새 스탬프(number_stamps 결과)를 롤업에 반영 (커밋 후 호출)"""
+    counts = _counts()
+    for _, booth_id, stamped_at, nth in entries:
+        _add_stamp(counts, booth_id, stamped_at, nth)
+    _apply(counts)
+
+
+def _apply(counts):
+    """
+    (정각, 부스)별 증가분을 무작위 슬롯 행에 UPDATE, 행이 없으면 INSERT
+    실패한 행의 증가분은 보관해 다음 호출에서 재시도하고 재계산 필요 표시를 남김
+    """
+    with _lock:
+        for key, values in _retry.items():
+            row = counts[key]
+            for index, value in enumerate(values):
+                row[index] += value
+        _retry.clear()
+    if not counts:
+        return
+
+    failed, error = {}, None
+    for (hour, booth_id), values in counts.items():
+        try:
+            with transaction.atomic():
+                _apply_row(hour, booth_id, *values)
+        except Exception as exc:
+            failed[(hour, booth_id)], error = values, exc
+
+    with _lock:
+        _stats['applied'] += len(counts) - len(failed)
+        _stats['failed'] += len(failed)
+        for key, values in failed.items():
+            row = _retry.setdefault(key, [0, 0, 0])
+            for index, value in enumerate(values):
+                row[index] += value
+    if failed:
+        logger.error(
+            '시간대별 통계 롤업 %d행 반영 실패 (다음 반영 때 재시도, 필요 시 rebuild_rollups 로 재계산)',
+            len(failed), exc_info=error
+        )
+        try:
+            cache.set(DIRTY_KEY, True, None)
+        except Exception:
+            logger.exception('롤업 재계산 필요 표시 저장 실패')
+
+
+def _apply_row(hour, booth_id, stamps, first_participants, completions):
+    updates = {
+        'stamps': F('stamps') + stamps,
+        'first_participants': F('first_participants') + first_participants,
+        'completions': F('completions') + completions,
+    }
+    slot = random.randrange(settings.HOURLY_STAT_SHARDS)
+    rows = HourlyBoothStat.objects.filter(hour=hour, booth_id=booth_id, slot=slot)
+    if rows.update(**updates):
+        return
+    try:
+        with transaction.atomic():
+            HourlyBoothStat.objects.create(
+                hour=hour,
+                booth_id=booth_id,
+                slot=slot,
+                stamps=stamps,
+                first_participants=first_participants,
+                completions=completions,
+            )
+    except IntegrityError:
+        # 다른 워커가 먼저 행을 만든 경우
+        rows.update(**updates)
+
+
+def stats():
+    """롤업 행 반영 성공/실패 수, 재시도 대기 중인 (정각, 부스) 수, 재계산 필요 여부"""
+    with _lock:
+        result = dict(_stats)
+        result['pending_retry'] = len(_retry)
+    result['needs_rebuild'] = bool(cache.get(DIRTY_KEY))
+    return result
+
+
+def _hour_range(queryset, field, since, until):
+    if since is not None:
+        queryset = queryset.filter(**{f'{field}__gte': since})
+    if until is not None:
+        queryset = queryset.filter(**{f'{field}__lt': until})
+    return queryset
+
+
+def compute(since=None, until=None):
+    """
+    stamp_records 기준 롤업 기대값 {(정각, 부스 ID): [스탬프, 첫 스탬프, 완주]}
+    since/until 은 정각으로 맞춘 시각 (until 미포함)
+    첫 스탬프/완주 판단을 위해 구간 안에 스탬프가 있는 참여자의 전체 기록을 순서대로 읽음
+    """
+    records = StampRecord.objects.order_by('participant_id', 'stamped_at', 'id')
+    if since is not None or until is not None:
+        participant_ids = _hour_range(StampRecord.objects.all(), 'stamped_at', since, until)
+        records = records.filter(participant_id__in=participant_ids.values('participant_id'))
+
+    counts = _counts()
+    current, nth = None, 0
+    rows = records.values_list('participant_id', 'booth_id', 'stamped_at')
+    for participant_id, booth_id, stamped_at in rows.iterator(chunk_size=2000):
+        if participant_id != current:
+            current, nth = participant_id, 0
+        nth += 1
+        if (since is None or stamped_at >= since) and (until is None or stamped_at < until):
+            _add_stamp(counts, booth_id, stamped_at, nth)
+    return counts
+
+
+def stored(since=None, until=None):
+    """저장된 롤업 {(정각, 부스 ID): [스탬프, 첫 스탬프, 완주]}"""
+    rows = _hour_range(HourlyBoothStat.objects.order_by(), 'hour', since, until)
+    counts = _counts()
+    for hour, booth_id, *values in rows.values_list('hour', 'booth_id', *METRICS):
+        row = counts[(hour_of(hour), booth_id)]
+        for index, value in enumerate(values):
+            row[index] += value
+    return dict(counts)
+
+
+def verify(since=None, until=None):
+    """롤업과 stamp_records 비교 결과 불일치 목록 [(정각, 부스 ID, 기대값, 저장값)]"""
+    expected = compute(since, until)
+    actual = stored(since, until)
+    zero = [0, 0, 0]
+    mismatches = []
+    for key in sorted(expected.keys() | actual.keys()):
+        if expected.get(key, zero) != actual.get(key, zero):
+            mismatches.append((*key, expected.get(key, zero), actual.get(key, zero)))
+    return mismatches
+
+
+def rebuild(since=None, until=None):
+    """
+    구간의 롤업 행을 stamp_records 기준으로 다시 만듦 (반환값: 저장한 행 수)
+    전체 기간을 재계산하면 재계산 필요 표시를 지움
+    """
+    counts = compute(since, until)
+    with transaction.atomic():
+        _hour_range(HourlyBoothStat.objects.all(), 'hour', since, until).delete()
+        HourlyBoothStat.objects.bulk_create(
+            HourlyBoothStat(
+                hour=hour,
+                booth_id=booth_id,
+                stamps=stamps,
+                first_participants=first_participants,
+                completions=completions,
+            )
+            for (hour, booth_id), (stamps, first_participants, completions) in counts.items()
+        )
+    if since is None and until is None:
+        cache.delete(DIRTY_KEY)
+    return len(counts)
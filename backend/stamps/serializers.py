@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import Participant, Booth, StampRecord
+from .booth_registry import get_booth
 
 
 class BoothSerializer(serializers.ModelSerializer):
@@ -12,6 +13,14 @@ class BoothSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
     
     def get_participant_count(self, obj):
+        # 미리 집계한 부스별 참여자 수가 context 로 전달되면 추가 조회 없이 사용
+        participant_counts = self.context.get('participant_counts')
+        if participant_counts is not None:
+            return participant_counts.get(obj.id, 0)
+        # 쿼리셋에서 with_participant_count() 로 annotate 한 경우
+        annotated = getattr(obj, 'participant_count', None)
+        if annotated is not None:
+            return annotated
         return obj.get_participant_count()
 
 
@@ -27,7 +36,11 @@ class StampRecordSerializer(serializers.ModelSerializer):
 
 
 class ParticipantSerializer(serializers.ModelSerializer):
-    """참여자 정보 serializer"""
+    """
+    참여자 정보 serializer
+    - stamp_records 는 services.participants_with_stamps() 로 미리 불러오고
+      부스별 참여자 수는 context['participant_counts'] 로 전달하면 쿼리 수가 일정
+    """
     stamp_count = serializers.SerializerMethodField()
     stamp_records = StampRecordSerializer(many=True, read_only=True)
     
@@ -53,34 +66,30 @@ class ParticipantCreateSerializer(serializers.ModelSerializer):
 
 
 class StampCreateSerializer(serializers.Serializer):
-    """스탬프 생성용 serializer"""
+    """
+    스탬프 생성용 serializer
+    - 참여자는 한 번만 조회하고, 부스는 부스 레지스트리(워커 메모리 캐시)에서 확인
+    - 확인한 객체는 validated_data['participant'], validated_data['booth'] 로 전달
+    """
     participant_id = serializers.UUIDField(help_text="참여자 UUID")
     booth_code = serializers.CharField(max_length=20, help_text="부스 코드")
     
-    def validate_participant_id(self, value):
-        """참여자 ID 유효성 검증"""
-        try:
-            Participant.objects.get(id=value)
-        except Participant.DoesNotExist:
-            raise serializers.ValidationError("존재하지 않는 참여자입니다.")
-        return value
-    
-    def validate_booth_code(self, value):
-        """부스 코드 유효성 검증"""
-        try:
-            booth = Booth.objects.get(code=value, is_active=True)
-        except Booth.DoesNotExist:
-            raise serializers.ValidationError("존재하지 않거나 비활성화된 부스입니다.")
-        return value
-    
     def validate(self, attrs):
-        """중복 스탬프 검증"""
-        participant = Participant.objects.get(id=attrs['participant_id'])
-        booth = Booth.objects.get(code=attrs['booth_code'])
+        """참여자/부스 유효성 및 중복 스탬프 검증"""
+        participant = Participant.objects.filter(id=attrs['participant_id']).first()
+        if participant is None:
+            raise serializers.ValidationError({'participant_id': "존재하지 않는 참여자입니다."})
+        
+        booth = get_booth(attrs['booth_code'])
+        if booth is None:
+            raise serializers.ValidationError({'booth_code': "존재하지 않거나 비활성화된 부스입니다."})
         
-        if StampRecord.objects.filter(participant=participant, booth=booth).exists():
+        # 방문 비트맵으로 중복 확인 (비트맵 범위 밖 부스만 기록 조회)
+        if participant.has_visited(booth):
             raise serializers.ValidationError("이미 이 부스에서 스탬프를 받았습니다.")
         
+        attrs['participant'] = participant
+        attrs['booth'] = booth
         return attrs
 
 
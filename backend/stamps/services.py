@@ -0,0 +1,415 @@
+import base64
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch, Q, Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Participant, StampRecord, BoothCounterShard, TARGET_STAMPS
+from .booth_registry import get_booth, get_active_booths, booth_registry, visit_bit_for
+from .serializers import BoothSerializer
+from .booth_load import record_booth_scan
+from . import rollups, live_events
+from .booth_tokens import resolve_booth_code, InvalidBoothToken
+
+
+@dataclass
+class ScanResult:
+    """스캔 처리 결과"""
+    participant: Participant
+    booth: object
+    created: bool
+    is_new_participant: bool
+    stamp_count: int
+    completed_mission: bool = False  # 이 스캔으로 미션을 완료했는지 여부
+
+
+def _parse_participant_id(participant_id):
+    """참여자 ID 문자열을 UUID로 변환 (형식 오류 시 None)"""
+    if not participant_id:
+        return None
+    if isinstance(participant_id, uuid.UUID):
+        return participant_id
+    try:
+        return uuid.UUID(str(participant_id))
+    except (TypeError, ValueError):
+        return None
+
+
+def record_scan(booth, participant_id=None, ip_address=None, user_agent=''):
+    """
+    QR 스캔 한 건을 하나의 트랜잭션으로 처리
+    - 참여자 조회(행 잠금) 또는 생성
+    - 중복 여부는 방문 비트맵 또는 unique_together 위반으로 판단
+    - 스탬프 수/방문 비트맵은 F() 로 갱신되어 COUNT 조회가 필요 없음
+    - 스탬프가 새로 생긴 경우에만 완주 처리
+    """
+    parsed_id = _parse_participant_id(participant_id)
+
+    with transaction.atomic():
+        participant = None
+        if parsed_id:
+            participant = (
+                Participant.objects.select_for_update()
+                .filter(id=parsed_id)
+                .first()
+            )
+        is_new_participant = participant is None
+        if is_new_participant:
+            participant = Participant.objects.create()
+
+        if not is_new_participant and participant.has_visited(booth):
+            # 잠긴 참여자 행의 방문 비트맵으로 중복 판단 (추가 조회 없음)
+            created = False
+        else:
+            try:
+                # 중복 스탬프는 제약 조건 위반으로 감지 (세이브포인트로 트랜잭션 보존)
+                with transaction.atomic():
+                    record = StampRecord(
+                        participant=participant,
+                        booth=booth,
+                        ip_address=ip_address,
+                        user_agent=user_agent or '',
+                    )
+                    record.save(check_completion=False)
+                created = True
+            except IntegrityError:
+                created = False
+
+        stamp_count = participant.stamp_count
+
+        # 잠긴 행의 스탬프 수가 목표에 도달한 경우에만 조건부 UPDATE
+        completed_mission = False
+        if created and stamp_count >= TARGET_STAMPS and not participant.is_completed:
+            completed_mission = participant.mark_completed()
+
+        if created:
+            on_stamps_saved(
+                [(participant.id, booth.id, record.stamped_at)],
+                {participant.id: stamp_count - 1},
+            )
+
+    if created:
+        record_booth_scan(booth.id)
+
+    return ScanResult(
+        participant=participant,
+        booth=booth,
+        created=created,
+        is_new_participant=is_new_participant,
+        stamp_count=stamp_count,
+        completed_mission=completed_mission,
+    )
+
+
+def on_stamps_saved(stamps, previous_counts):
+    """
+    새로 저장된 스탬프의 커밋 후 처리: 시간대별 롤업 반영, 대시보드 실시간 이벤트 발행
+    stamps: [(participant_id, booth_id, stamped_at)]
+    previous_counts: {participant_id: 이번 저장 전 스탬프 수}
+    """
+    entries = rollups.number_stamps(stamps, previous_counts)
+    if entries:
+        transaction.on_commit(lambda: _stamps_committed(entries))
+
+
+def _stamps_committed(entries):
+    rollups.record(entries)
+    live_events.publish_stamps(entries)
+
+
+# 배치 동기화 항목 결과 상태
+BATCH_STAMPED = 'stamped'
+BATCH_DUPLICATE = 'duplicate'
+BATCH_INVALID_BOOTH = 'invalid_booth'
+BATCH_INVALID_TOKEN = 'invalid_token'
+INVALID_TOKEN = object()
+
+
+def _resolve_batch_booth(item):
+    """배치 항목의 부스 (서명 토큰 검증 실패 시 INVALID_TOKEN)"""
+    try:
+        booth_code = resolve_booth_code(item.get('booth_code'), item.get('booth_token'))
+    except InvalidBoothToken:
+        return INVALID_TOKEN
+    return get_booth(booth_code)
+
+
+def _parse_scanned_at(value, now, earliest):
+    """
+    오프라인 스캔 시각 (없거나 형식 오류면 현재 시각)
+    미래 시각은 현재 시각으로, earliest 보다 이른 시각은 earliest 로 맞춤
+    """
+    try:
+        scanned_at = parse_datetime(value) if isinstance(value, str) else None
+    except ValueError:
+        # 형식은 맞지만 범위를 벗어난 값 (예: 13월)
+        scanned_at = None
+    if scanned_at is None:
+        return now
+    if timezone.is_naive(scanned_at):
+        scanned_at = timezone.make_aware(scanned_at)
+    return max(min(scanned_at, now), earliest)
+
+
+def record_scan_batch(items, participant_id=None, ip_address=None, user_agent=''):
+    """
+    오프라인에서 모아 둔 스캔 여러 건을 한 번에 처리
+    - 부스 검증은 부스 레지스트리, 중복 판단은 잠긴 참여자 행의 방문 비트맵으로 처리
+    - 스탬프는 bulk_create(ignore_conflicts=True) 한 번으로 저장하고, 다시 읽어 실제로 저장된 행만
+      부스 카운터/롤업에 반영 (다른 요청과 겹쳐 무시된 행은 중복으로 응답)
+    - 스캔 시각은 OFFLINE_SCAN_MAX_AGE_HOURS 이내, 기존 참여자는 참여자 생성 시각 이후로 제한
+    - 진행 현황/완주 처리는 배치당 한 번 (배치 크기와 무관하게 쿼리 수 일정)
+    반환값: (참여자, 신규 참여자 여부, 항목별 결과 목록)
+    """
+    parsed_id = _parse_participant_id(participant_id)
+    now = timezone.now()
+
+    with transaction.atomic():
+        participant = None
+        if parsed_id:
+            participant = (
+                Participant.objects.select_for_update()
+                .filter(id=parsed_id)
+                .first()
+            )
+        is_new_participant = participant is None
+        if is_new_participant:
+            participant = Participant.objects.create()
+
+        earliest = now - timedelta(hours=settings.OFFLINE_SCAN_MAX_AGE_HOURS)
+        if not is_new_participant:
+            earliest = max(earliest, min(participant.created_at, now))
+
+        # 비트맵 범위 밖 부스만 기존 기록 조회
+        booths = [_resolve_batch_booth(item) for item in items]
+        unmapped_ids = {
+            booth.id for booth in booths
+            if booth not in (None, INVALID_TOKEN) and not booth.visit_bit
+        }
+        visited_unmapped = set()
+        if unmapped_ids and not is_new_participant:
+            visited_unmapped = set(
+                participant.stamp_records.filter(booth_id__in=unmapped_ids)
+                .values_list('booth_id', flat=True)
+            )
+
+        results = []
+        records = []
+        record_results = {}
+        seen_booth_ids = set()
+        for item, booth in zip(items, booths):
+            result = {'client_nonce': item.get('client_nonce'), 'booth_code': item.get('booth_code')}
+            results.append(result)
+            if booth is INVALID_TOKEN:
+                result['status'] = BATCH_INVALID_TOKEN
+                continue
+            if booth is None:
+                result['status'] = BATCH_INVALID_BOOTH
+                continue
+            if (
+                booth.id in seen_booth_ids
+                or participant.visited_booths & booth.visit_bit
+                or booth.id in visited_unmapped
+            ):
+                result['status'] = BATCH_DUPLICATE
+                continue
+            seen_booth_ids.add(booth.id)
+            result['status'] = BATCH_STAMPED
+            record_results[booth.id] = result
+            records.append(StampRecord(
+                participant=participant,
+                booth=booth,
+                stamped_at=_parse_scanned_at(item.get('scanned_at'), now, earliest),
+                ip_address=ip_address,
+                user_agent=user_agent or '',
+            ))
+
+        if records:
+            previous_count = participant.stamp_count
+            StampRecord.objects.bulk_create(records, ignore_conflicts=True)
+            # 무시된 행은 먼저 저장된 다른 기록이 남아 있으므로 획득 시간으로 구분
+            stored = dict(
+                StampRecord.objects.filter(participant=participant, booth_id__in=record_results)
+                .values_list('booth_id', 'stamped_at')
+            )
+            inserted = []
+            for record in records:
+                if stored.get(record.booth_id) == record.stamped_at:
+                    inserted.append(record)
+                else:
+                    record_results[record.booth_id]['status'] = BATCH_DUPLICATE
+            records = inserted
+            BoothCounterShard.add_many({record.booth_id: 1 for record in records})
+            participant = sync_participant_progress([participant.id])[participant.id]
+            on_stamps_saved(
+                [(participant.id, record.booth_id, record.stamped_at) for record in records],
+                {participant.id: previous_count},
+            )
+
+    for record in records:
+        record_booth_scan(record.booth_id, at=record.stamped_at.timestamp())
+
+    return participant, is_new_participant, results
+
+
+def sync_participant_progress(participant_ids):
+    """
+    지정한 참여자들의 진행 현황을 stamp_records 기준으로 일괄 재계산
+    - 대량 삽입(bulk_create) 후 스탬프 수/방문 비트맵/완주 상태 반영용
+    - 완주 시간은 목표 개수째 스탬프의 획득 시간
+    """
+    participant_ids = set(participant_ids)
+    if not participant_ids:
+        return {}
+
+    progress = {}
+    records = (
+        StampRecord.objects.filter(participant_id__in=participant_ids)
+        .order_by('stamped_at')
+        .values_list('participant_id', 'booth_id', 'stamped_at')
+    )
+    for participant_id, booth_id, stamped_at in records:
+        count, bitmap, completed_at = progress.get(participant_id, (0, 0, None))
+        count += 1
+        if count == TARGET_STAMPS:
+            completed_at = stamped_at
+        progress[participant_id] = (count, bitmap | visit_bit_for(booth_id), completed_at)
+
+    participants = list(
+        Participant.objects.filter(id__in=participant_ids)
+        .only('id', 'stamp_count', 'visited_booths', 'is_completed', 'completed_at')
+    )
+    for participant in participants:
+        count, bitmap, completed_at = progress.get(participant.id, (0, 0, None))
+        participant.stamp_count = count
+        participant.visited_booths = bitmap
+        if count >= TARGET_STAMPS and not participant.is_completed:
+            participant.is_completed = True
+            participant.completed_at = completed_at
+
+    Participant.objects.bulk_update(
+        participants,
+        ['stamp_count', 'visited_booths', 'is_completed', 'completed_at']
+    )
+    return {participant.id: participant for participant in participants}
+
+
+def booth_participant_counts(booth_ids):
+    """부스별 참여자 수(분산 카운터 슬롯 합계)를 한 번의 GROUP BY 쿼리로 집계 (BoothSerializer context 용)"""
+    booth_ids = set(booth_ids)
+    if not booth_ids:
+        return {}
+    rows = (
+        BoothCounterShard.objects.filter(booth_id__in=booth_ids)
+        .order_by()
+        .values('booth_id')
+        .annotate(count=Sum('count'))
+    )
+    return {row['booth_id']: row['count'] for row in rows}
+
+
+def participants_with_stamps():
+    """스탬프 기록과 부스를 미리 불러오는 참여자 쿼리셋 (ParticipantSerializer 용)"""
+    return Participant.objects.prefetch_related(
+        Prefetch(
+            'stamp_records',
+            queryset=StampRecord.objects.select_related('booth').order_by('-stamped_at')
+        )
+    )
+
+
+# 기념품 대상자 목록 페이지 크기 (기본값, 최대값)
+GIFT_PAGE_SIZE = 200
+GIFT_PAGE_MAX = 1000
+
+
+class InvalidCursor(ValueError):
+    """형식이 올바르지 않은 페이지 커서"""
+
+
+def encode_completion_cursor(participant):
+    """완주자 목록 커서: (완주 시간, 참여자 ID) 를 URL 에 넣을 수 있는 문자열로"""
+    raw = f'{participant.completed_at.isoformat()}|{participant.id}'
+    return base64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii').rstrip('=')
+
+
+def decode_completion_cursor(cursor):
+    """커서 문자열 → (완주 시간, 참여자 UUID)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('ascii')
+        completed_at, participant_id = raw.split('|')
+        completed_at = parse_datetime(completed_at)
+        participant_id = uuid.UUID(participant_id)
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidCursor(cursor)
+    if completed_at is None:
+        raise InvalidCursor(cursor)
+    return completed_at, participant_id
+
+
+def completed_participants():
+    """
+    완주자 (기념품 대상자)
+    completed_at 은 완주 처리 시 is_completed 와 함께 기록되므로 completed_at 만으로 조회하여
+    완주 색인(completed_at, id)을 범위 조회로 사용 (불리언 is_completed 조건은 색인을 타지 못함)
+    """
+    return Participant.objects.filter(completed_at__isnull=False)
+
+
+def gift_eligible_page(after=None, limit=GIFT_PAGE_SIZE):
+    """
+    완주자 한 페이지 ((completed_at, id) 키셋 페이지네이션, 방문 기록/부스는 미리 불러옴)
+    - after: 이전 페이지의 다음 커서, 그 이후 완주자만 조회 (새 완주자만 받는 증분 조회에도 사용)
+    - 오프라인 동기화처럼 완주 시간이 과거로 기록된 완주자는 증분 조회에서 빠질 수 있으므로
+      화면은 주기적으로 처음부터 다시 조회
+    반환값: (참여자 목록, 다음 커서, 다음 페이지 존재 여부)
+    """
+    queryset = (
+        completed_participants()
+        .order_by('completed_at', 'id')
+        .prefetch_related(Prefetch(
+            'stamp_records',
+            queryset=StampRecord.objects.select_related('booth').order_by('stamped_at')
+        ))
+    )
+    if after:
+        completed_at, participant_id = decode_completion_cursor(after)
+        # 선행 범위 조건(completed_at >=)을 따로 두어 완주 색인 범위 조회가 되도록 함
+        queryset = queryset.filter(completed_at__gte=completed_at).filter(
+            Q(completed_at__gt=completed_at) | Q(id__gt=participant_id)
+        )
+
+    participants = list(queryset[:limit + 1])
+    has_more = len(participants) > limit
+    participants = participants[:limit]
+    next_cursor = encode_completion_cursor(participants[-1]) if participants else after
+    return participants, next_cursor, has_more
+
+
+BOOTH_SNAPSHOT_KEY = 'stamps:booth_snapshot:{}'
+
+
+def active_booth_snapshot():
+    """
+    활성 부스 직렬화 결과(참여자 수 포함) 스냅샷
+    - 공유 캐시에 BOOTH_SNAPSHOT_TTL 초 동안 보관 (참여자 수 최대 반영 지연)
+    - 캐시 키에 부스 레지스트리 버전을 포함하여 부스 변경 시 바로 교체
+    - 반환값은 공유되는 목록이므로 항목을 수정하려면 복사해서 사용
+    """
+    key = BOOTH_SNAPSHOT_KEY.format(booth_registry.version())
+    snapshot = cache.get(key)
+    if snapshot is None:
+        booths = get_active_booths()
+        counts = booth_participant_counts(booth.id for booth in booths)
+        snapshot = [
+            dict(data) for data in
+            BoothSerializer(booths, many=True, context={'participant_counts': counts}).data
+        ]
+        cache.set(key, snapshot, settings.BOOTH_SNAPSHOT_TTL)
+    return snapshot
@@ -0,0 +1,60 @@
+"""
+모델 시그널
+- 스탬프 기록 삭제는 인스턴스 delete() 뿐 아니라 관리자 일괄 삭제(QuerySet.delete()),
+  참여자/부스 삭제에 따른 연쇄 삭제로도 일어나므로 post_delete 시그널에서 비정규화 값을 갱신
+- 부스 참여자 수는 삭제 작업마다 한 번에 갱신: 한 작업의 pre_delete 는 모두 실제 DELETE 전에,
+  post_delete 는 모두 DELETE 후에 같은 트랜잭션 안에서 전송되므로 pre_delete 에서 부스를 모아 두고
+  첫 post_delete 에서 부스별 감소분을 add_many 한 번으로 반영
+"""
+import threading
+
+from django.db.models.signals import pre_delete, post_delete
+from django.dispatch import receiver
+
+from .booth_registry import visit_bit_for
+from .models import Participant, Booth, StampRecord, BoothCounterShard
+
+# 삭제 작업(origin)별로 모은 삭제 대상 스탬프 기록 {id(origin): (origin, {기록 ID: 부스 ID})}
+_pending = threading.local()
+
+
+def _deleting(origin, model):
+    """삭제를 시작한 인스턴스/쿼리셋이 model 인지 여부"""
+    return isinstance(origin, model) or getattr(origin, 'model', None) is model
+
+
+def _pending_records():
+    records = getattr(_pending, 'records', None)
+    if records is None:
+        records = _pending.records = {}
+    return records
+
+
+@receiver(pre_delete, sender=StampRecord)
+def stamp_record_deleting(sender, instance, origin=None, **kwargs):
+    """삭제될 스탬프 기록의 부스를 삭제 작업별로 모아 둠"""
+    if _deleting(origin, Booth):
+        # 부스가 삭제되는 경우는 카운터 슬롯도 함께 삭제됨
+        return
+    pending = _pending_records()
+    entry = pending.get(id(origin))
+    if entry is None or entry[0] is not origin or instance.pk in entry[1]:
+        # 새 삭제 작업 (같은 origin 으로 실패 후 다시 삭제하는 경우 포함)
+        entry = pending[id(origin)] = (origin, {})
+    entry[1][instance.pk] = instance.booth_id
+
+
+@receiver(post_delete, sender=StampRecord)
+def stamp_record_deleted(sender, instance, origin=None, **kwargs):
+    """삭제된 스탬프를 참여자 진행 현황(스탬프 수, 방문 비트맵)과 부스 참여자 수에서 제외"""
+    if not _deleting(origin, Participant):
+        # 참여자 자체가 삭제되는 경우는 갱신할 행이 없음
+        Participant.remove_stamp(instance.participant_id, visit_bit_for(instance.booth_id))
+
+    entry = _pending_records().pop(id(origin), None)
+    if entry is not None:
+        # 삭제 작업의 첫 post_delete: 부스별 감소분을 한 번에 반영
+        deltas = {}
+        for booth_id in entry[1].values():
+            deltas[booth_id] = deltas.get(booth_id, 0) - 1
+        BoothCounterShard.add_many(deltas)
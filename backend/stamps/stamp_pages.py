@@ -0,0 +1,59 @@
+"""
+QR 링크(stamp_view) HTML 페이지
+- 공통 틀(CSS, 레이아웃)은 stamps/stamp_shell.html 을 프로세스당 한 번 렌더링해 앞/뒤 바이트로 보관
+- 요청마다 참여자별 진행 상황 조각(stamps/stamp_progress.html)만 렌더링
+- 오류 페이지는 메시지별로 한 번 렌더링한 바이트를 재사용
+  (요청 값이나 예외 내용은 페이지에 넣지 않음)
+"""
+from functools import lru_cache
+
+from django.http import HttpResponse
+from django.template.loader import get_template, render_to_string
+
+from .models import TARGET_STAMPS
+
+CONTENT_MARKER = '<!--stamp-content-->'
+CONTENT_TYPE = 'text/html; charset=utf-8'
+
+# 오류/안내 메시지 (stamp_view 에서 사용)
+MISSING_BOOTH = '부스 코드가 포함된 유효한 QR 링크가 아닙니다.'
+MISSING_BOOTH_HINT = '예: /stamp?booth=art1'
+UNKNOWN_BOOTH = '존재하지 않거나 비활성화된 부스입니다.'
+SCAN_FAILED = 'QR 처리 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.'
+
+
+@lru_cache(maxsize=None)
+def _shell():
+    """공통 틀의 (본문 앞, 본문 뒤) 바이트"""
+    head, tail = render_to_string('stamps/stamp_shell.html').split(CONTENT_MARKER)
+    return head.encode('utf-8'), tail.encode('utf-8')
+
+
+@lru_cache(maxsize=64)
+def _error_page(message, hint):
+    return render_to_string('stamps/stamp_error.html', {'message': message, 'hint': hint}).encode('utf-8')
+
+
+def error_response(message, status=200, hint=''):
+    """캐시된 오류 페이지 응답 (message 는 코드에 정의된 고정 문구만 사용)"""
+    return HttpResponse(_error_page(message, hint), status=status, content_type=CONTENT_TYPE)
+
+
+def progress_response(message, stamp_count, is_completed, visited_booths, total_booths):
+    """
+    스탬프 진행 상황 페이지 응답
+    visited_booths: [{'name', 'code', 'stamped_at'(표시용 문자열)}] 방문 순서대로
+    """
+    fragment = get_template('stamps/stamp_progress.html').render({
+        'message': message,
+        'is_completed': is_completed,
+        'stamp_count': stamp_count,
+        'target_stamps': TARGET_STAMPS,
+        'remaining_stamps': max(TARGET_STAMPS - stamp_count, 0),
+        'progress_percentage': min((stamp_count / TARGET_STAMPS) * 100, 100),
+        'stamp_icons': '✅' * min(stamp_count, TARGET_STAMPS) + '⭕' * max(TARGET_STAMPS - stamp_count, 0),
+        'total_booths': total_booths,
+        'visited_booths': visited_booths,
+    })
+    head, tail = _shell()
+    return HttpResponse(b''.join((head, fragment.encode('utf-8'), tail)), content_type=CONTENT_TYPE)
@@ -0,0 +1,79 @@
+"""
+관리자 통계 집계
+- 원본 테이블 대신 시간대별 부스 롤업(HourlyBoothStat, stamps.rollups)을 합산
+  (행 수가 참여자/스탬프 수가 아닌 시간 × 부스 수에 비례)
+- 참여자 수(total_participants)는 스탬프를 하나 이상 받은 참여자 수 (첫 스탬프 기준, 스탬프 없이 발급만 된 ID 는 제외)
+- 완주자 수(completed_participants)는 목표 개수째 스탬프 기준
+- 기념품 대상자 수(gift_eligible_count)는 기념품 대상자 목록과 같은 기준인 완주 시각(completed_at, 색인)으로 계산
+- 시간대별 현황은 TIME_ZONE(Asia/Seoul) 기준 정각 단위 버킷, 기록이 없는 시간은 0으로 채움
+"""
+from datetime import timedelta
+
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Booth, HourlyBoothStat
+from .services import completed_participants
+
+HOURLY_BUCKETS = 24
+
+
+def summary():
+    """전체 참여자 수 / 완주자 수 (롤업 집계 쿼리) / 기념품 대상자 수 (완주 색인 COUNT)"""
+    counts = HourlyBoothStat.objects.aggregate(
+        total=Coalesce(Sum('first_participants'), 0),
+        completed=Coalesce(Sum('completions'), 0),
+    )
+    total, completed = counts['total'], counts['completed']
+    return {
+        'total_participants': total,
+        'completed_participants': completed,
+        'completion_rate': round((completed / total * 100) if total > 0 else 0, 1),
+        'gift_eligible_count': completed_participants().count(),
+    }
+
+
+def booth_popularity():
+    """활성 부스별 참여자 수와 인기 순위 (한 번의 GROUP BY 쿼리)"""
+    booths = (
+        Booth.objects.filter(is_active=True)
+        .annotate(participant_count=Coalesce(Sum('hourly_stats__stamps'), 0))
+        .order_by('-participant_count', 'code')
+    )
+    return [
+        {
+            'booth_code': booth.code,
+            'booth_name': booth.name,
+            'participant_count': booth.participant_count,
+            'popularity_rank': rank,
+        }
+        for rank, booth in enumerate(booths, start=1)
+    ]
+
+
+def hour_buckets(now=None, hours=HOURLY_BUCKETS):
+    """현재 시각이 포함된 정각부터 거슬러 올라간 hours 개의 버킷 시작 시각 (오래된 순, TIME_ZONE 기준)"""
+    current = timezone.localtime(now or timezone.now()).replace(minute=0, second=0, microsecond=0)
+    return [current - timedelta(hours=offset) for offset in range(hours - 1, -1, -1)]
+
+
+def hourly_statistics(now=None, hours=HOURLY_BUCKETS):
+    """시간대별 신규 참여자/스탬프 수 (한 번의 GROUP BY 쿼리, 빈 시간은 0)"""
+    buckets = hour_buckets(now, hours)
+    rows = (
+        HourlyBoothStat.objects.filter(hour__gte=buckets[0])
+        .order_by()
+        .values('hour')
+        .annotate(participants=Sum('first_participants'), stamps=Sum('stamps'))
+    )
+    counts = {row['hour']: row for row in rows}
+    empty = {'participants': 0, 'stamps': 0}
+    return [
+        {
+            'hour': bucket.strftime('%H:00'),
+            'new_participants': counts.get(bucket, empty)['participants'],
+            'stamps_collected': counts.get(bucket, empty)['stamps'],
+        }
+        for bucket in buckets
+    ]
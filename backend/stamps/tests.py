@@ -1,3 +1,1641 @@
-from django.test import TestCase
+import asyncio
+import csv
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from io import StringIO
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import DatabaseError, connection
+from django.test import TestCase, TransactionTestCase, override_settings, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .admin import EstimatedCountPaginator
+from .models import (
+    Participant, Booth, StampRecord, HourlyBoothStat, BoothCounterShard, EventSequence, TARGET_STAMPS
+)
+from .services import record_scan, record_scan_batch, encode_completion_cursor
+from .booth_registry import BoothRegistry, booth_registry
+from .booth_load import BoothLoadIndex, booth_load
+from .ingest import StampIngestor, replay_orphaned_segments, write_batch
+from .participant_token import COOKIE_NAME
+from .participant_ids import uuid7
+from . import stamp_pages, statistics, rollups, live_events
+from .booth_tokens import make_booth_token, verify_booth_token, InvalidBoothToken
+from .checks import check_atomic_cache
+
+
+def create_booths(count, prefix='BOOTH'):
+    """테스트용 부스 생성 (부스 레지스트리/혼잡도 색인 초기화 포함)"""
+    booths = [
+        Booth.objects.create(code=f'{prefix}{i:03d}', name=f'부스 {i}')
+        for i in range(1, count + 1)
+    ]
+    # 롤백된 이전 테스트의 부스 ID가 재사용될 수 있으므로 공유 캐시도 비움
+    cache.clear()
+    booth_load.reset()
+    booth_registry.invalidate()
+    return booths
+
+
+def prepare_scan_budget(booth):
+    """
+    쿼리 수가 일정하도록 현재 시간대 롤업 슬롯 행과 이벤트 순번 행을 미리 만들고
+    부스 레지스트리를 채운 뒤 대시보드 구독 상태로 둠
+    """
+    hour = rollups.hour_of(timezone.now())
+    HourlyBoothStat.objects.bulk_create(
+        HourlyBoothStat(hour=hour, booth=booth, slot=slot) for slot in range(settings.HOURLY_STAT_SHARDS)
+    )
+    EventSequence.objects.get_or_create(name=live_events.SEQUENCE_NAME)
+    booth_registry.active_booths()
+    cache.set(live_events.LISTENING_KEY, True)
+
+
+class ScanServiceTests(TestCase):
+    """스캔 서비스 (record_scan) 테스트"""
+
+    # 트랜잭션 시작/종료 + 참여자 조회 + 세이브포인트/INSERT/진행 현황 UPDATE/부스 카운터 UPDATE/해제 + 완주 UPDATE
+    # + 커밋 후 롤업 UPDATE (트랜잭션 시작/종료 포함)
+    # + 대시보드 구독 중이면 이벤트 순번 발급 (트랜잭션 시작/UPDATE/조회/종료)
+    MAX_SCAN_QUERIES = 9 + 3 + 4
+
+    def setUp(self):
+        self.booths = create_booths(TARGET_STAMPS + 1)
+
+    def test_new_participant_is_created_with_first_stamp(self):
+        result = record_scan(self.booths[0])
+
+        self.assertTrue(result.created)
+        self.assertTrue(result.is_new_participant)
+        self.assertEqual(result.stamp_count, 1)
+        self.assertEqual(StampRecord.objects.count(), 1)
+
+    def test_invalid_participant_id_creates_new_participant(self):
+        result = record_scan(self.booths[0], participant_id='not-a-uuid')
+
+        self.assertTrue(result.is_new_participant)
+        self.assertEqual(Participant.objects.count(), 1)
+
+    def test_duplicate_scan_is_detected_by_constraint(self):
+        first = record_scan(self.booths[0])
+        second = record_scan(self.booths[0], participant_id=first.participant.id)
+
+        self.assertFalse(second.created)
+        self.assertFalse(second.is_new_participant)
+        self.assertEqual(second.stamp_count, 1)
+        self.assertEqual(StampRecord.objects.count(), 1)
+
+    def test_completion_on_target_stamp(self):
+        participant = Participant.objects.create()
+        for booth in self.booths[:TARGET_STAMPS]:
+            result = record_scan(booth, participant_id=participant.id)
+
+        self.assertEqual(result.stamp_count, TARGET_STAMPS)
+        self.assertTrue(result.participant.is_completed)
+        participant.refresh_from_db()
+        self.assertTrue(participant.is_completed)
+        self.assertIsNotNone(participant.completed_at)
+
+    def test_scan_query_budget(self):
+        participant = Participant.objects.create()
+        for booth in self.booths[:TARGET_STAMPS - 1]:
+            record_scan(booth, participant_id=participant.id)
+        prepare_scan_budget(self.booths[TARGET_STAMPS - 1])
+
+        # 완주 처리가 일어나는 스캔 (커밋 후 처리 포함)
+        with self.assertNumQueries(self.MAX_SCAN_QUERIES), self.captureOnCommitCallbacks(execute=True):
+            record_scan(self.booths[TARGET_STAMPS - 1], participant_id=participant.id)
+
+        # 중복 스캔은 트랜잭션 시작/종료 + 참여자 조회만
+        with self.assertNumQueries(3), self.captureOnCommitCallbacks(execute=True):
+            record_scan(self.booths[0], participant_id=participant.id)
+
+
+class ParticipantIdTests(TestCase):
+    """시간 순 참여자 ID / BINARY(16) 저장 테스트"""
+
+    def test_uuid7_is_time_ordered(self):
+        now_ms = time.time() * 1000
+        ids = [uuid7() for _ in range(5000)]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertTrue(all(value.version == 7 and value.variant == uuid.RFC_4122 for value in ids))
+        # 앞 48비트는 밀리초 타임스탬프
+        self.assertLess(abs((ids[0].int >> 80) - now_ms), 1000)
+
+    def test_new_participants_get_v7_ids(self):
+        create_booths(1)
+        self.assertEqual(Participant.objects.create().id.version, 7)
+        response = APIClient().post('/api/scan/', {'booth_code': 'BOOTH001'}, format='json')
+        self.assertEqual(uuid.UUID(response.json()['data']['participant_id']).version, 7)
+
+    @override_settings(PARTICIPANT_ID_BINARY=True)
+    def test_binary_storage_on_mysql(self):
+        mysql = mock.Mock(vendor='mysql')
+        field = Participant._meta.pk
+        value = uuid7()
+        self.assertEqual(field.db_type(mysql), 'binary(16)')
+        self.assertEqual(StampRecord._meta.get_field('participant').db_type(mysql), 'binary(16)')
+        self.assertEqual(field.get_db_prep_value(value, mysql), value.bytes)
+        self.assertEqual(field.from_db_value(value.bytes, None, mysql), value)
+        # MySQL 외 DB 는 설정과 무관하게 기존 UUID 저장 형식
+        self.assertEqual(field.get_db_prep_value(value, connection), value.hex)
+        self.assertEqual(Participant.objects.get(id=Participant.objects.create(id=value).id).id, value)
+
+
+class ParticipantProgressTests(TestCase):
+    """참여자 비정규화 진행 현황 테스트"""
+
+    def setUp(self):
+        self.booths = create_booths(3)
+        self.participant = Participant.objects.create()
+
+    def test_stamp_updates_count_and_bitmap(self):
+        for booth in self.booths[:2]:
+            StampRecord.objects.create(participant=self.participant, booth=booth)
+
+        self.participant.refresh_from_db()
+        self.assertEqual(self.participant.stamp_count, 2)
+        self.assertTrue(self.participant.has_visited(self.booths[0]))
+        self.assertTrue(self.participant.has_visited(self.booths[1]))
+        self.assertFalse(self.participant.has_visited(self.booths[2]))
+
+    def test_delete_updates_count_and_bitmap(self):
+        record = StampRecord.objects.create(participant=self.participant, booth=self.booths[0])
+        record.delete()
+
+        self.participant.refresh_from_db()
+        self.assertEqual(self.participant.stamp_count, 0)
+        self.assertEqual(self.participant.visited_booths, 0)
+
+    def test_visit_slot_does_not_depend_on_booth_id(self):
+        # ID가 비트맵 크기를 넘는 부스도 빈 슬롯을 배정받아 비트맵으로 처리
+        Booth.objects.filter(pk=self.booths[2].pk).delete()
+        late = Booth.objects.create(id=1000, code='LATE', name='늦게 추가된 부스')
+        self.assertEqual(late.visit_slot, self.booths[2].visit_slot)
+        self.assertTrue(late.visit_bit)
+
+        StampRecord.objects.create(participant=self.participant, booth=late)
+        self.participant.refresh_from_db()
+        self.assertEqual(self.participant.visited_booths, late.visit_bit)
+        self.assertTrue(self.participant.has_visited(late))
+        self.assertFalse(self.participant.has_visited(self.booths[0]))
+
+    def test_reused_visit_slot_clears_stale_bits(self):
+        record = StampRecord.objects.create(participant=self.participant, booth=self.booths[2])
+        bit = self.booths[2].visit_bit
+        # 시그널 없이 기록이 지워져 비트가 남은 상황에서 부스 삭제
+        StampRecord.objects.filter(pk=record.pk)._raw_delete(StampRecord.objects.db)
+        self.booths[2].delete()
+        self.participant.refresh_from_db()
+        self.assertEqual(self.participant.visited_booths, bit)
+
+        replacement = Booth.objects.create(code='NEW', name='새 부스')
+        self.assertEqual(replacement.visit_bit, bit)
+        self.participant.refresh_from_db()
+        self.assertFalse(self.participant.has_visited(replacement))
+
+    def test_admin_bulk_delete_allows_rescan(self):
+        records = [StampRecord.objects.create(participant=self.participant, booth=booth) for booth in self.booths[:2]]
+        admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(admin_user)
+        response = self.client.post('/admin/stamps/stamprecord/', {
+            'action': 'delete_selected',
+            '_selected_action': [record.pk for record in records],
+            'post': 'yes',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(StampRecord.objects.exists())
+
+        self.participant.refresh_from_db()
+        self.assertEqual((self.participant.stamp_count, self.participant.visited_booths), (0, 0))
+        # 삭제된 부스를 다시 스캔하면 중복이 아닌 새 스탬프
+        result = record_scan(self.booths[0], self.participant.id)
+        self.assertTrue(result.created)
+        self.assertEqual(result.stamp_count, 1)
+
+    def test_rebuild_progress_command(self):
+        for booth in self.booths:
+            StampRecord.objects.create(participant=self.participant, booth=booth)
+        Participant.objects.filter(pk=self.participant.pk).update(stamp_count=0, visited_booths=0)
+
+        with self.assertRaises(CommandError):
+            call_command('rebuild_progress', '--verify', stdout=StringIO())
+
+        call_command('rebuild_progress', stdout=StringIO())
+        call_command('rebuild_progress', '--verify', stdout=StringIO())
+        self.participant.refresh_from_db()
+        self.assertEqual(self.participant.stamp_count, 3)
+
+    def test_completion_is_single_conditional_update(self):
+        booths = create_booths(TARGET_STAMPS, prefix='GOAL')
+        for booth in booths[:-1]:
+            StampRecord.objects.create(participant=self.participant, booth=booth)
+
+        with CaptureQueriesContext(connection) as ctx:
+            record = StampRecord.objects.create(participant=self.participant, booth=booths[-1])
+        self.assertTrue(record.completed_mission)
+        completion = [q['sql'] for q in ctx.captured_queries if 'is_completed' in q['sql']]
+        self.assertEqual(len(completion), 1)
+        self.assertTrue(completion[0].startswith('UPDATE'))
+        # 완주 후 스탬프는 완주 처리 UPDATE 를 다시 보내지 않음
+        with CaptureQueriesContext(connection) as ctx:
+            record = StampRecord.objects.create(participant=self.participant, booth=self.booths[0])
+        self.assertFalse(record.completed_mission)
+        self.assertFalse(any('is_completed' in q['sql'] for q in ctx.captured_queries))
+
+
+@skipUnlessDBFeature('test_db_allows_multiple_connections')
+class CompletionConcurrencyTests(TransactionTestCase):
+    """동시 스캔 시 완주 처리 테스트 (스레드마다 별도 DB 연결 필요)"""
+
+    def test_parallel_stamps_complete_exactly_once(self):
+        booths = create_booths(TARGET_STAMPS + 3)
+        participant = Participant.objects.create()
+        barrier = threading.Barrier(len(booths))
+        outcomes = []
+        errors = []
+
+        def stamp(booth):
+            try:
+                # 각 스레드가 오래된 참여자 사본으로 동시에 저장
+                stale = Participant.objects.get(pk=participant.pk)
+                barrier.wait()
+                record = StampRecord.objects.create(participant=stale, booth=booth)
+                outcomes.append(record.completed_mission)
+            except Exception as e:  # pragma: no cover - 실패 원인 보고용
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=stamp, args=(booth,)) for booth in booths]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(outcomes.count(True), 1)
+        participant.refresh_from_db()
+        self.assertEqual(participant.stamp_count, len(booths))
+        self.assertTrue(participant.is_completed)
+        self.assertIsNotNone(participant.completed_at)
+
+
+class ScanApiTests(TestCase):
+    """QR 스캔 API 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.booths = create_booths(TARGET_STAMPS)
+
+    def test_scan_and_duplicate(self):
+        response = self.client.post('/api/scan/', {'booth_code': 'BOOTH001'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        participant_id = response.json()['data']['participant_id']
+
+        response = self.client.post(
+            '/api/scan/',
+            {'booth_code': 'BOOTH001', 'participant_id': participant_id},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['data']['stamp_count'], 1)
+
+    def test_scan_query_budget(self):
+        participant = Participant.objects.create()
+        booth_registry.active_booths()
+        prepare_scan_budget(Booth.objects.get(code='BOOTH001'))
+        with CaptureQueriesContext(connection) as ctx, self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                '/api/scan/',
+                {'booth_code': 'BOOTH001', 'participant_id': str(participant.id)},
+                format='json'
+            )
+        self.assertEqual(response.status_code, 201)
+        # 부스 조회는 레지스트리에서 처리되어 스캔 서비스 쿼리만 발생
+        self.assertLessEqual(len(ctx.captured_queries), ScanServiceTests.MAX_SCAN_QUERIES)
+        self.assertFalse(any('"booths"' in q['sql'] for q in ctx.captured_queries))
+
+    def test_create_stamp_query_budget(self):
+        participant = Participant.objects.create()
+        booth_registry.active_booths()
+        data = {'participant_id': str(participant.id), 'booth_code': 'BOOTH001'}
+
+        # 참여자 조회 + 스탬프 INSERT + 진행 현황 UPDATE + 부스 카운터 UPDATE (목표 미달이면 완주 처리 없음)
+        with self.assertNumQueries(4):
+            response = self.client.post('/api/stamps/', data, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['data']['stamp_count'], 1)
+
+        # 중복은 방문 비트맵으로 판단 (참여자 조회 1회)
+        with self.assertNumQueries(1):
+            response = self.client.post('/api/stamps/', data, format='json')
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post('/api/stamps/', {**data, 'booth_code': 'NOPE'}, format='json')
+        self.assertIn('booth_code', response.json()['errors'])
+
+    def test_stamp_view_uses_progress_cookie(self):
+        self.client.get('/stamp', {'booth': 'BOOTH001'})
+        response = self.client.get('/stamp', {'booth': 'BOOTH002'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Participant.objects.count(), 1)
+        self.assertEqual(StampRecord.objects.count(), 2)
+        # DB 기반 세션을 쓰지 않음
+        self.assertNotIn('sessionid', self.client.cookies)
+        self.assertIn(COOKIE_NAME, response.cookies)
+
+    def test_repeat_scan_and_progress_page_without_queries(self):
+        self.client.get('/stamp', {'booth': 'BOOTH001'})
+        self.client.get('/stamp', {'booth': 'BOOTH002'})
+        booth_registry.active_booths()
+
+        with CaptureQueriesContext(connection) as ctx:
+            duplicate = self.client.get('/stamp', {'booth': 'BOOTH001'})
+            progress = self.client.get('/stamp')
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertContains(duplicate, '이미 부스 1에서 스탬프를 받았습니다.')
+        self.assertContains(progress, '2 / 5')
+
+    def test_stamp_page_escapes_and_hides_input(self):
+        response = self.client.get('/stamp', {'booth': '<script>alert(1)</script>'})
+        self.assertContains(response, stamp_pages.UNKNOWN_BOOTH)
+        self.assertNotContains(response, '<script>')
+
+        Booth.objects.filter(code='BOOTH001').update(name='<b>부스</b>')
+        booth_registry.invalidate()
+        response = self.client.get('/stamp', {'booth': 'BOOTH001'})
+        self.assertContains(response, '&lt;b&gt;부스&lt;/b&gt;에서 스탬프를 받았습니다!')
+        self.assertContains(response, 'width: 20.0%')
+        self.assertEqual(response.content.count(b'<html'), 1)
+
+    def test_tampered_progress_cookie_is_ignored(self):
+        self.client.get('/stamp', {'booth': 'BOOTH001'})
+        self.client.cookies[COOKIE_NAME] = self.client.cookies[COOKIE_NAME].value + 'x'
+
+        response = self.client.get('/stamp', {'booth': 'BOOTH001'})
+        self.assertEqual(response.status_code, 200)
+        # 위조 쿠키는 무시되어 새 참여자로 처리
+        self.assertEqual(Participant.objects.count(), 2)
+
+
+class SerializerQueryCountTests(TestCase):
+    """부스/참여자 조회 API 쿼리 수 테스트 (N+1 방지)"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def stamped_participant(self, booths):
+        participant = Participant.objects.create()
+        for booth in booths:
+            StampRecord.objects.create(participant=participant, booth=booth)
+        return participant
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response.json()['data']
+
+    def test_booth_list_is_constant(self):
+        counts = []
+        for total in (3, 10):
+            Booth.objects.all().delete()
+            booths = create_booths(total)
+            self.stamped_participant(booths[:2])
+            booth_registry.active_booths()
+            queries, data = self.count_queries('/api/booths/')
+            counts.append(queries)
+            self.assertEqual([b['participant_count'] for b in data[:3]], [1, 1, 0])
+        self.assertEqual(counts[0], counts[1])
+
+    def test_participant_endpoints_are_constant(self):
+        booths = create_booths(8)
+        booth_registry.active_booths()
+        for url in ('/api/participants/{}/', '/api/participants/{}/stats/'):
+            counts = []
+            for stamps in (1, 6):
+                participant = self.stamped_participant(booths[:stamps])
+                queries, data = self.count_queries(url.format(participant.id))
+                counts.append(queries)
+                self.assertEqual(data['stamp_count'], stamps)
+            self.assertEqual(counts[0], counts[1], url)
+
+    def test_booth_management_list_uses_annotation(self):
+        booths = create_booths(4)
+        self.stamped_participant(booths[:1])
+        queries, data = self.count_queries('/api/admin/booths/')
+        self.assertEqual(queries, 1)
+        self.assertEqual(data[0]['participant_count'], 1)
+
+
+class AdminChangelistTests(TestCase):
+    """Django 관리자 목록 쿼리 수 / 추정 행 수 페이지네이터 테스트"""
+
+    def setUp(self):
+        self.booths = create_booths(3)
+        admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(admin_user)
+
+    def add_participants(self, total):
+        for _ in range(total):
+            participant = Participant.objects.create()
+            for booth in self.booths[:2]:
+                StampRecord.objects.create(participant=participant, booth=booth)
+
+    def test_changelists_are_constant(self):
+        for url in ('/admin/stamps/participant/', '/admin/stamps/booth/', '/admin/stamps/stamprecord/'):
+            counts = []
+            for total in (2, 10):
+                self.add_participants(total)
+                with CaptureQueriesContext(connection) as ctx:
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                counts.append(len(ctx.captured_queries))
+            self.assertEqual(counts[0], counts[1], url)
+
+    def test_estimated_count_for_unfiltered_list(self):
+        self.add_participants(3)
+        with mock.patch.object(connection, 'vendor', 'mysql'), \
+                mock.patch.object(EstimatedCountPaginator, '_estimated_count', return_value=2500000):
+            self.assertEqual(EstimatedCountPaginator(Participant.objects.order_by('-created_at'), 100).count, 2500000)
+            # 필터가 있으면 정확한 COUNT(*)
+            filtered = Participant.objects.filter(is_completed=False)
+            self.assertEqual(EstimatedCountPaginator(filtered, 100).count, 3)
+
+        with mock.patch.object(connection, 'vendor', 'mysql'), \
+                mock.patch.object(EstimatedCountPaginator, '_estimated_count', return_value=40):
+            # 작은 테이블은 추정값 대신 정확한 값
+            self.assertEqual(EstimatedCountPaginator(Participant.objects.all(), 100).count, 3)
+
+        # MySQL 외 DB 는 항상 정확한 값
+        self.assertEqual(EstimatedCountPaginator(Participant.objects.all(), 100).count, 3)
+
+
+@override_settings(ADMIN_CACHE_TTL=0)
+class QueryPlanTests(TestCase):
+    """
+    주요 API 쿼리 실행 계획 테스트 (EXPLAIN)
+    참여자/스탬프 기록 테이블을 색인 없이 전체 읽는 쿼리가 생기면 실패
+    (전체 데이터를 읽는 헬스 체크 COUNT, 내보내기는 제외)
+    """
+    LARGE_TABLES = {'participants', 'stamp_records'}
+
+    def setUp(self):
+        self.client = APIClient()
+        self.booths = create_booths(TARGET_STAMPS)
+        self.participants = []
+        for n in range(30):
+            participant = Participant.objects.create()
+            for booth in self.booths[:n % TARGET_STAMPS + 1]:
+                StampRecord.objects.create(participant=participant, booth=booth)
+            self.participants.append(participant)
+        rollups.rebuild()
+        admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.admin_client = APIClient()
+        self.admin_client.force_login(admin_user)
+
+    def is_large_table(self, name):
+        # 서브쿼리 별칭(U0 등)은 원본 테이블을 알 수 없으므로 대형 테이블로 간주
+        return name.strip('"`') in self.LARGE_TABLES or re.fullmatch(r'U\d+', name) is not None
+
+    def full_scans(self, sql):
+        """쿼리 실행 계획에서 색인 없이 전체를 읽는 대형 테이블 목록"""
+        with connection.cursor() as cursor:
+            if connection.vendor == 'mysql':
+                cursor.execute('EXPLAIN ' + sql)
+                columns = [column[0] for column in cursor.description]
+                plan = [dict(zip(columns, row)) for row in cursor.fetchall()]
+                return [row['table'] for row in plan if row['type'] == 'ALL' and self.is_large_table(row['table'])]
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql)
+            scans = []
+            for *_, detail in cursor.fetchall():
+                match = re.match(r'SCAN (?:TABLE )?(\S+)(.*)', detail)
+                if match and 'USING' not in match.group(2) and self.is_large_table(match.group(1)):
+                    scans.append(match.group(1))
+            return scans
+
+    def assert_no_full_scans(self, label, call):
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            call()
+        selects = [q['sql'] for q in ctx.captured_queries if q['sql'].lstrip().upper().startswith('SELECT')]
+        self.assertTrue(selects, label)
+        for sql in selects:
+            with self.subTest(label, sql=sql):
+                self.assertEqual(self.full_scans(sql), [])
+
+    @skipUnless(connection.vendor in ('sqlite', 'mysql'), 'SQLite/MySQL 실행 계획만 해석')
+    def test_hot_queries_use_indexes(self):
+        participant = self.participants[-1]
+        completed = Participant.objects.filter(is_completed=True).order_by('completed_at', 'id')
+        self.assertTrue(completed.exists())
+        hour = rollups.hour_of(timezone.now())
+        cases = {
+            'scan': lambda: self.client.post(
+                '/api/scan/', {'booth_code': 'BOOTH002', 'participant_id': str(self.participants[0].id)}, format='json'
+            ),
+            'participant': lambda: self.client.get(f'/api/participants/{participant.id}/'),
+            'participant stats': lambda: self.client.get(f'/api/participants/{participant.id}/stats/'),
+            'participant detail': lambda: self.client.get(f'/api/participants/{participant.id}/detail/'),
+            'booth list': lambda: self.client.get('/api/booths/'),
+            'gift eligible': lambda: self.client.get('/api/admin/gift-eligible/'),
+            'gift eligible since': lambda: self.client.get(
+                '/api/admin/gift-eligible/', {'after': encode_completion_cursor(completed[0])}
+            ),
+            'statistics': lambda: self.client.get('/api/admin/statistics/'),
+            'booth management': lambda: self.client.get('/api/admin/booths/'),
+            'rollup verify': lambda: rollups.verify(hour, hour + timedelta(hours=1)),
+            'participant admin': lambda: self.admin_client.get('/admin/stamps/participant/'),
+            'stamp record admin': lambda: self.admin_client.get('/admin/stamps/stamprecord/'),
+        }
+        for label, call in cases.items():
+            self.assert_no_full_scans(label, call)
+
+
+class ParticipantDetailTests(TestCase):
+    """참여자 상세 API 테스트"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        self.client = APIClient()
+        self.booths = create_booths(20)
+        self.participant = Participant.objects.create()
+        for booth in (self.booths[4], self.booths[1]):
+            StampRecord.objects.create(participant=self.participant, booth=booth)
+        self.url = f'/api/participants/{self.participant.id}/detail/'
+
+    def test_two_queries_with_warm_snapshot(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        data = response.json()['data']
+        self.assertEqual([b['booth']['code'] for b in data['visited_booths']], ['BOOTH002', 'BOOTH005'])
+        visited = [b['code'] for b in data['all_booths'] if b['visited']]
+        self.assertEqual(visited, ['BOOTH002', 'BOOTH005'])
+        self.assertTrue(all('stamped_at' in b for b in data['all_booths'] if b['visited']))
+        self.assertEqual(len(data['all_booths']), 20)
+
+    def test_inactive_visited_booth_is_kept(self):
+        Booth.objects.filter(pk=self.booths[4].pk).update(is_active=False)
+        booth_registry.invalidate()
+
+        data = self.client.get(self.url).json()['data']
+        self.assertEqual(len(data['all_booths']), 19)
+        self.assertEqual(data['visited_booths'][1]['booth']['participant_count'], 1)
+
+
+class AdminStatisticsTests(TestCase):
+    """관리자 통계 집계 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_query_count_is_constant(self):
+        counts = []
+        for total in (3, 12):
+            Booth.objects.all().delete()
+            booths = create_booths(total)
+            participant = Participant.objects.create()
+            for booth in booths[:2]:
+                StampRecord.objects.create(participant=participant, booth=booth)
+            rollups.rebuild()
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get('/api/admin/statistics/')
+            counts.append(len(ctx.captured_queries))
+            booth_stats = response.json()['data']['booth_statistics']
+            self.assertEqual(len(booth_stats), total)
+            self.assertEqual([b['participant_count'] for b in booth_stats[:3]], [1, 1, 0])
+            self.assertEqual([b['popularity_rank'] for b in booth_stats[:3]], [1, 2, 3])
+        self.assertEqual(counts[0], counts[1])
+
+    def test_gift_eligible_count_follows_completion_time(self):
+        # 롤업에 반영되지 않은 완주 (관리자 화면에서 직접 수정 등)
+        Participant.objects.create(stamp_count=TARGET_STAMPS, is_completed=True, completed_at=timezone.now())
+
+        summary = statistics.summary()
+        self.assertEqual(summary['gift_eligible_count'], 1)
+        self.assertEqual(summary['total_participants'], 0)
+
+    def test_hourly_buckets_align_to_seoul_hours(self):
+        seoul = ZoneInfo('Asia/Seoul')
+        now = datetime(2025, 9, 27, 14, 35, tzinfo=seoul)
+        booths = create_booths(4)
+        participant, other = Participant.objects.create(), Participant.objects.create()
+        for person, booth, stamped_at in zip((participant, participant, participant, other), booths, (
+            datetime(2025, 9, 27, 13, 5, tzinfo=seoul),
+            datetime(2025, 9, 27, 13, 55, tzinfo=seoul),
+            datetime(2025, 9, 27, 10, 0, tzinfo=seoul),
+            datetime(2025, 9, 26, 14, 10, tzinfo=seoul),  # 집계 구간 밖
+        )):
+            StampRecord.objects.create(participant=person, booth=booth, stamped_at=stamped_at)
+        rollups.rebuild()
+
+        hourly = statistics.hourly_statistics(now=now)
+        self.assertEqual(len(hourly), 24)
+        self.assertEqual((hourly[0]['hour'], hourly[-1]['hour']), ('15:00', '14:00'))
+        stamps = {row['hour']: row['stamps_collected'] for row in hourly}
+        self.assertEqual((stamps['13:00'], stamps['10:00'], stamps['12:00']), (2, 1, 0))
+        self.assertEqual(sum(stamps.values()), 3)
+        # 신규 참여자는 첫 스탬프 시간대 기준
+        participants = {row['hour']: row['new_participants'] for row in hourly}
+        self.assertEqual((participants['10:00'], participants['13:00']), (1, 0))
+
+
+class RollupTests(TestCase):
+    """시간대별 부스 통계 롤업 테스트"""
+
+    def setUp(self):
+        self.booths = create_booths(TARGET_STAMPS + 1)
+
+    def totals(self):
+        summary = statistics.summary()
+        return summary['total_participants'], summary['completed_participants']
+
+    def test_scans_update_rollups_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            participant_id = None
+            for booth in self.booths[:TARGET_STAMPS]:
+                participant_id = record_scan(booth, participant_id=participant_id).participant.id
+            record_scan(self.booths[0], participant_id=participant_id)  # 중복
+            record_scan_batch([{'booth_code': booth.code} for booth in self.booths[:2]])
+
+        self.assertEqual(self.totals(), (2, 1))
+        self.assertEqual(statistics.booth_popularity()[0]['participant_count'], 2)
+        self.assertEqual(rollups.verify(), [])
+
+    def test_write_batch_replay_is_not_counted_twice(self):
+        participant_id = '11111111-1111-1111-1111-111111111111'
+        items = [
+            {
+                'participant_id': participant_id,
+                'booth_id': booth.id,
+                'stamped_at': timezone.now().isoformat(),
+                'new_participant': True,
+            }
+            for booth in self.booths[:TARGET_STAMPS]
+        ]
+        for _ in range(2):
+            with self.captureOnCommitCallbacks(execute=True):
+                write_batch(items)
+
+        self.assertEqual(self.totals(), (1, 1))
+        self.assertEqual(rollups.verify(), [])
+
+    def test_failed_rollup_update_is_retried_and_flagged(self):
+        with mock.patch('stamps.rollups._apply_row', side_effect=DatabaseError('lock wait timeout')), \
+                self.assertLogs('stamps.rollups', 'ERROR'):
+            with self.captureOnCommitCallbacks(execute=True):
+                record_scan(self.booths[0])
+        self.assertEqual(self.totals(), (0, 0))
+        self.assertEqual(rollups.stats()['pending_retry'], 1)
+        self.assertTrue(rollups.stats()['needs_rebuild'])
+
+        # 다음 반영 때 실패한 증가분을 함께 반영
+        with self.captureOnCommitCallbacks(execute=True):
+            record_scan(self.booths[1])
+        self.assertEqual(self.totals(), (2, 0))
+        self.assertEqual(rollups.stats()['pending_retry'], 0)
+        self.assertEqual(rollups.verify(), [])
+
+        rollups.rebuild()
+        self.assertFalse(rollups.stats()['needs_rebuild'])
+
+    def test_rebuild_command_recomputes_and_verifies_range(self):
+        seoul = ZoneInfo('Asia/Seoul')
+        participant = Participant.objects.create()
+        for hour, booth in zip((9, 10, 11), self.booths):
+            StampRecord.objects.create(
+                participant=participant, booth=booth,
+                stamped_at=datetime(2025, 9, 27, hour, 30, tzinfo=seoul),
+            )
+
+        # 직접 저장된 기록은 롤업에 없음
+        with self.assertRaises(CommandError):
+            call_command('rebuild_rollups', '--verify', stdout=StringIO())
+
+        call_command('rebuild_rollups', '--since', '2025-09-27T10:00', '--until', '2025-09-27T10:30', stdout=StringIO())
+        row = HourlyBoothStat.objects.get()
+        self.assertEqual((rollups.hour_of(row.hour).hour, row.stamps, row.first_participants), (10, 1, 0))
+
+        call_command('rebuild_rollups', stdout=StringIO())
+        call_command('rebuild_rollups', '--verify', stdout=StringIO())
+        self.assertEqual(HourlyBoothStat.objects.count(), 3)
+
+        HourlyBoothStat.objects.filter(booth=self.booths[0]).update(stamps=5)
+        with self.assertRaises(CommandError):
+            call_command('rebuild_rollups', '--verify', '--since', '2025-09-27', stdout=StringIO())
+        call_command('rebuild_rollups', '--verify', '--since', '2025-09-27T10:00', stdout=StringIO())
+
+
+class LiveEventTests(TestCase):
+    """관리자 대시보드 실시간 이벤트 테스트"""
+
+    def setUp(self):
+        self.booths = create_booths(TARGET_STAMPS)
+
+    def published(self):
+        last = EventSequence.current(live_events.SEQUENCE_NAME)
+        keys = [live_events.EVENT_KEY.format(seq) for seq in range(1, last + 1)]
+        return [cache.get(key) for key in keys]
+
+    def test_scans_without_dashboard_skip_sequence(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            record_scan(self.booths[0])
+        self.assertEqual(EventSequence.current(live_events.SEQUENCE_NAME), 0)
+
+    def test_scans_publish_deltas_after_commit(self):
+        # 다른 워커에 구독 중인 대시보드가 있는 상태
+        cache.set(live_events.LISTENING_KEY, True)
+        with self.captureOnCommitCallbacks(execute=True):
+            participant_id = None
+            for booth in self.booths:
+                participant_id = record_scan(booth, participant_id=participant_id).participant.id
+            record_scan(self.booths[0], participant_id=participant_id)  # 중복은 이벤트 없음
+
+        events = self.published()
+        self.assertEqual(
+            [event['type'] for event in events],
+            ['participant'] + ['stamp'] * TARGET_STAMPS + ['completion']
+        )
+        self.assertEqual([event['booth_code'] for event in events[1:-1]], [b.code for b in self.booths])
+        self.assertEqual([event['id'] for event in events], list(range(1, TARGET_STAMPS + 3)))
+
+    def test_sequence_ranges_do_not_overlap(self):
+        self.assertEqual(EventSequence.allocate('test', 3), 3)
+        self.assertEqual(EventSequence.allocate('test', 2), 5)
+        self.assertEqual(live_events.publish([{'type': 'stamp'}, {'type': 'stamp'}]), 2)
+        self.assertEqual([event['id'] for event in self.published()], [1, 2])
+
+    @override_settings(LIVE_EVENT_POLL=0.01)
+    async def test_hub_fans_out_one_read_to_all_subscribers(self):
+        hub = live_events.EventHub()
+        await sync_to_async(live_events.publish)([{'type': 'stamp', 'booth_code': 'BOOTH001'}])
+        subscribers = [await hub.subscribe() for _ in range(3)]
+        self.assertEqual(hub.subscriber_count, 3)
+        self.assertTrue(await cache.aget(live_events.LISTENING_KEY))
+
+        await sync_to_async(live_events.publish)([{'type': 'stamp', 'booth_code': 'BOOTH002'}])
+        received = [await subscriber.next(timeout=2) for subscriber, _ in subscribers]
+        self.assertEqual([event['booth_code'] for event in received], ['BOOTH002'] * 3)
+        self.assertEqual(received[0]['id'], 2)
+
+        # 재연결 시 Last-Event-ID 이후 이벤트를 먼저 전달
+        subscriber, backlog = await hub.subscribe(after=0)
+        self.assertEqual([event['id'] for event in backlog], [1, 2])
+        for subscriber, _ in subscribers + [(subscriber, None)]:
+            hub.unsubscribe(subscriber)
+
+    async def test_stream_endpoint(self):
+        await sync_to_async(live_events.publish)([{'type': 'completion', 'booth_code': 'BOOTH005'}])
+        response = await self.async_client.get('/api/admin/stream/', headers={'Last-Event-ID': '0'})
+        self.assertEqual(response['Content-Type'], 'text/event-stream; charset=utf-8')
+
+        chunks = []
+
+        async def consume():
+            async for chunk in response.streaming_content:
+                chunks.append(chunk)
+
+        # 대시보드 연결 종료는 ASGI 서버가 스트림 작업을 취소하는 것으로 재현
+        task = asyncio.create_task(consume())
+        for _ in range(200):
+            if len(chunks) >= 2:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        self.assertEqual(chunks[0], b'retry: 3000\n\n')
+        message = chunks[1].decode('utf-8')
+        self.assertTrue(message.startswith('id: 1\nevent: completion\ndata: '))
+        self.assertEqual(json.loads(message.split('data: ')[1])['booth_code'], 'BOOTH005')
+        self.assertEqual(live_events.event_hub.subscriber_count, 0)
+
+    def test_stream_requires_asgi(self):
+        response = APIClient().get('/api/admin/stream/')
+        self.assertEqual(response.status_code, 503)
+
+
+class ResponseCacheTests(TestCase):
+    """관리자 조회 API 응답 캐시 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        create_booths(2)
+
+    def test_fresh_response_is_served_from_cache(self):
+        first = self.client.get('/api/admin/statistics/')
+        self.assertEqual((first['X-Cache'], first['Cache-Control']), ('MISS', 'private, max-age=5'))
+
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/admin/statistics/')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.content, first.content)
+
+        # 쿼리 문자열이 다르면 별도 항목
+        self.assertEqual(self.client.get('/api/admin/statistics/?view=all')['X-Cache'], 'MISS')
+
+    @override_settings(ADMIN_CACHE_TTL=0)
+    def test_stale_response_while_another_request_recomputes(self):
+        digest = hashlib.sha256(b'/api/admin/gift-eligible/').hexdigest()
+        lock_key = f'stamps:response_cache:gift_eligible:{digest}:lock'
+        self.client.get('/api/admin/gift-eligible/')
+        self.assertIsNone(cache.get(lock_key))
+
+        # 다른 워커가 재계산 중인 상태
+        cache.add(lock_key, 1, 30)
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/admin/gift-eligible/')
+        self.assertEqual(response['X-Cache'], 'STALE')
+        self.assertEqual(response.json()['data']['total_eligible'], 0)
+
+    def test_health_check_probes_database_every_request(self):
+        self.client.get('/api/admin/health-check/')
+        # 기본 통계는 캐시, DB 연결 확인은 매번 실행
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/admin/health-check/')
+        self.assertEqual([q['sql'] for q in ctx.captured_queries], ['SELECT 1'])
+        self.assertEqual(response.json()['data']['database'], 'OK')
+
+        with mock.patch('stamps.views.connection.cursor', side_effect=DatabaseError('gone away')):
+            response = self.client.get('/api/admin/health-check/')
+        self.assertEqual(response.status_code, 500)
+        self.assertFalse(response.json()['success'])
+
+    def test_counters_in_health_check(self):
+        self.client.get('/api/admin/statistics/')
+        self.client.get('/api/admin/statistics/')
+        counters = self.client.get('/api/admin/health-check/').json()['data']['response_cache']
+        # 헬스 체크 자체는 응답 캐시를 거치지 않음
+        self.assertEqual((counters['hits'], counters['misses'], counters['recomputes']), (1, 1, 1))
+
+
+@override_settings(ADMIN_CACHE_TTL=0)
+class GiftEligibleTests(TestCase):
+    """기념품 대상자 목록 (미리 불러오기, 키셋 페이지네이션) 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.booths = create_booths(TARGET_STAMPS)
+        self.start = timezone.now() - timedelta(hours=1)
+
+    def finish(self, minutes):
+        """minutes 분에 완주한 참여자 생성"""
+        participant = Participant.objects.create()
+        for booth in self.booths:
+            StampRecord.objects.create(participant=participant, booth=booth)
+        Participant.objects.filter(id=participant.id).update(
+            is_completed=True, completed_at=self.start + timedelta(minutes=minutes)
+        )
+        return str(participant.id)
+
+    def fetch(self, **params):
+        response = self.client.get('/api/admin/gift-eligible/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data']
+
+    def test_query_count_is_constant(self):
+        counts = []
+        for total in (2, 6):
+            for minute in range(total):
+                self.finish(minute)
+            with CaptureQueriesContext(connection) as ctx:
+                data = self.fetch()
+            counts.append(len(ctx.captured_queries))
+            self.assertTrue(all(len(p['visited_booths']) == TARGET_STAMPS for p in data['participants']))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_pages_follow_completion_order(self):
+        # 같은 시각에 완주한 참여자도 빠짐없이 나뉘어야 함
+        expected = [self.finish(minute // 2) for minute in range(5)]
+        collected, cursor = [], None
+        while True:
+            data = self.fetch(limit=2, **({'after': cursor} if cursor else {}))
+            collected.extend(p['participant_id'] for p in data['participants'])
+            cursor = data['next_cursor']
+            if not data['has_more']:
+                break
+        self.assertEqual(sorted(collected), sorted(expected))
+        self.assertEqual(len(collected), len(set(collected)))
+        self.assertEqual(data['total_eligible'], 5)
+
+    def test_incremental_fetch_returns_only_new_completions(self):
+        self.finish(0)
+        cursor = self.fetch()['next_cursor']
+        self.assertEqual(self.fetch(after=cursor)['participants'], [])
+
+        newcomer = self.finish(5)
+        data = self.fetch(after=cursor)
+        self.assertEqual([p['participant_id'] for p in data['participants']], [newcomer])
+        self.assertNotEqual(data['next_cursor'], cursor)
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/admin/gift-eligible/', {'after': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+
+class ExportTests(TestCase):
+    """스탬프 기록 / 참여자 내보내기 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+        self.booths = create_booths(3)
+        self.participants = [Participant.objects.create() for _ in range(2)]
+        for participant in self.participants:
+            for booth in self.booths:
+                StampRecord.objects.create(participant=participant, booth=booth)
+
+    def test_requires_staff_login(self):
+        self.client.logout()
+        response = self.client.get('/api/admin/export/stamps.csv')
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('/admin/login/', response['Location'])
+
+        self.client.force_login(User.objects.create_user('visitor', 'visitor@example.com', 'password'))
+        self.assertEqual(self.client.get('/api/admin/export/participants.ndjson').status_code, 302)
+
+    def export(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response, b''.join(response.streaming_content)
+
+    @override_settings(EXPORT_CHUNK_SIZE=4)
+    def test_ndjson_is_read_in_chunks(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response, body = self.export('/api/admin/export/stamps.ndjson')
+        # 6행 / 청크 4행 → 쿼리 2개 (로그인 세션 조회 제외)
+        self.assertEqual(len([q for q in ctx.captured_queries if '"stamp_records"' in q['sql']]), 2)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        rows = [json.loads(line) for line in body.decode('utf-8').splitlines()]
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(len({row['id'] for row in rows}), 6)
+        self.assertEqual(rows[0]['booth_code'], 'BOOTH001')
+        self.assertEqual(rows[0]['participant_id'], str(StampRecord.objects.order_by('id')[0].participant_id))
+
+    def test_gzip_csv(self):
+        response, body = self.export('/api/admin/export/participants.csv', gzip='1')
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertIn('participants.csv.gz', response['Content-Disposition'])
+        rows = list(csv.reader(StringIO(gzip.decompress(body).decode('utf-8-sig'))))
+        self.assertEqual(rows[0], ['id', 'created_at', 'is_completed', 'completed_at', 'stamp_count'])
+        self.assertEqual(sorted(row[0] for row in rows[1:]), sorted(str(p.id) for p in self.participants))
+        self.assertEqual({row[4] for row in rows[1:]}, {'3'})
+
+    def test_since_filter(self):
+        StampRecord.objects.filter(booth=self.booths[0]).update(stamped_at=timezone.now() - timedelta(days=2))
+        since = (timezone.now() - timedelta(days=1)).isoformat()
+        _, body = self.export('/api/admin/export/stamps.ndjson', since=since)
+        self.assertEqual(len(body.splitlines()), 4)
+
+        response = self.client.get('/api/admin/export/stamps.csv', {'since': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
+
+
+class BoothCounterTests(TestCase):
+    """부스 참여자 수 분산 카운터 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.booths = create_booths(3)
+
+    def test_slots_are_created_with_booth(self):
+        self.assertEqual(
+            BoothCounterShard.objects.filter(booth=self.booths[0]).count(),
+            settings.BOOTH_COUNTER_SHARDS
+        )
+
+    def test_counts_follow_every_write_path(self):
+        booth = self.booths[0]
+        for _ in range(20):
+            record_scan(booth)
+        record_scan_batch([{'booth_code': booth.code}, {'booth_code': self.booths[1].code}])
+        items = [{
+            'participant_id': '22222222-2222-2222-2222-222222222222',
+            'booth_id': booth.id,
+            'stamped_at': timezone.now().isoformat(),
+            'new_participant': True,
+        }]
+        write_batch(items)
+        write_batch(items)  # 재적재는 다시 세지 않음
+        StampRecord.objects.filter(booth=booth).first().delete()
+
+        booth = Booth.objects.get(pk=booth.pk)
+        self.assertEqual(booth.get_participant_count(), 21)
+        self.assertEqual(booth.get_participant_count(), booth.stamp_records.count())
+        # 증가가 여러 슬롯에 분산됨
+        self.assertGreater(BoothCounterShard.objects.filter(booth=booth, count__gt=0).count(), 1)
+        call_command('rebuild_progress', '--verify', stdout=StringIO())
+
+    def test_bulk_and_cascade_deletes_decrement_counts(self):
+        booth, other = self.booths[0], self.booths[1]
+        participants = [record_scan(booth).participant for _ in range(6)]
+        for participant in participants[:3]:
+            record_scan(other, participant.id)
+
+        StampRecord.objects.filter(participant__in=participants[:2], booth=booth).delete()
+        Participant.objects.filter(pk=participants[2].pk).delete()
+        for target in (booth, other):
+            target = Booth.objects.get(pk=target.pk)
+            self.assertEqual(target.get_participant_count(), target.stamp_records.count())
+        self.assertEqual(Booth.objects.get(pk=booth.pk).get_participant_count(), 3)
+
+        # 부스 삭제 시 연쇄 삭제된 스탬프는 슬롯을 다시 만들지 않음
+        Booth.objects.filter(pk=other.pk).delete()
+        self.assertFalse(BoothCounterShard.objects.filter(booth_id=other.pk).exists())
+        call_command('rebuild_progress', '--verify', stdout=StringIO())
+
+    def test_bulk_delete_updates_counter_once(self):
+        booth, other = self.booths[0], self.booths[1]
+        participants = [record_scan(booth).participant for _ in range(5)]
+        for participant in participants[:2]:
+            record_scan(other, participant.id)
+
+        with CaptureQueriesContext(connection) as ctx:
+            StampRecord.objects.filter(participant__in=participants[:3]).delete()
+        shard_updates = [
+            q['sql'] for q in ctx.captured_queries
+            if q['sql'].startswith('UPDATE "booth_counter_shards"')
+        ]
+        self.assertEqual(len(shard_updates), 1)
+        self.assertEqual(Booth.objects.get(pk=booth.pk).get_participant_count(), 2)
+        self.assertEqual(Booth.objects.get(pk=other.pk).get_participant_count(), 0)
+
+        # 참여자 삭제로 연쇄 삭제된 스탬프도 한 번에 반영
+        record_scan(other, participants[3].id)
+        with CaptureQueriesContext(connection) as ctx:
+            Participant.objects.filter(pk__in=[p.pk for p in participants[3:]]).delete()
+        shard_updates = [
+            q['sql'] for q in ctx.captured_queries
+            if q['sql'].startswith('UPDATE "booth_counter_shards"')
+        ]
+        self.assertEqual(len(shard_updates), 1)
+        self.assertEqual(Booth.objects.get(pk=booth.pk).get_participant_count(), 0)
+        call_command('rebuild_progress', '--verify', stdout=StringIO())
+
+    def test_missing_slot_is_created_on_increment(self):
+        booth = Booth.objects.bulk_create([Booth(code='BULK001', name='슬롯 없는 부스')])[0]
+        participant = Participant.objects.create()
+        StampRecord.objects.create(participant=participant, booth=booth)
+        BoothCounterShard.add_many({booth.id: 2, self.booths[0].id: 1})
+        self.assertEqual(booth.get_participant_count(), 3)
+        self.assertEqual(self.booths[0].get_participant_count(), 1)
+
+    def test_management_list_and_delete_read_slot_sums(self):
+        participant = Participant.objects.create()
+        StampRecord.objects.create(participant=participant, booth=self.booths[0])
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/admin/booths/')
+        counts = [booth['participant_count'] for booth in response.json()['data']]
+        self.assertEqual(counts, [1, 0, 0])
+
+        response = self.client.delete(f'/api/admin/booths/{self.booths[0].id}/delete/')
+        self.assertEqual(response.json()['data']['action'], 'deactivated')
+        response = self.client.delete(f'/api/admin/booths/{self.booths[1].id}/delete/')
+        self.assertEqual(response.json()['data']['action'], 'deleted')
+
+    def test_rebuild_progress_repairs_slots(self):
+        participant = Participant.objects.create()
+        StampRecord.objects.create(participant=participant, booth=self.booths[0])
+        BoothCounterShard.objects.filter(booth=self.booths[0]).update(count=7)
+
+        with self.assertRaises(CommandError):
+            call_command('rebuild_progress', '--verify', stdout=StringIO())
+        call_command('rebuild_progress', stdout=StringIO())
+        call_command('rebuild_progress', '--verify', stdout=StringIO())
+        self.assertEqual(self.booths[0].get_participant_count(), 1)
+
+
+class BoothRegistryTests(TestCase):
+    """부스 레지스트리 캐시 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.booths = create_booths(2)
+
+    def test_lookup_is_served_from_memory(self):
+        booth_registry.get_by_code('BOOTH001')
+        with self.assertNumQueries(0):
+            self.assertEqual(booth_registry.get_by_code('BOOTH001'), self.booths[0])
+            self.assertEqual(booth_registry.get_by_id(self.booths[1].id), self.booths[1])
+            self.assertIsNone(booth_registry.get_by_code('UNKNOWN'))
+
+    def test_update_booth_invalidates_registry(self):
+        self.assertIsNotNone(booth_registry.get_by_code('BOOTH001'))
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(
+                f'/api/admin/booths/{self.booths[0].id}/update/',
+                {'is_active': False},
+                format='json'
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(booth_registry.get_by_code('BOOTH001'))
+        self.assertIsNotNone(booth_registry.get_by_code('BOOTH001', active_only=False))
+
+    def test_other_worker_sees_change_after_ttl(self):
+        other_worker = BoothRegistry()
+        self.assertEqual(len(other_worker.active_booths()), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/api/admin/booths/create/', {'code': 'NEW', 'name': '새 부스'}, format='json')
+
+        # TTL 이내에는 기존 목록 유지, TTL 이후에는 버전 변경을 감지하여 재적재
+        self.assertEqual(len(other_worker.active_booths()), 2)
+        with override_settings(BOOTH_REGISTRY_TTL=0):
+            self.assertEqual(len(other_worker.active_booths()), 3)
+
+
+class BoothLoadTests(TestCase):
+    """부스 혼잡도 색인 / 다음 방문 추천 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.booths = create_booths(6)
+
+    def test_recommends_least_loaded_unvisited_booths(self):
+        for booth, scans in zip(self.booths, (5, 4, 3, 0, 2, 0)):
+            for _ in range(scans):
+                booth_load.record(booth.id)
+        participant = Participant.objects.create()
+        StampRecord.objects.create(participant=participant, booth=self.booths[3])
+        booth_registry.active_booths()
+
+        with self.assertNumQueries(3):
+            response = self.client.get(f'/api/participants/{participant.id}/stats/')
+        codes = [booth['code'] for booth in response.json()['data']['next_booths']]
+        self.assertEqual(codes, ['BOOTH006', 'BOOTH005', 'BOOTH003'])
+
+    def test_scan_updates_load(self):
+        self.client.post('/api/scan/', {'booth_code': 'BOOTH002'}, format='json')
+        loads = booth_load.loads(booth.id for booth in self.booths)
+        self.assertEqual(loads[self.booths[1].id], 1)
+        self.assertEqual(loads[self.booths[0].id], 0)
+
+    def test_window_and_shared_counters(self):
+        booth_id = self.booths[0].id
+        other_worker = BoothLoadIndex()
+        self.assertEqual(other_worker.loads([booth_id])[booth_id], 0)
+
+        # 윈도우 밖의 (오래된 오프라인) 스캔은 무시
+        booth_load.record(booth_id, at=time.time() - settings.BOOTH_LOAD_WINDOW - 120)
+        booth_load.record(booth_id)
+
+        # 다른 워커는 갱신 주기 이후 공유 캐시에서 반영
+        self.assertEqual(other_worker.loads([booth_id])[booth_id], 0)
+        with override_settings(BOOTH_LOAD_REFRESH=0):
+            self.assertEqual(other_worker.loads([booth_id])[booth_id], 1)
+
+    def test_deploy_check_warns_about_non_atomic_cache(self):
+        self.assertEqual(check_atomic_cache(None), [])
+        database_cache = {'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'qr_stamp_cache',
+        }}
+        with override_settings(CACHES=database_cache):
+            self.assertEqual([w.id for w in check_atomic_cache(None)], ['stamps.W001'])
+
+
+class StampIngestorTests(TestCase):
+    """write-behind 스탬프 적재 테스트"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        self.booths = create_booths(TARGET_STAMPS)
+        self.journal_dir = tempfile.mkdtemp()
+        self.ingestor = StampIngestor(batch_size=50, journal_dir=self.journal_dir, autostart=False)
+
+    def test_scans_are_buffered_until_flush(self):
+        with self.assertNumQueries(0):
+            result = self.ingestor.submit(self.booths[0])
+        participant_id = result.participant.id
+
+        self.assertTrue(result.created)
+        self.assertFalse(Participant.objects.exists())
+
+        self.assertEqual(self.ingestor.flush(), 1)
+        participant = Participant.objects.get(id=participant_id)
+        self.assertEqual(participant.stamp_count, 1)
+        self.assertEqual(self.ingestor.stats()['last_batch_size'], 1)
+        self.assertEqual(os.listdir(self.journal_dir), [])
+
+    def test_duplicate_rejected_before_flush(self):
+        first = self.ingestor.submit(self.booths[0])
+        second = self.ingestor.submit(self.booths[0], participant_id=first.participant.id)
+
+        self.assertFalse(second.created)
+        self.ingestor.flush()
+        self.assertEqual(StampRecord.objects.count(), 1)
+
+    def test_other_worker_cannot_accept_same_stamp(self):
+        participant = Participant.objects.create()
+        other_worker = StampIngestor(journal_dir=self.journal_dir, autostart=False)
+
+        self.assertTrue(self.ingestor.submit(self.booths[0], participant_id=participant.id).created)
+        self.assertFalse(other_worker.submit(self.booths[0], participant_id=participant.id).created)
+
+    def test_unknown_client_id_is_not_used(self):
+        chosen = uuid.uuid4()
+        result = self.ingestor.submit(self.booths[0], participant_id=str(chosen))
+        self.assertTrue(result.is_new_participant)
+        self.assertNotEqual(result.participant.id, chosen)
+
+        self.ingestor.flush()
+        self.assertFalse(Participant.objects.filter(id=chosen).exists())
+
+    def test_other_worker_continues_minted_participant(self):
+        participant_id = self.ingestor.submit(self.booths[0]).participant.id
+        other_worker = StampIngestor(journal_dir=self.journal_dir, autostart=False)
+
+        # 아직 저장되지 않았지만 이 서버가 발급한 ID
+        result = other_worker.submit(self.booths[1], participant_id=str(participant_id))
+        self.assertEqual(result.participant.id, participant_id)
+
+    def test_write_batch_skips_rows_inserted_concurrently(self):
+        participant = Participant.objects.create()
+        items = [{
+            'participant_id': str(participant.id),
+            'booth_id': booth.id,
+            'stamped_at': timezone.now().isoformat(),
+            'new_participant': False,
+        } for booth in self.booths[:2]]
+        insert = StampRecord.objects.bulk_create
+
+        def racing_insert(records, **kwargs):
+            # 기존 기록 조회 이후 다른 요청이 같은 부스 기록을 먼저 저장
+            insert([StampRecord(participant=participant, booth=self.booths[0])])
+            return insert(records, **kwargs)
+
+        with mock.patch.object(StampRecord.objects, 'bulk_create', side_effect=racing_insert), \
+                self.captureOnCommitCallbacks(execute=True):
+            write_batch(items)
+
+        self.assertEqual(Booth.objects.get(pk=self.booths[0].pk).get_participant_count(), 0)
+        self.assertEqual(Booth.objects.get(pk=self.booths[1].pk).get_participant_count(), 1)
+        self.assertEqual(sum(row.stamps for row in HourlyBoothStat.objects.all()), 1)
+
+    def test_flush_applies_completion(self):
+        participant_id = None
+        for booth in self.booths:
+            result = self.ingestor.submit(booth, participant_id=participant_id)
+            participant_id = result.participant.id
+        self.assertTrue(result.participant.is_completed)
+
+        self.ingestor.flush()
+        participant = Participant.objects.get(id=participant_id)
+        self.assertEqual(participant.stamp_count, TARGET_STAMPS)
+        self.assertTrue(participant.is_completed)
+        self.assertIsNotNone(participant.completed_at)
+
+    def test_orphaned_journal_is_replayed(self):
+        participant = Participant.objects.create()
+        # 종료된 프로세스(존재하지 않는 PID)가 남긴 저널 세그먼트
+        path = os.path.join(self.journal_dir, 'stamps-999999999-000001.jsonl')
+        with open(path, 'w', encoding='utf-8') as journal:
+            journal.write(json.dumps({
+                'participant_id': str(participant.id),
+                'booth_id': self.booths[0].id,
+                'stamped_at': '2025-09-20T10:00:00+09:00',
+                'ip_address': None,
+                'user_agent': '',
+                'new_participant': False,
+            }) + '\n')
+            journal.write('{"truncated')
+
+        self.assertEqual(replay_orphaned_segments(self.journal_dir), (1, 1))
+        # 재실행해도 중복 저장되지 않음
+        self.assertEqual(replay_orphaned_segments(self.journal_dir), (0, 0))
+        participant.refresh_from_db()
+        self.assertEqual(participant.stamp_count, 1)
+        self.assertFalse(os.path.exists(path))
+
+    def test_segment_claimed_by_other_worker_is_skipped(self):
+        participant = Participant.objects.create()
+        path = os.path.join(self.journal_dir, 'stamps-999999999-000001.jsonl')
+        with open(path, 'w', encoding='utf-8') as journal:
+            journal.write(json.dumps({
+                'participant_id': str(participant.id),
+                'booth_id': self.booths[0].id,
+                'stamped_at': '2025-09-20T10:00:00+09:00',
+                'new_participant': False,
+            }) + '\n')
+
+        # 다른 워커가 먼저 이름을 바꿔 선점한 경우
+        with mock.patch('stamps.ingest.os.rename', side_effect=FileNotFoundError):
+            self.assertEqual(replay_orphaned_segments(self.journal_dir), (0, 0))
+        self.assertFalse(StampRecord.objects.exists())
+
+        self.assertEqual(replay_orphaned_segments(self.journal_dir), (1, 1))
+        self.assertEqual(Booth.objects.get(pk=self.booths[0].pk).get_participant_count(), 1)
+        self.assertEqual(os.listdir(self.journal_dir), [])
+
+    def test_start_does_not_replay_inline(self):
+        with mock.patch('stamps.ingest.atexit.register') as register, \
+                mock.patch('stamps.ingest.replay_orphaned_segments') as replay:
+            self.ingestor.start()
+            self.ingestor.stop()
+            self.ingestor.start()
+            self.ingestor.stop()
+        self.assertEqual(register.call_count, 1)
+        # 재적재는 flush 스레드에서 실행
+        self.assertEqual(replay.call_count, 2)
+
+
+class AsyncApiTests(TestCase):
+    """비동기(ASGI) API 테스트"""
+
+    def setUp(self):
+        self.booths = create_booths(3)
+
+    async def test_async_scan_and_stats(self):
+        response = await self.async_client.post(
+            '/api/async/scan/', {'booth_code': 'BOOTH001'}, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 201)
+        participant_id = response.json()['data']['participant_id']
+
+        response = await self.async_client.post(
+            '/api/async/scan/',
+            {'booth_code': 'BOOTH001', 'participant_id': participant_id},
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+
+        response = await self.async_client.get(f'/api/async/participants/{participant_id}/stats/')
+        data = response.json()['data']
+        self.assertEqual(data['stamp_count'], 1)
+        self.assertEqual([b['code'] for b in data['next_booths']], ['BOOTH002', 'BOOTH003'])
+        self.assertEqual(data['visited_booths'][0]['booth']['participant_count'], 1)
+
+    async def test_async_detail_matches_sync(self):
+        response = await self.async_client.post(
+            '/api/async/scan/', {'booth_code': 'BOOTH002'}, content_type='application/json'
+        )
+        participant_id = response.json()['data']['participant_id']
+
+        async_data = (await self.async_client.get(
+            f'/api/async/participants/{participant_id}/detail/'
+        )).json()['data']
+        sync_data = (await self.async_client.get(
+            f'/api/participants/{participant_id}/detail/'
+        )).json()['data']
+
+        self.assertEqual(
+            [(b['code'], b['visited'], b['participant_count']) for b in async_data['all_booths']],
+            [(b['code'], b['visited'], b['participant_count']) for b in sync_data['all_booths']]
+        )
+
+    async def test_async_booth_list(self):
+        response = await self.async_client.get('/api/async/booths/')
+        self.assertEqual(len(response.json()['data']), 3)
+
+
+class IdempotencyTests(TestCase):
+    """Idempotency-Key 스캔 재시도 테스트"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        self.client = APIClient()
+        self.booths = create_booths(2)
+
+    def scan(self, key, **data):
+        return self.client.post(
+            '/api/scan/', {'booth_code': 'BOOTH001', **data},
+            format='json', HTTP_IDEMPOTENCY_KEY=key
+        )
+
+    def test_retry_replays_first_response(self):
+        first = self.scan('retry-key-1')
+        with self.assertNumQueries(0):
+            second = self.scan('retry-key-1')
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['Idempotent-Replayed'], 'true')
+        self.assertEqual(Participant.objects.count(), 1)
+        self.assertEqual(StampRecord.objects.count(), 1)
+
+    def test_different_keys_are_processed(self):
+        self.scan('key-a')
+        self.scan('key-b')
+        self.assertEqual(Participant.objects.count(), 2)
+
+    def test_counters_in_health_check(self):
+        self.scan('key-c')
+        self.scan('key-c')
+        response = self.client.get('/api/admin/health-check/')
+        counters = response.json()['data']['idempotency']
+        self.assertEqual(counters['stored'], 1)
+        self.assertEqual(counters['replayed'], 1)
+
+    async def test_async_scan_replay(self):
+        first = await self.async_client.post(
+            '/api/async/scan/', {'booth_code': 'BOOTH002'},
+            content_type='application/json', headers={'Idempotency-Key': 'async-key'}
+        )
+        second = await self.async_client.post(
+            '/api/async/scan/', {'booth_code': 'BOOTH002'},
+            content_type='application/json', headers={'Idempotency-Key': 'async-key'}
+        )
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.content, first.content)
+
+
+class ScanBatchTests(TestCase):
+    """오프라인 스캔 일괄 동기화 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.booths = create_booths(12)
+        # 한두 시간 전 정각부터 1분 간격으로 스캔한 것으로 가정
+        self.scanned_from = timezone.localtime().replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
+
+    def sync(self, items, **data):
+        return self.client.post('/api/scan/batch/', {'items': items, **data}, format='json')
+
+    def items(self, codes):
+        return [
+            {
+                'booth_code': code,
+                'scanned_at': (self.scanned_from + timedelta(minutes=i)).isoformat(),
+                'client_nonce': f'n{i}',
+            }
+            for i, code in enumerate(codes)
+        ]
+
+    def test_per_item_results(self):
+        response = self.sync(self.items(['BOOTH001', 'BOOTH001', 'NOPE', 'BOOTH002']))
+        self.assertEqual(response.status_code, 201)
+        data = response.json()['data']
+        self.assertEqual(
+            [(r['client_nonce'], r['status']) for r in data['results']],
+            [('n0', 'stamped'), ('n1', 'duplicate'), ('n2', 'invalid_booth'), ('n3', 'stamped')]
+        )
+        self.assertEqual(data['stamp_count'], 2)
+
+        # 오프라인 스캔 시각이 획득 시간으로 저장됨
+        record = StampRecord.objects.get(booth__code='BOOTH001')
+        self.assertEqual(record.stamped_at.minute, 0)
+
+    def test_already_stamped_booth_is_duplicate(self):
+        participant_id = self.sync(self.items(['BOOTH001']))
+        participant_id = participant_id.json()['data']['participant_id']
+
+        response = self.sync(self.items(['BOOTH001', 'BOOTH003']), participant_id=participant_id)
+        statuses = [r['status'] for r in response.json()['data']['results']]
+        self.assertEqual(statuses, ['duplicate', 'stamped'])
+        self.assertEqual(StampRecord.objects.count(), 2)
+
+    def test_completion_from_batch(self):
+        response = self.sync(self.items([f'BOOTH{i:03d}' for i in range(1, TARGET_STAMPS + 1)]))
+        data = response.json()['data']
+        self.assertTrue(data['is_completed'])
+        participant = Participant.objects.get(id=data['participant_id'])
+        # 완주 시간은 목표 개수째 스탬프의 스캔 시각
+        self.assertEqual(participant.completed_at.minute, TARGET_STAMPS - 1)
+
+    def test_query_count_is_constant(self):
+        booth_registry.active_booths()
+        counts = []
+        for size in (2, 10):
+            participant = Participant.objects.create()
+            codes = [booth.code for booth in self.booths[:size]]
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.sync(self.items(codes), participant_id=str(participant.id))
+            self.assertEqual(response.status_code, 201)
+            counts.append(len(ctx.captured_queries))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_scanned_at_is_bounded(self):
+        now = timezone.now()
+        response = self.sync([{'booth_code': 'BOOTH001', 'scanned_at': '2020-01-01T10:00:00+09:00'}])
+        participant_id = response.json()['data']['participant_id']
+        stamped_at = StampRecord.objects.get(booth__code='BOOTH001').stamped_at
+        self.assertGreaterEqual(stamped_at, now - timedelta(hours=settings.OFFLINE_SCAN_MAX_AGE_HOURS))
+
+        # 기존 참여자는 참여자 생성 이전 시각으로 기록되지 않음
+        participant = Participant.objects.get(id=participant_id)
+        self.sync(self.items(['BOOTH002']), participant_id=participant_id)
+        self.assertEqual(StampRecord.objects.get(booth__code='BOOTH002').stamped_at, participant.created_at)
+
+    def test_non_string_booth_code_is_invalid(self):
+        response = self.client.post('/api/scan/', {'booth_code': ['x']}, format='json')
+        self.assertEqual(response.status_code, 404)
+
+        response = self.sync([{'booth_code': {'code': 'BOOTH001'}}, {'booth_code': 'BOOTH001'}])
+        statuses = [r['status'] for r in response.json()['data']['results']]
+        self.assertEqual(statuses, ['invalid_booth', 'stamped'])
+
+    def test_out_of_range_scanned_at_uses_current_time(self):
+        before = timezone.now()
+        response = self.sync([{'booth_code': 'BOOTH001', 'scanned_at': '2025-13-45T99:00'}])
+        self.assertEqual(response.status_code, 201)
+        self.assertGreaterEqual(StampRecord.objects.get().stamped_at, before)
+
+    def test_conflicting_rows_are_not_counted(self):
+        participant = Participant.objects.create()
+        # 진행 현황에 아직 반영되지 않은 다른 요청의 기록
+        StampRecord.objects.bulk_create([StampRecord(participant=participant, booth=self.booths[0])])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.sync(self.items(['BOOTH001', 'BOOTH002']), participant_id=str(participant.id))
+        statuses = [r['status'] for r in response.json()['data']['results']]
+        self.assertEqual(statuses, ['duplicate', 'stamped'])
+        self.assertEqual(Booth.objects.get(pk=self.booths[0].pk).get_participant_count(), 0)
+        self.assertEqual(Booth.objects.get(pk=self.booths[1].pk).get_participant_count(), 1)
+        self.assertEqual(sum(row.stamps for row in HourlyBoothStat.objects.all()), 1)
+
+
+class BoothTokenTests(TestCase):
+    """서명된 부스 QR 토큰 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.booth = create_booths(1)[0]
+
+    def scan(self, **data):
+        return self.client.post('/api/scan/', data, format='json')
+
+    def test_valid_token_is_accepted(self):
+        response = self.scan(booth_code=self.booth.code, booth_token=make_booth_token(self.booth.code))
+        self.assertEqual(response.status_code, 201)
+
+        # 토큰만 보내도 서명된 부스 코드로 처리
+        response = self.scan(booth_token=make_booth_token(self.booth.code))
+        self.assertEqual(response.status_code, 201)
+
+    def test_forged_token_is_rejected_without_queries(self):
+        token = make_booth_token(self.booth.code)
+        forged = token[:-2] + ('AA' if not token.endswith('AA') else 'BB')
+        other = make_booth_token('BOOTH999')
+        for booth_token in (forged, other):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.scan(booth_code=self.booth.code, booth_token=booth_token)
+            self.assertEqual(response.status_code, 403)
+            self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertFalse(Participant.objects.exists())
+
+    def test_non_string_token_is_rejected(self):
+        for booth_token in (5, ['x'], {'b': self.booth.code}):
+            response = self.scan(booth_code=self.booth.code, booth_token=booth_token)
+            self.assertEqual(response.status_code, 403)
+
+    def test_validity_window(self):
+        now = timezone.now()
+        expired = make_booth_token(self.booth.code, valid_until=now - timedelta(minutes=1))
+        upcoming = make_booth_token(self.booth.code, valid_from=now + timedelta(hours=1))
+        for token in (expired, upcoming):
+            with self.assertRaises(InvalidBoothToken):
+                verify_booth_token(token, self.booth.code)
+            self.assertEqual(self.scan(booth_token=token).status_code, 403)
+
+        window = make_booth_token(self.booth.code, now - timedelta(hours=1), now + timedelta(hours=1))
+        self.assertEqual(verify_booth_token(window, self.booth.code), self.booth.code)
+
+    @override_settings(BOOTH_TOKEN_REQUIRED=True)
+    def test_required_rejects_unsigned_code(self):
+        self.assertEqual(self.scan(booth_code=self.booth.code).status_code, 403)
+        response = self.client.get(f'/stamp?booth={self.booth.code}')
+        self.assertEqual(response.status_code, 403)
+
+        response = self.client.get('/stamp', {'booth': self.booth.code, 't': make_booth_token(self.booth.code)})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(StampRecord.objects.count(), 1)
+
+    def test_batch_item_with_invalid_token(self):
+        response = self.client.post('/api/scan/batch/', {'items': [
+            {'booth_code': self.booth.code, 'booth_token': 'forged', 'client_nonce': 'n0'},
+            {'booth_code': self.booth.code, 'booth_token': make_booth_token(self.booth.code), 'client_nonce': 'n1'},
+        ]}, format='json')
+        statuses = [r['status'] for r in response.json()['data']['results']]
+        self.assertEqual(statuses, ['invalid_token', 'stamped'])
+
+    def test_generate_booth_urls_command(self):
+        out = StringIO()
+        call_command('generate_booth_urls', '--base-url', 'https://stamp.example.com/', stdout=out)
+        url = out.getvalue().strip().split(': ', 1)[1]
+        self.assertTrue(url.startswith(f'https://stamp.example.com/stamp?booth={self.booth.code}&t='))
@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import views, async_views
 
 app_name = 'stamps'
 
@@ -25,9 +25,23 @@ urlpatterns = [
     
     # QR 스캔 통합 API (가장 중요한 엔드포인트)
     path('scan/', views.scan_qr, name='scan_qr'),
+    path('scan/batch/', views.scan_batch, name='scan_batch'),  # 오프라인 스캔 일괄 동기화
+    
+    # 비동기(ASGI) API - uvicorn 배포 시 사용
+    path('async/scan/', async_views.scan_qr, name='async_scan_qr'),
+    path('async/booths/', async_views.booth_list, name='async_booth_list'),
+    path('async/participants/<uuid:participant_id>/stats/', async_views.get_participant_stats, name='async_get_participant_stats'),
+    path('async/participants/<uuid:participant_id>/detail/', async_views.get_participant_detail, name='async_get_participant_detail'),
     
     # 관리자용 API
     path('admin/statistics/', views.admin_statistics, name='admin_statistics'),
     path('admin/gift-eligible/', views.gift_eligible_participants, name='gift_eligible_participants'),
     path('admin/health-check/', views.system_health_check, name='system_health_check'),
+    path('admin/stream/', async_views.admin_stream, name='admin_stream'),  # 대시보드 실시간 이벤트 (SSE, ASGI 배포 시 사용)
+
+    # 데이터 내보내기 (관리자용, 스트리밍)
+    path('admin/export/stamps.ndjson', views.export_table, {'table': 'stamps', 'export_format': 'ndjson'}, name='export_stamps_ndjson'),
+    path('admin/export/stamps.csv', views.export_table, {'table': 'stamps', 'export_format': 'csv'}, name='export_stamps_csv'),
+    path('admin/export/participants.ndjson', views.export_table, {'table': 'participants', 'export_format': 'ndjson'}, name='export_participants_ndjson'),
+    path('admin/export/participants.csv', views.export_table, {'table': 'participants', 'export_format': 'csv'}, name='export_participants_csv'),
 ]
@@ -1,14 +1,44 @@
+import logging
+import time
+
 from rest_framework import status, generics
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from django.db import IntegrityError
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.cache import cache
+from django.db import IntegrityError, connection
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from .models import Participant, Booth, StampRecord
+from django.utils import timezone
+from django.views.decorators.http import require_GET
+from .models import Participant, Booth, StampRecord, TARGET_STAMPS
 from .serializers import (
     ParticipantSerializer, ParticipantCreateSerializer,
     BoothSerializer, StampCreateSerializer, 
     ParticipantStatsSerializer
 )
+from .services import (
+    record_scan, record_scan_batch, BATCH_STAMPED,
+    booth_participant_counts, participants_with_stamps, active_booth_snapshot, on_stamps_saved,
+    gift_eligible_page, completed_participants, InvalidCursor, GIFT_PAGE_SIZE, GIFT_PAGE_MAX
+)
+from . import ingest
+from .idempotency import idempotent, get_counters as get_idempotency_counters
+from .response_cache import cached_response, get_counters as get_response_cache_counters
+from .booth_registry import get_booth, get_booth_by_id, get_active_booths, invalidate_booths
+from .booth_tokens import resolve_booth_code, InvalidBoothToken
+from .participant_token import read_progress, set_progress
+from .booth_load import record_booth_scan, recommend_booths
+from . import stamp_pages
+from . import statistics
+from . import rollups
+from . import exports
+
+logger = logging.getLogger(__name__)
+
+# 오프라인 스캔 일괄 동기화 1회당 최대 항목 수
+MAX_BATCH_ITEMS = 100
 
 
 def get_client_ip(request):
@@ -45,8 +75,10 @@ def get_participant(request, participant_id):
     참여자 정보 조회 (스탬프 기록 포함)
     """
     try:
-        participant = Participant.objects.get(id=participant_id)
-        serializer = ParticipantSerializer(participant)
+        # 스탬프 기록/부스는 prefetch, 부스별 참여자 수는 한 번에 집계
+        participant = participants_with_stamps().get(id=participant_id)
+        counts = booth_participant_counts(record.booth_id for record in participant.stamp_records.all())
+        serializer = ParticipantSerializer(participant, context={'participant_counts': counts})
         return Response({
             'success': True,
             'data': serializer.data
@@ -67,19 +99,22 @@ def create_stamp(request):
     serializer = StampCreateSerializer(data=request.data)
     if serializer.is_valid():
         try:
-            participant = Participant.objects.get(id=serializer.validated_data['participant_id'])
-            booth = Booth.objects.get(code=serializer.validated_data['booth_code'])
+            # serializer 검증에서 확인한 객체 재사용
+            participant = serializer.validated_data['participant']
+            booth = serializer.validated_data['booth']
             
-            # 스탬프 기록 생성
-            stamp_record = StampRecord.objects.create(
+            # 스탬프 기록 생성 (진행 현황/완주 상태는 모델에서 갱신)
+            record = StampRecord.objects.create(
                 participant=participant,
                 booth=booth,
                 ip_address=get_client_ip(request),
                 user_agent=request.META.get('HTTP_USER_AGENT', '')
             )
-            
-            # 참여자 완주 상태 체크 (모델에서 자동 처리됨)
-            participant.refresh_from_db()
+            record_booth_scan(booth.id)
+            on_stamps_saved(
+                [(participant.id, booth.id, record.stamped_at)],
+                {participant.id: participant.stamp_count - 1}
+            )
             
             return Response({
                 'success': True,
@@ -116,16 +151,21 @@ def get_participant_stats(request, participant_id):
         progress_percentage = min((stamp_count / 5) * 100, 100)
         remaining_stamps = max(5 - stamp_count, 0)
         
-        # 아직 방문하지 않은 부스들
-        visited_booth_ids = participant.stamp_records.values_list('booth_id', flat=True)
-        next_booths = Booth.objects.filter(is_active=True).exclude(id__in=visited_booth_ids)[:3]
+        # 방문한 부스 정보 (부스 포함 한 번에 조회)
+        visited_records = list(participant.stamp_records.select_related('booth'))
+        visited_booth_ids = {record.booth_id for record in visited_records}
         
-        # 방문한 부스 정보
-        visited_records = participant.stamp_records.select_related('booth').all()
+        # 아직 방문하지 않은 부스 중 최근 스캔이 적은 부스 추천 (부스 레지스트리 + 혼잡도 색인)
+        next_booths = recommend_booths(get_active_booths(), visited_booth_ids)
+        
+        # 부스별 참여자 수는 한 번의 GROUP BY 로 집계
+        context = {'participant_counts': booth_participant_counts(
+            visited_booth_ids | {booth.id for booth in next_booths}
+        )}
         visited_booths = []
         for record in visited_records:
             visited_booths.append({
-                'booth': BoothSerializer(record.booth).data,
+                'booth': BoothSerializer(record.booth, context=context).data,
                 'stamped_at': record.stamped_at
             })
         
@@ -135,7 +175,7 @@ def get_participant_stats(request, participant_id):
             'is_completed': participant.is_completed,
             'progress_percentage': round(progress_percentage, 1),
             'remaining_stamps': remaining_stamps,
-            'next_booths': BoothSerializer(next_booths, many=True).data,
+            'next_booths': BoothSerializer(next_booths, many=True, context=context).data,
             'visited_booths': visited_booths
         }
         
@@ -162,37 +202,40 @@ def get_participant_detail(request, participant_id):
         progress_percentage = min((stamp_count / 5) * 100, 100)
         remaining_stamps = max(5 - stamp_count, 0)
         
-        # 방문한 부스 정보
-        visited_records = participant.stamp_records.select_related('booth').all()
-        visited_booths = []
-        visited_booth_ids = set()
-        
-        for record in visited_records:
-            visited_booths.append({
-                'booth': BoothSerializer(record.booth).data,
-                'stamped_at': record.stamped_at
-            })
-            visited_booth_ids.add(record.booth.id)
+        # 방문 기록은 (부스 ID, 획득 시간)만 조회하여 부스 ID 기준으로 색인
+        visited_records = list(
+            participant.stamp_records.order_by('-stamped_at').values_list('booth_id', 'stamped_at')
+        )
+        stamped_at_by_booth = dict(visited_records)
         
-        # 전체 부스 목록 (방문 여부 표시)
-        all_booths = Booth.objects.filter(is_active=True).order_by('code')
+        # 전체 부스 목록은 캐시된 활성 부스 스냅샷 사용 (방문 여부 표시)
+        snapshot = active_booth_snapshot()
+        booth_data_by_id = {booth_data['id']: booth_data for booth_data in snapshot}
         booths_with_status = []
-        
-        for booth in all_booths:
-            booth_data = BoothSerializer(booth).data
-            booth_data['visited'] = booth.id in visited_booth_ids
-            
-            # 방문했다면 방문 시간 추가
-            if booth.id in visited_booth_ids:
-                visited_record = next(
-                    (r for r in visited_records if r.booth.id == booth.id), 
-                    None
-                )
-                if visited_record:
-                    booth_data['stamped_at'] = visited_record.stamped_at
-            
+        for booth_data in snapshot:
+            booth_data = dict(booth_data)
+            stamped_at = stamped_at_by_booth.get(booth_data['id'])
+            booth_data['visited'] = stamped_at is not None
+            if stamped_at is not None:
+                booth_data['stamped_at'] = stamped_at
             booths_with_status.append(booth_data)
         
+        # 방문한 부스 정보 (비활성화된 부스만 따로 직렬화)
+        inactive_ids = [booth_id for booth_id, _ in visited_records if booth_id not in booth_data_by_id]
+        if inactive_ids:
+            counts = booth_participant_counts(inactive_ids)
+            for booth_id in inactive_ids:
+                booth = get_booth_by_id(booth_id, active_only=False)
+                if booth is not None:
+                    booth_data_by_id[booth_id] = BoothSerializer(
+                        booth, context={'participant_counts': counts}
+                    ).data
+        visited_booths = [
+            {'booth': booth_data_by_id[booth_id], 'stamped_at': stamped_at}
+            for booth_id, stamped_at in visited_records
+            if booth_id in booth_data_by_id
+        ]
+        
         detail_data = {
             'id': participant.id,
             'stamp_count': stamp_count,
@@ -220,8 +263,9 @@ def booth_list(request):
     """
     활성화된 부스 목록 조회
     """
-    booths = Booth.objects.filter(is_active=True).order_by('code')
-    serializer = BoothSerializer(booths, many=True)
+    booths = get_active_booths()
+    counts = booth_participant_counts(booth.id for booth in booths)
+    serializer = BoothSerializer(booths, many=True, context={'participant_counts': counts})
     return Response({
         'success': True,
         'data': serializer.data
@@ -233,20 +277,21 @@ def get_booth_by_code(request, booth_code):
     """
     부스 코드로 부스 정보 조회
     """
-    try:
-        booth = Booth.objects.get(code=booth_code, is_active=True)
-        serializer = BoothSerializer(booth)
-        return Response({
-            'success': True,
-            'data': serializer.data
-        })
-    except Booth.DoesNotExist:
+    booth = get_booth(booth_code)
+    if booth is None:
         return Response({
             'success': False,
             'message': '존재하지 않거나 비활성화된 부스입니다.'
         }, status=status.HTTP_404_NOT_FOUND)
+    
+    serializer = BoothSerializer(booth)
+    return Response({
+        'success': True,
+        'data': serializer.data
+    })
 
 
+@cached_response('admin_statistics')
 @api_view(['GET'])
 def admin_statistics(request):
     """
@@ -256,69 +301,19 @@ def admin_statistics(request):
     - 부스별 참여 통계
     - 기념품 수령 대상자 현황
     """
-    total_participants = Participant.objects.count()
-    completed_participants = Participant.objects.filter(is_completed=True).count()
-    
-    # 부스별 통계
-    booth_stats = []
-    for booth in Booth.objects.filter(is_active=True):
-        participant_count = booth.get_participant_count()
-        booth_stats.append({
-            'booth_code': booth.code,
-            'booth_name': booth.name,
-            'participant_count': participant_count,
-            'popularity_rank': 0  # 추후 계산
-        })
-    
-    # 인기도 순으로 정렬
-    booth_stats.sort(key=lambda x: x['participant_count'], reverse=True)
-    for i, booth_stat in enumerate(booth_stats):
-        booth_stat['popularity_rank'] = i + 1
-    
-    # 시간대별 참여 현황 (최근 24시간, 1시간 단위)
-    from django.utils import timezone
-    from datetime import timedelta
-    import json
-    
-    now = timezone.now()
-    hourly_stats = []
-    for i in range(24):
-        hour_start = now - timedelta(hours=i+1)
-        hour_end = now - timedelta(hours=i)
-        
-        participants_in_hour = Participant.objects.filter(
-            created_at__gte=hour_start,
-            created_at__lt=hour_end
-        ).count()
-        
-        stamps_in_hour = StampRecord.objects.filter(
-            stamped_at__gte=hour_start,
-            stamped_at__lt=hour_end
-        ).count()
-        
-        hourly_stats.append({
-            'hour': hour_start.strftime('%H:00'),
-            'new_participants': participants_in_hour,
-            'stamps_collected': stamps_in_hour
-        })
-    
-    hourly_stats.reverse()  # 시간순 정렬
-    
     return Response({
         'success': True,
         'data': {
-            'summary': {
-                'total_participants': total_participants,
-                'completed_participants': completed_participants,
-                'completion_rate': round((completed_participants / total_participants * 100) if total_participants > 0 else 0, 1),
-                'gift_eligible_count': completed_participants
-            },
-            'booth_statistics': booth_stats,
-            'hourly_statistics': hourly_stats
+            'summary': statistics.summary(),
+            # 부스별 통계 (인기도 순)
+            'booth_statistics': statistics.booth_popularity(),
+            # 시간대별 참여 현황 (최근 24시간, 정각 기준 1시간 단위)
+            'hourly_statistics': statistics.hourly_statistics()
         }
     })
 
 
+@idempotent('scan')
 @api_view(['POST'])
 def scan_qr(request):
     """
@@ -327,60 +322,56 @@ def scan_qr(request):
     """
     participant_id = request.data.get('participant_id')
     booth_code = request.data.get('booth_code')
+    booth_token = request.data.get('booth_token')
     
-    if not booth_code:
+    if not booth_code and not booth_token:
         return Response({
             'success': False,
             'message': '부스 코드가 필요합니다.'
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    # 부스 유효성 확인
+    # 서명 토큰 검증 (DB 조회 없이 위조 QR 거절)
     try:
-        booth = Booth.objects.get(code=booth_code, is_active=True)
-    except Booth.DoesNotExist:
+        booth_code = resolve_booth_code(booth_code, booth_token)
+    except InvalidBoothToken as e:
+        return Response({
+            'success': False,
+            'message': str(e)
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    # 부스 유효성 확인 (워커 메모리의 부스 레지스트리)
+    booth = get_booth(booth_code)
+    if booth is None:
         return Response({
             'success': False,
             'message': '존재하지 않거나 비활성화된 부스입니다.'
         }, status=status.HTTP_404_NOT_FOUND)
     
-    # 참여자 확인 또는 생성
-    if participant_id:
-        try:
-            participant = Participant.objects.get(id=participant_id)
-            is_new_participant = False
-        except Participant.DoesNotExist:
-            participant = Participant.objects.create()
-            is_new_participant = True
-    else:
-        participant = Participant.objects.create()
-        is_new_participant = True
+    # 참여자 확인/생성 및 스탬프 기록 (단일 트랜잭션 또는 write-behind 적재)
+    record = ingest.get_ingestor().submit if ingest.is_enabled() else record_scan
+    result = record(
+        booth,
+        participant_id=participant_id,
+        ip_address=get_client_ip(request),
+        user_agent=request.META.get('HTTP_USER_AGENT', '')
+    )
+    participant = result.participant
     
-    # 중복 스탬프 체크
-    if StampRecord.objects.filter(participant=participant, booth=booth).exists():
+    # 중복 스탬프
+    if not result.created:
         return Response({
             'success': False,
             'message': '이미 이 부스에서 스탬프를 받았습니다.',
             'data': {
                 'participant_id': participant.id,
                 'booth_name': booth.name,
-                'stamp_count': participant.get_stamp_count(),
+                'stamp_count': result.stamp_count,
                 'is_completed': participant.is_completed
             }
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    # 스탬프 기록 생성
-    stamp_record = StampRecord.objects.create(
-        participant=participant,
-        booth=booth,
-        ip_address=get_client_ip(request),
-        user_agent=request.META.get('HTTP_USER_AGENT', '')
-    )
-    
-    # 참여자 상태 갱신
-    participant.refresh_from_db()
-    
     message = f'{booth.name}에서 스탬프를 받았습니다!'
-    if is_new_participant:
+    if result.is_new_participant:
         message = f'새로운 참여자로 등록되었습니다. {message}'
     
     return Response({
@@ -389,57 +380,150 @@ def scan_qr(request):
         'data': {
             'participant_id': participant.id,
             'booth_name': booth.name,
-            'stamp_count': participant.get_stamp_count(),
+            'stamp_count': result.stamp_count,
             'is_completed': participant.is_completed,
             'completed_at': participant.completed_at,
-            'is_new_participant': is_new_participant
+            'is_new_participant': result.is_new_participant
         }
     }, status=status.HTTP_201_CREATED)
 
 
+@idempotent('scan_batch')
+@api_view(['POST'])
+def scan_batch(request):
+    """
+    오프라인 스캔 일괄 동기화 API
+    통신이 안 되는 곳에서 모아 둔 스캔 목록을 한 번에 스탬프로 기록
+    요청: {participant_id?, items: [{booth_code, scanned_at, client_nonce}]}
+    """
+    items = request.data.get('items')
+    if not isinstance(items, list) or not items:
+        return Response({
+            'success': False,
+            'message': '동기화할 스캔 목록이 필요합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    if len(items) > MAX_BATCH_ITEMS or not all(isinstance(item, dict) for item in items):
+        return Response({
+            'success': False,
+            'message': f'스캔 목록은 최대 {MAX_BATCH_ITEMS}건의 객체 배열이어야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    participant, is_new_participant, results = record_scan_batch(
+        items,
+        participant_id=request.data.get('participant_id'),
+        ip_address=get_client_ip(request),
+        user_agent=request.META.get('HTTP_USER_AGENT', '')
+    )
+    stamped = sum(1 for result in results if result['status'] == BATCH_STAMPED)
+    
+    return Response({
+        'success': True,
+        'message': f'{stamped}개의 스탬프가 동기화되었습니다.',
+        'data': {
+            'participant_id': participant.id,
+            'stamp_count': participant.stamp_count,
+            'is_completed': participant.is_completed,
+            'completed_at': participant.completed_at,
+            'is_new_participant': is_new_participant,
+            'results': results
+        }
+    }, status=status.HTTP_201_CREATED if stamped else status.HTTP_200_OK)
+
+
+@cached_response('gift_eligible')
 @api_view(['GET'])
 def gift_eligible_participants(request):
     """
-    기념품 수령 대상자 목록 조회
+    기념품 수령 대상자 목록 조회 (완주 시간 순)
     5개 부스를 모두 완주한 참여자들
+    - limit: 페이지 크기 (기본 200, 최대 1000)
+    - after: 이전 응답의 next_cursor, 그 이후 완주자만 반환
+      (기념품 데스크는 마지막 next_cursor 로 주기적으로 조회하여 새 완주자만 받음)
     """
-    completed_participants = Participant.objects.filter(is_completed=True).order_by('completed_at')
-    
+    try:
+        limit = min(max(int(request.GET.get('limit', GIFT_PAGE_SIZE)), 1), GIFT_PAGE_MAX)
+    except ValueError:
+        return Response({
+            'success': False,
+            'message': 'limit 은 숫자여야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        participants, next_cursor, has_more = gift_eligible_page(request.GET.get('after'), limit)
+    except InvalidCursor:
+        return Response({
+            'success': False,
+            'message': '올바르지 않은 커서입니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
     participants_data = []
-    for participant in completed_participants:
-        # 방문한 부스 정보
-        visited_booths = []
-        for record in participant.stamp_records.all().order_by('stamped_at'):
-            visited_booths.append({
+    for participant in participants:
+        # 방문한 부스 정보 (미리 불러온 기록 사용)
+        visited_booths = [
+            {
                 'booth_code': record.booth.code,
                 'booth_name': record.booth.name,
                 'stamped_at': record.stamped_at
-            })
+            }
+            for record in participant.stamp_records.all()
+        ]
         
         participants_data.append({
             'participant_id': str(participant.id),
             'completed_at': participant.completed_at,
             'stamp_count': participant.get_stamp_count(),
             'visited_booths': visited_booths,
-            'completion_duration': None if not participant.completed_at else 
-                                 int((participant.completed_at - participant.created_at).total_seconds() / 60)  # 분 단위
+            'completion_duration': int((participant.completed_at - participant.created_at).total_seconds() / 60)  # 분 단위
         })
     
     return Response({
         'success': True,
         'data': {
-            'total_eligible': len(participants_data),
-            'participants': participants_data
+            'total_eligible': completed_participants().count(),
+            'participants': participants_data,
+            'next_cursor': next_cursor,
+            'has_more': has_more
         }
     })
 
 
+@require_GET
+@staff_member_required
+def export_table(request, table, export_format):
+    """
+    스탬프 기록 / 참여자 전체 내보내기 (NDJSON 또는 CSV 스트리밍)
+    - IP 주소/User-Agent 가 포함되므로 관리자(스태프) 로그인 필요
+    - since: 이 시각 이후 기록만 (스탬프는 stamped_at, 참여자는 created_at 기준)
+    - gzip=1: 압축하여 .gz 파일로 전송
+    - 동기 생성기로 전송하므로 WSGI(Gunicorn) 배포에서 호출 (ASGI 에서는 응답 전체를 메모리에 모음)
+    """
+    try:
+        since = exports.parse_since(request.GET.get('since'))
+    except exports.InvalidSince:
+        return JsonResponse({
+            'success': False,
+            'message': 'since 형식이 올바르지 않습니다. (예: 2025-09-27 또는 2025-09-27T13:00)'
+        }, status=400)
+
+    compress = request.GET.get('gzip') in ('1', 'true')
+    filename = f'{table}.{export_format}' + ('.gz' if compress else '')
+    response = StreamingHttpResponse(
+        exports.export_stream(table, export_format, since, compress),
+        content_type='application/gzip' if compress else exports.CONTENT_TYPES[export_format]
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['Cache-Control'] = 'no-store'
+    response['X-Accel-Buffering'] = 'no'  # nginx 프록시 버퍼링 해제
+    return response
+
+
 @api_view(['GET'])
 def booth_management_list(request):
     """
     관리자용 전체 부스 목록 조회 (비활성화 포함)
     """
-    booths = Booth.objects.all().order_by('code')
+    booths = Booth.objects.with_participant_count().order_by('code')
     booth_data = []
     
     for booth in booths:
@@ -449,7 +533,7 @@ def booth_management_list(request):
             'name': booth.name,
             'description': booth.description,
             'is_active': booth.is_active,
-            'participant_count': booth.get_participant_count(),
+            'participant_count': booth.participant_count,
             'created_at': booth.created_at
         })
     
@@ -488,6 +572,7 @@ def create_booth(request):
         description=description,
         is_active=is_active
     )
+    invalidate_booths()
     
     return Response({
         'success': True,
@@ -541,6 +626,7 @@ def update_booth(request, booth_id):
     booth.description = description
     booth.is_active = is_active
     booth.save()
+    invalidate_booths()
     
     return Response({
         'success': True,
@@ -575,6 +661,7 @@ def delete_booth(request, booth_id):
         # 참여자가 있으면 비활성화만
         booth.is_active = False
         booth.save()
+        invalidate_booths()
         return Response({
             'success': True,
             'message': '참여자가 있어 부스를 비활성화했습니다.',
@@ -588,6 +675,7 @@ def delete_booth(request, booth_id):
         # 참여자가 없으면 완전 삭제
         booth_code = booth.code
         booth.delete()
+        invalidate_booths()
         return Response({
             'success': True,
             'message': f'부스 "{booth_code}"가 삭제되었습니다.',
@@ -598,6 +686,22 @@ def delete_booth(request, booth_id):
         })
 
 
+def _render_stamp_page(message, stamp_count, is_completed, visited_booths):
+    """스탬프 처리 결과 HTML 페이지 (공통 틀은 캐시, 진행 상황 조각만 렌더링)"""
+    return stamp_pages.progress_response(
+        message, stamp_count, is_completed, visited_booths, len(get_active_booths())
+    )
+
+
+def _visited_from_bitmap(visited_booths):
+    """진행 상황 쿠키의 방문 비트맵으로 방문 부스 목록 구성 (획득 시간 없음)"""
+    return [
+        {'name': booth.name, 'code': booth.code, 'stamped_at': ''}
+        for booth in get_active_booths()
+        if booth.visit_bit & visited_booths
+    ]
+
+
 @api_view(['GET'])
 def stamp_view(request):
     """
@@ -605,397 +709,132 @@ def stamp_view(request):
     프론트엔드 대신 백엔드에서 직접 HTML을 제공
     """
     booth_code = request.GET.get('booth')
+    booth_token = request.GET.get('t')
     
-    if not booth_code:
-        from django.http import HttpResponse
-        return HttpResponse(
-            """
-            <!DOCTYPE html>
-            <html lang="ko">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>QR 스탬프 오류</title>
-                <style>
-                    body { font-family: Arial, sans-serif; padding: 20px; text-align: center; }
-                    .error { color: red; font-size: 18px; margin: 20px; }
-                </style>
-            </head>
-            <body>
-                <h1>📱 QR 스탬프 오류</h1>
-                <div class="error">부스 코드가 포함된 유효한 QR 링크가 아닙니다.</div>
-                <p>예: /stamp?booth=art1</p>
-            </body>
-            </html>
-            """
-        )
+    if not booth_code and not booth_token:
+        # 부스 코드 없이 접속하면 진행 상황 쿠키로 현황 페이지 제공 (DB 조회 없음)
+        progress = read_progress(request)
+        if progress is not None:
+            return _render_stamp_page(
+                '현재 스탬프 수집 현황입니다.',
+                progress.stamp_count,
+                progress.is_completed,
+                _visited_from_bitmap(progress.visited_booths)
+            )
+        return stamp_pages.error_response(stamp_pages.MISSING_BOOTH, hint=stamp_pages.MISSING_BOOTH_HINT)
+    
+    # 서명 토큰 검증 (DB 조회 없이 위조 QR 거절)
+    try:
+        booth_code = resolve_booth_code(booth_code, booth_token)
+    except InvalidBoothToken as e:
+        return stamp_pages.error_response(str(e), status=403)
     
     # 부스 코드가 있으면 스탬프 처리 후 HTML 응답
     try:
-        # 부스 유효성 확인
-        try:
-            booth = Booth.objects.get(code=booth_code, is_active=True)
-        except Booth.DoesNotExist:
-            from django.http import HttpResponse
-            return HttpResponse(
-                f"""
-                <!DOCTYPE html>
-                <html lang="ko">
-                <head>
-                    <meta charset="UTF-8">
-                    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                    <title>QR 스탬프 오류</title>
-                    <style>
-                        body {{ font-family: Arial, sans-serif; padding: 20px; text-align: center; }}
-                        .error {{ color: red; font-size: 18px; margin: 20px; }}
-                    </style>
-                </head>
-                <body>
-                    <h1>📱 QR 스탬프 오류</h1>
-                    <div class="error">존재하지 않거나 비활성화된 부스입니다: {booth_code}</div>
-                </body>
-                </html>
-                """
+        # 부스 유효성 확인 (워커 메모리의 부스 레지스트리)
+        booth = get_booth(booth_code)
+        if booth is None:
+            return stamp_pages.error_response(stamp_pages.UNKNOWN_BOOTH)
+        
+        # 진행 상황 쿠키로 이미 받은 부스임을 알 수 있으면 DB 조회 없이 응답
+        progress = read_progress(request)
+        if progress is not None and progress.has_visited(booth):
+            return _render_stamp_page(
+                f'이미 {booth.name}에서 스탬프를 받았습니다.',
+                progress.stamp_count,
+                progress.is_completed,
+                _visited_from_bitmap(progress.visited_booths)
             )
         
-        # 참여자 ID를 세션에서 가져오거나 새로 생성
-        participant_id = request.session.get('participant_id')
-        if participant_id:
-            try:
-                participant = Participant.objects.get(id=participant_id)
-                is_new_participant = False
-            except Participant.DoesNotExist:
-                participant = Participant.objects.create()
-                is_new_participant = True
-                request.session['participant_id'] = str(participant.id)
+        # 참여자 ID를 쿠키(이전 방문자는 세션)에서 가져와 스탬프 처리 (없으면 새로 생성)
+        if progress is not None:
+            participant_id = progress.participant_id
         else:
-            participant = Participant.objects.create()
-            is_new_participant = True
-            request.session['participant_id'] = str(participant.id)
+            participant_id = request.session.get('participant_id')
+        result = record_scan(
+            booth,
+            participant_id=participant_id,
+            ip_address=get_client_ip(request),
+            user_agent=request.META.get('HTTP_USER_AGENT', '')
+        )
+        participant = result.participant
+        stamp_count = result.stamp_count
         
-        # 중복 스탬프 체크
-        if StampRecord.objects.filter(participant=participant, booth=booth).exists():
+        if not result.created:
             message = f'이미 {booth.name}에서 스탬프를 받았습니다.'
-            stamp_count = participant.get_stamp_count()
         else:
-            # 스탬프 기록 생성
-            stamp_record = StampRecord.objects.create(
-                participant=participant,
-                booth=booth,
-                ip_address=get_client_ip(request),
-                user_agent=request.META.get('HTTP_USER_AGENT', '')
-            )
-            participant.refresh_from_db()
-            stamp_count = participant.get_stamp_count()
             message = f'{booth.name}에서 스탬프를 받았습니다!'
-            if is_new_participant:
+            if result.is_new_participant:
                 message = f'새로운 참여자로 등록되었습니다. {message}'
         
-        # 전체 부스 수와 5개 목표에 대한 진행률 계산
-        total_booths = Booth.objects.filter(is_active=True).count()
-        target_stamps = 5  # 목표 스탬프 수
-        progress_percentage = min((stamp_count / target_stamps) * 100, 100)
-        remaining_stamps = max(target_stamps - stamp_count, 0)
-        is_completed = stamp_count >= target_stamps
-        
         # 방문한 부스 정보 가져오기
         visited_records = participant.stamp_records.select_related('booth').order_by('stamped_at')
-        visited_booths = []
-        for record in visited_records:
-            visited_booths.append({
+        visited_booths = [
+            {
                 'name': record.booth.name,
                 'code': record.booth.code,
                 'stamped_at': record.stamped_at.strftime('%m/%d %H:%M')
-            })
-        
-        # 스탬프 진행 상황 아이콘 생성
-        stamp_icons = ''
-        for i in range(target_stamps):
-            if i < stamp_count:
-                stamp_icons += '✅'
-            else:
-                stamp_icons += '⭕'
-        
-        # 방문한 부스 HTML 생성
-        visited_booths_html = ''
-        if visited_booths:
-            visited_items_html = ''
-            for booth in visited_booths:
-                visited_items_html += f'<div class="visited-item"><span class="booth-name">{booth["name"]}</span><span class="visit-time">{booth["stamped_at"]}</span></div>'
-            visited_booths_html = f'<div class="visited-list">{visited_items_html}</div>'
+            }
+            for record in visited_records
+        ]
         
-        # HTML 응답 생성
-        from django.http import HttpResponse
-        return HttpResponse(
-            f"""
-            <!DOCTYPE html>
-            <html lang="ko">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>🏮 제46회 소양강문화제 - QR 스탬프 투어</title>
-                <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;600;700&display=swap" rel="stylesheet">
-                <style>
-                    body {{ 
-                        font-family: 'Noto Sans KR', Arial, sans-serif; 
-                        margin: 0; padding: 20px; 
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        min-height: 100vh;
-                        color: #333;
-                    }}
-                    .container {{
-                        max-width: 420px;
-                        margin: 0 auto;
-                        background: white;
-                        border-radius: 16px;
-                        overflow: hidden;
-                        box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-                    }}
-                    .header {{
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        color: white;
-                        padding: 20px;
-                        text-align: center;
-                    }}
-                    .header h1 {{ margin: 0; font-size: 20px; font-weight: 700; }}
-                    .header p {{ margin: 5px 0 0 0; opacity: 0.9; font-size: 14px; }}
-                    .content {{ padding: 30px 25px; }}
-                    .message {{ 
-                        background: #d4edda; 
-                        color: #155724; 
-                        padding: 15px; 
-                        border-radius: 10px; 
-                        margin-bottom: 25px; 
-                        font-weight: 600;
-                        text-align: center;
-                        border: 1px solid #c3e6cb;
-                    }}
-                    .progress-card {{
-                        background: linear-gradient(135deg, #ff6b9d, #f093fb);
-                        color: white;
-                        border-radius: 15px;
-                        padding: 25px;
-                        text-align: center;
-                        margin-bottom: 20px;
-                        box-shadow: 0 4px 15px rgba(240, 147, 251, 0.3);
-                    }}
-                    .progress-number {{
-                        font-size: 42px;
-                        font-weight: 700;
-                        margin: 10px 0;
-                    }}
-                    .progress-text {{ font-size: 16px; opacity: 0.9; }}
-                    .progress-bar {{
-                        background: rgba(255,255,255,0.3);
-                        height: 8px;
-                        border-radius: 4px;
-                        margin: 15px 0;
-                        overflow: hidden;
-                    }}
-                    .progress-fill {{
-                        background: white;
-                        height: 100%;
-                        width: {progress_percentage}%;
-                        border-radius: 4px;
-                        transition: width 0.5s ease;
-                    }}
-                    .stamp-status {{
-                        background: #f8f9fa;
-                        border-radius: 12px;
-                        padding: 20px;
-                        margin-bottom: 20px;
-                    }}
-                    .stamp-status h3 {{
-                        margin: 0 0 15px 0;
-                        color: #667eea;
-                        font-size: 18px;
-                        display: flex;
-                        align-items: center;
-                        gap: 8px;
-                    }}
-                    .stamp-icons {{
-                        font-size: 24px;
-                        letter-spacing: 8px;
-                        margin: 15px 0;
-                        text-align: center;
-                    }}
-                    .booth-stats {{
-                        background: #e3f2fd;
-                        border-radius: 10px;
-                        padding: 15px;
-                        margin-bottom: 20px;
-                        text-align: center;
-                    }}
-                    .booth-stats h4 {{ margin: 0 0 10px 0; color: #1976d2; }}
-                    .booth-stats-number {{ font-size: 28px; font-weight: 700; color: #1976d2; }}
-                    .visited-list {{
-                        max-height: 150px;
-                        overflow-y: auto;
-                        margin-top: 15px;
-                    }}
-                    .visited-item {{
-                        display: flex;
-                        justify-content: space-between;
-                        align-items: center;
-                        padding: 8px 12px;
-                        background: #f0f8ff;
-                        border-radius: 6px;
-                        margin-bottom: 5px;
-                        font-size: 14px;
-                    }}
-                    .visited-item .booth-name {{ font-weight: 600; color: #333; }}
-                    .visited-item .visit-time {{ color: #666; font-size: 12px; }}
-                    .admin-link {{
-                        text-align: center;
-                        margin-top: 20px;
-                        padding-top: 20px;
-                        border-top: 1px solid #eee;
-                    }}
-                    .admin-btn {{
-                        background: #6c757d;
-                        color: white;
-                        padding: 10px 20px;
-                        border: none;
-                        border-radius: 6px;
-                        font-size: 14px;
-                        text-decoration: none;
-                        display: inline-block;
-                        transition: all 0.3s ease;
-                    }}
-                    .admin-btn:hover {{ background: #5a6268; transform: translateY(-1px); }}
-                    .completion-badge {{
-                        background: linear-gradient(135deg, #28a745, #20c997);
-                        color: white;
-                        padding: 15px;
-                        border-radius: 10px;
-                        text-align: center;
-                        font-weight: 600;
-                        margin-bottom: 20px;
-                        animation: pulse 2s infinite;
-                    }}
-                    @keyframes pulse {{
-                        0% {{ transform: scale(1); }}
-                        50% {{ transform: scale(1.02); }}
-                        100% {{ transform: scale(1); }}
-                    }}
-                    .footer-info {{
-                        text-align: center;
-                        color: #6c757d;
-                        font-size: 13px;
-                        margin-top: 20px;
-                        line-height: 1.4;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h1>🏮 제46회 소양강문화제</h1>
-                        <p>체험부스 스탬프 투어</p>
-                    </div>
-                    
-                    <div class="content">
-                        <div class="message">{message}</div>
-                        
-                        {'<div class="completion-badge">🎉 축하합니다! 스탬프 미션 완료! 🎉</div>' if is_completed else ''}
-                        
-                        <div class="progress-card">
-                            <div style="font-size: 16px; font-weight: 600; margin-bottom: 5px;">스탬프 수집 현황</div>
-                            <div class="progress-number">{stamp_count} / {target_stamps}</div>
-                            <div class="progress-text">{'미션 완료!' if is_completed else f'{remaining_stamps}개 더 수집하면 완료!'}</div>
-                            <div class="progress-bar">
-                                <div class="progress-fill"></div>
-                            </div>
-                            <div class="progress-text">{progress_percentage:.0f}% 완료</div>
-                        </div>
-                        
-                        <div class="stamp-status">
-                            <h3>📋 스탬프 수집 현황</h3>
-                            <div class="stamp-icons">{stamp_icons}</div>
-                            <div style="text-align: center; color: #6c757d; font-size: 14px;">
-                                {'완료' if is_completed else f'현재 {stamp_count}개 수집'} · {'목표 달성' if is_completed else f'{remaining_stamps}개 남음'}
-                            </div>
-                        </div>
-                        
-                        <div class="booth-stats">
-                            <h4>🏢 체험부스 참여 현황</h4>
-                            <div class="booth-stats-number">{stamp_count} / {total_booths}</div>
-                            <div style="color: #666; font-size: 14px;">개의 체험부스를 방문했습니다</div>
-                            
-                            {visited_booths_html if visited_booths else ''}
-                        </div>
-                        
-                        <div class="footer-info">
-                            17개 체험부스 중 5곳을 방문하여 스탬프를 모으고<br>
-                            기념품을 받아가세요!
-                        </div>
-                        
-                        <div class="admin-link">
-                            <a href="/admin/" class="admin-btn">⚙️ 관리자 페이지</a>
-                        </div>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
-        )
+        response = _render_stamp_page(message, stamp_count, stamp_count >= TARGET_STAMPS, visited_booths)
+        # 스탬프 처리 후 최신 진행 상황 쿠키 재발급
+        return set_progress(response, participant)
         
-    except Exception as e:
-        from django.http import HttpResponse
-        return HttpResponse(
-            f"""
-            <!DOCTYPE html>
-            <html lang="ko">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>QR 스탬프 오류</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; padding: 20px; text-align: center; }}
-                    .error {{ color: red; font-size: 18px; margin: 20px; }}
-                </style>
-            </head>
-            <body>
-                <h1>📱 QR 스탬프 오류</h1>
-                <div class="error">QR 처리 중 오류가 발생했습니다: {str(e)}</div>
-            </body>
-            </html>
-            """
-        )
+    except Exception:
+        # 예외 내용은 페이지에 노출하지 않고 로그로만 남김
+        logger.exception('QR 링크 스탬프 처리 실패 (booth=%s)', booth_code)
+        return stamp_pages.error_response(stamp_pages.SCAN_FAILED)
+
+
+HEALTH_STATISTICS_KEY = 'stamps:health_check:statistics'
+
+
+def _health_statistics():
+    """헬스 체크의 기본 통계 (전체 COUNT 는 비용이 크므로 ADMIN_CACHE_TTL 초 동안 캐시)"""
+    counts = cache.get(HEALTH_STATISTICS_KEY)
+    if counts is None:
+        counts = {
+            'total_participants': Participant.objects.count(),
+            'active_booths': Booth.objects.filter(is_active=True).count(),
+            'total_stamps_collected': StampRecord.objects.count(),
+        }
+        cache.set(HEALTH_STATISTICS_KEY, counts, settings.ADMIN_CACHE_TTL)
+    return counts
+
 
 @api_view(['GET'])
 def system_health_check(request):
     """
     시스템 상태 체크 API
-    - 데이터베이스 연결 상태
-    - 기본 통계 정보
+    - 데이터베이스 연결 상태 (캐시하지 않고 요청마다 확인)
+    - 기본 통계 정보 (캐시)
     - API 응답 시간 측정
     """
-    import time
     start_time = time.time()
     
     try:
         # 데이터베이스 연결 테스트
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
         db_status = 'OK'
-        total_participants = Participant.objects.count()
-        total_booths = Booth.objects.filter(is_active=True).count()
-        total_stamps = StampRecord.objects.count()
+        statistics_data = _health_statistics()
         
         # API 응답 시간 계산
         response_time = round((time.time() - start_time) * 1000, 2)  # ms
         
-        from django.utils import timezone
         return Response({
             'success': True,
             'data': {
                 'status': 'healthy',
                 'database': db_status,
                 'response_time_ms': response_time,
-                'statistics': {
-                    'total_participants': total_participants,
-                    'active_booths': total_booths,
-                    'total_stamps_collected': total_stamps
-                },
+                'statistics': statistics_data,
+                'write_behind': ingest.get_ingestor().stats() if ingest.is_enabled() else None,
+                'rollups': rollups.stats(),
+                'idempotency': get_idempotency_counters(),
+                'response_cache': get_response_cache_counters(),
                 'timestamp': timezone.now().isoformat()
             }
         })
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import {
   Box,
   Button,
@@ -54,6 +54,10 @@ interface GiftEligibleParticipant {
   gift_received?: boolean; // 기념품 수령 여부 (향후 확장용)
 }
 
+// 새 완주자 조회 간격 / 전체 목록 다시 불러오기 간격 (ms)
+const INCREMENTAL_INTERVAL = 15000;
+const FULL_RELOAD_INTERVAL = 600000;
+
 const AdminGiftPage: React.FC = () => {
   const navigate = useNavigate();
   const [participants, setParticipants] = useState<GiftEligibleParticipant[]>([]);
@@ -63,6 +67,22 @@ const AdminGiftPage: React.FC = () => {
   const [detailDialogOpen, setDetailDialogOpen] = useState(false);
   const [refreshing, setRefreshing] = useState(false);
   const [showReceived, setShowReceived] = useState(true);
+  // 마지막으로 받은 완주자 위치 (이후 완주자만 조회)
+  const cursorRef = useRef<string | null>(null);
+
+  // 커서 이후 완주자를 모든 페이지에 걸쳐 조회
+  const fetchSince = async (after: string | null) => {
+    const collected: GiftEligibleParticipant[] = [];
+    let cursor = after;
+    for (;;) {
+      const response = await ApiService.getGiftEligibleParticipants(cursor ? { after: cursor } : undefined);
+      if (!response.success || !response.data) break;
+      collected.push(...response.data.participants);
+      cursor = response.data.next_cursor;
+      if (!response.data.has_more) break;
+    }
+    return { collected, cursor };
+  };
 
   const loadGiftEligibleParticipants = async () => {
     try {
@@ -70,10 +90,9 @@ const AdminGiftPage: React.FC = () => {
       if (loading) setLoading(true);
       if (refreshing) setRefreshing(true);
       
-      const response = await ApiService.getGiftEligibleParticipants();
-      if (response.success && response.data) {
-        setParticipants(response.data.participants);
-      }
+      const { collected, cursor } = await fetchSince(null);
+      cursorRef.current = cursor;
+      setParticipants(collected);
     } catch (err) {
       setError('기념품 대상자 데이터를 불러오는 중 오류가 발생했습니다.');
       console.error('Failed to load gift eligible participants:', err);
@@ -83,12 +102,32 @@ const AdminGiftPage: React.FC = () => {
     }
   };
 
+  const loadNewCompletions = async () => {
+    if (cursorRef.current === null) return;
+    try {
+      const { collected, cursor } = await fetchSince(cursorRef.current);
+      cursorRef.current = cursor;
+      if (collected.length === 0) return;
+      setParticipants(prev => {
+        const known = new Set(prev.map(p => p.participant_id));
+        return [...prev, ...collected.filter(p => !known.has(p.participant_id))];
+      });
+    } catch (err) {
+      console.error('Failed to load new gift eligible participants:', err);
+    }
+  };
+
   useEffect(() => {
     loadGiftEligibleParticipants();
     
-    // 60초마다 자동 새로고침
-    const interval = setInterval(loadGiftEligibleParticipants, 60000);
-    return () => clearInterval(interval);
+    // 15초마다 새 완주자만 추가, 10분마다 전체 목록 새로고침
+    // (오프라인 동기화로 과거 시각에 완주한 참여자는 전체 새로고침에서 반영)
+    const incremental = setInterval(loadNewCompletions, INCREMENTAL_INTERVAL);
+    const fullReload = setInterval(loadGiftEligibleParticipants, FULL_RELOAD_INTERVAL);
+    return () => {
+      clearInterval(incremental);
+      clearInterval(fullReload);
+    };
   // eslint-disable-next-line react-hooks/exhaustive-deps
   }, []);
 
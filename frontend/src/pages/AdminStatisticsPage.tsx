@@ -30,7 +30,45 @@ import { useNavigate } from 'react-router-dom';
 import Layout from '../components/Layout';
 import ApiService from '../services/api';
 import AdminAuth from '../utils/adminAuth';
-import { AdminStatistics } from '../types/api';
+import { AdminStatistics, AdminStreamEvent } from '../types/api';
+
+// 실시간 이벤트를 통계에 반영 (전체 다시 조회 없이 증가분만 적용)
+const applyStreamEvent = (stats: AdminStatistics, event: AdminStreamEvent): AdminStatistics => {
+  const summary = { ...stats.summary };
+  let boothStatistics = stats.booth_statistics;
+  let hourlyStatistics = stats.hourly_statistics;
+
+  const bumpHour = (field: 'new_participants' | 'stamps_collected') => {
+    // 새 시간대가 시작되면 가장 오래된 시간대를 밀어냄 (서버와 같은 24시간 구간 유지)
+    if (hourlyStatistics.length > 0 && hourlyStatistics[hourlyStatistics.length - 1].hour !== event.hour) {
+      hourlyStatistics = [...hourlyStatistics.slice(1), { hour: event.hour, new_participants: 0, stamps_collected: 0 }];
+    }
+    hourlyStatistics = hourlyStatistics.map((hourData, index) =>
+      index === hourlyStatistics.length - 1 ? { ...hourData, [field]: hourData[field] + 1 } : hourData
+    );
+  };
+
+  if (event.type === 'participant') {
+    summary.total_participants += 1;
+    bumpHour('new_participants');
+  } else if (event.type === 'completion') {
+    summary.completed_participants += 1;
+    summary.gift_eligible_count += 1;
+  } else if (event.type === 'stamp') {
+    bumpHour('stamps_collected');
+    boothStatistics = boothStatistics
+      .map((booth) =>
+        booth.booth_code === event.booth_code ? { ...booth, participant_count: booth.participant_count + 1 } : booth
+      )
+      .sort((a, b) => b.participant_count - a.participant_count || a.booth_code.localeCompare(b.booth_code))
+      .map((booth, index) => ({ ...booth, popularity_rank: index + 1 }));
+  }
+
+  summary.completion_rate = summary.total_participants > 0
+    ? Math.round((summary.completed_participants / summary.total_participants) * 1000) / 10
+    : 0;
+  return { ...stats, summary, booth_statistics: boothStatistics, hourly_statistics: hourlyStatistics };
+};
 
 const AdminStatisticsPage: React.FC = () => {
   const navigate = useNavigate();
@@ -67,15 +105,30 @@ const AdminStatisticsPage: React.FC = () => {
     
     loadStatistics();
     
-    // 30초마다 자동 새로고침
-    const interval = setInterval(() => {
+    const refresh = () => {
       if (AdminAuth.isAuthenticated()) {
         loadStatistics();
       } else {
         navigate('/');
       }
-    }, 30000);
-    return () => clearInterval(interval);
+    };
+    
+    // 실시간 이벤트로 증가분 반영, 5분마다 전체 통계로 보정 (부스 변경, 재연결 중 누락분 반영)
+    let interval = setInterval(refresh, 300000);
+    const stream = ApiService.openAdminStream((event) => {
+      setStatistics((prev) => (prev ? applyStreamEvent(prev, event) : prev));
+    });
+    // 실시간 스트림을 쓸 수 없는 배포(WSGI)에서는 30초마다 자동 새로고침
+    stream.onerror = () => {
+      if (stream.readyState === EventSource.CLOSED) {
+        clearInterval(interval);
+        interval = setInterval(refresh, 30000);
+      }
+    };
+    return () => {
+      stream.close();
+      clearInterval(interval);
+    };
   // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [navigate]);
 
@@ -324,7 +377,7 @@ const AdminStatisticsPage: React.FC = () => {
       {/* 자동 새로고침 안내 */}
       <Paper sx={{ mt: 4, p: 2, backgroundColor: '#e3f2fd' }}>
         <Typography variant="body2" color="primary" align="center">
-          📡 이 페이지는 30초마다 자동으로 새로고침됩니다. 실시간 데이터를 확인하실 수 있습니다.
+          📡 새 참여자, 스탬프, 완주 현황이 실시간으로 반영되며 5분마다 전체 통계로 보정됩니다.
         </Typography>
       </Paper>
     </Layout>
@@ -34,7 +34,7 @@ const QRScanPage: React.FC = () => {
   };
 
   // QR 스캔 처리 (실제 QR 스캔은 6일차에 구현)
-  const handleScanResult = useCallback(async (boothCode: string) => {
+  const handleScanResult = useCallback(async (boothCode: string, boothToken?: string) => {
     try {
       setScanning(true);
       setError('');
@@ -44,7 +44,8 @@ const QRScanPage: React.FC = () => {
       
       const response = await ApiService.scanQR({
         participant_id: participantId || undefined,
-        booth_code: boothCode
+        booth_code: boothCode,
+        booth_token: boothToken
       });
 
       if (response.success && response.data) {
@@ -96,7 +97,7 @@ const QRScanPage: React.FC = () => {
     
     if (boothParam) {
       console.log('✅ 부스 코드 발견, 스캔 처리 시작:', boothParam);
-      handleScanResult(boothParam);
+      handleScanResult(boothParam, searchParams.get('t') || undefined);
     } else {
       console.log('❌ 부스 코드를 찾을 수 없습니다');
     }
@@ -167,12 +168,14 @@ const QRScanPage: React.FC = () => {
                   }
                   
                   let boothCode = '';
+                  let boothToken = '';
                   
                   // 다양한 형식의 QR 데이터 처리
                   try {
                     // 1. 완전한 URL인 경우
                     const url = new URL(data);
                     boothCode = url.searchParams.get('booth') || '';
+                    boothToken = url.searchParams.get('t') || '';
                     console.log('✅ URL 파싱 성공:', { url: data, boothCode });
                   } catch (urlError) {
                     console.log('🔍 URL 파싱 실패, 다른 방법 시도:', urlError);
@@ -181,6 +184,8 @@ const QRScanPage: React.FC = () => {
                     const boothMatch = data.match(/[?&]booth=([^&]+)/);
                     if (boothMatch) {
                       boothCode = decodeURIComponent(boothMatch[1]);
+                      const tokenMatch = data.match(/[?&]t=([^&]+)/);
+                      boothToken = tokenMatch ? decodeURIComponent(tokenMatch[1]) : '';
                       console.log('✅ 정규식 매칭 성공:', boothCode);
                     } else {
                       // 3. 데이터 자체가 부스 코드인 경우 (art1, folk1 등)
@@ -197,7 +202,7 @@ const QRScanPage: React.FC = () => {
                   // 최종 처리
                   if (boothCode && boothCode.trim()) {
                     console.log('🎉 부스 코드 추출 성공:', boothCode.trim());
-                    handleScanResult(boothCode.trim());
+                    handleScanResult(boothCode.trim(), boothToken || undefined);
                   } else {
                     console.log('❌ 부스 코드 추출 실패, 원본 데이터:', data);
                     setError(`유효하지 않은 QR 코드입니다. 데이터: ${data.substring(0, 50)}...`);
@@ -19,7 +19,7 @@ const StampPage: React.FC = () => {
   const goHome = () => navigate('/');
   const goStatus = () => navigate('/booths');
 
-  const processScan = useCallback(async (boothCode: string) => {
+  const processScan = useCallback(async (boothCode: string, boothToken?: string) => {
     try {
       setLoading(true);
       setError('');
@@ -39,6 +39,7 @@ const StampPage: React.FC = () => {
       const res = await ApiService.scanQR({
         participant_id: participantId || undefined,
         booth_code: boothCode,
+        booth_token: boothToken,
       });
 
       if (res.success && res.data) {
@@ -62,6 +63,8 @@ const StampPage: React.FC = () => {
         // 중복 방문 등의 안내
         setVisitedCount(err.response.data?.data?.stamp_count ?? 0);
         setMessage(err.response.data?.message || '이미 이 부스에서 스탬프를 받았습니다.');
+      } else if (err.response?.status === 403) {
+        setError(err.response.data?.message || '유효하지 않은 QR 코드입니다.');
       } else if (err.response?.status === 404) {
         setError('존재하지 않거나 비활성화된 부스입니다.');
       } else {
@@ -80,7 +83,7 @@ const StampPage: React.FC = () => {
       setLoading(false);
       return;
     }
-    processScan(boothParam);
+    processScan(boothParam, searchParams.get('t') || undefined);
   }, [searchParams, processScan]);
 
   if (loading) {
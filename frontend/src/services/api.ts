@@ -5,7 +5,10 @@ import type {
   ParticipantStats,
   ParticipantDetail,
   QRScanResponse,
+  OfflineScanItem,
+  ScanBatchResponse,
   AdminStatistics,
+  AdminStreamEvent,
   ApiResponse,
   BoothManagement,
   CreateBoothRequest,
@@ -74,6 +77,14 @@ apiClient.interceptors.response.use(
   }
 );
 
+// 스캔 요청별 멱등성 키 생성
+const createIdempotencyKey = (): string => {
+  if (typeof crypto !== 'undefined' && typeof crypto.randomUUID === 'function') {
+    return crypto.randomUUID();
+  }
+  return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}${Math.random().toString(36).slice(2)}`;
+};
+
 export class ApiService {
   // 부스 관련 API
   static async getBooths(): Promise<ApiResponse<Booth[]>> {
@@ -108,8 +119,33 @@ export class ApiService {
   }
 
   // QR 스캔 관련 API (핵심 기능)
-  static async scanQR(data: { participant_id?: string; booth_code: string }): Promise<ApiResponse<QRScanResponse>> {
-    const response = await apiClient.post<ApiResponse<QRScanResponse>>('/scan/', data);
+  // 응답이 유실되어 재시도해도 서버가 첫 응답을 재전송하도록 스캔마다 Idempotency-Key 를 붙임
+  static async scanQR(
+    data: { participant_id?: string; booth_code: string; booth_token?: string },
+    idempotencyKey: string = createIdempotencyKey()
+  ): Promise<ApiResponse<QRScanResponse>> {
+    const config = { headers: { 'Idempotency-Key': idempotencyKey } };
+    try {
+      const response = await apiClient.post<ApiResponse<QRScanResponse>>('/scan/', data, config);
+      return response.data;
+    } catch (error) {
+      // 네트워크 오류/타임아웃(응답 없음)인 경우에만 같은 키로 1회 재시도
+      if (!axios.isAxiosError(error) || error.response) {
+        throw error;
+      }
+      const response = await apiClient.post<ApiResponse<QRScanResponse>>('/scan/', data, config);
+      return response.data;
+    }
+  }
+
+  // 오프라인에서 모아 둔 스캔 일괄 동기화
+  static async syncOfflineScans(
+    data: { participant_id?: string; items: OfflineScanItem[] },
+    idempotencyKey: string = createIdempotencyKey()
+  ): Promise<ApiResponse<ScanBatchResponse>> {
+    const response = await apiClient.post<ApiResponse<ScanBatchResponse>>('/scan/batch/', data, {
+      headers: { 'Idempotency-Key': idempotencyKey },
+    });
     return response.data;
   }
 
@@ -125,8 +161,16 @@ export class ApiService {
     return response.data;
   }
 
-  static async getGiftEligibleParticipants(): Promise<ApiResponse<any>> {
-    const response = await apiClient.get<ApiResponse<any>>('/admin/gift-eligible/');
+  // 대시보드 실시간 이벤트 구독 (연결이 끊기면 브라우저가 Last-Event-ID 로 자동 재연결)
+  static openAdminStream(onEvent: (event: AdminStreamEvent) => void): EventSource {
+    const source = new EventSource(`${API_BASE_URL}/admin/stream/`);
+    const handler = (message: MessageEvent) => onEvent(JSON.parse(message.data));
+    ['participant', 'stamp', 'completion'].forEach((type) => source.addEventListener(type, handler));
+    return source;
+  }
+
+  static async getGiftEligibleParticipants(params?: { after?: string; limit?: number }): Promise<ApiResponse<any>> {
+    const response = await apiClient.get<ApiResponse<any>>('/admin/gift-eligible/', { params });
     return response.data;
   }
 
@@ -71,6 +71,27 @@ export interface QRScanResponse {
   is_new_participant: boolean;
 }
 
+// 오프라인 스캔 일괄 동기화
+export interface OfflineScanItem {
+  booth_code: string;
+  booth_token?: string;
+  scanned_at: string;
+  client_nonce: string;
+}
+
+export interface ScanBatchResponse {
+  participant_id: string;
+  stamp_count: number;
+  is_completed: boolean;
+  completed_at?: string;
+  is_new_participant: boolean;
+  results: Array<{
+    client_nonce: string;
+    booth_code: string;
+    status: 'stamped' | 'duplicate' | 'invalid_booth' | 'invalid_token';
+  }>;
+}
+
 // 관리자 통계
 export interface AdminStatistics {
   summary: {
@@ -96,6 +117,17 @@ export interface HourlyStatistic {
   stamps_collected: number;
 }
 
+// 관리자 대시보드 실시간 이벤트 (GET /api/admin/stream/)
+export interface AdminStreamEvent {
+  id: number;
+  type: 'participant' | 'stamp' | 'completion';
+  participant_id: string;
+  booth_code: string | null;
+  at: string;
+  hour: string;
+  stamp_count?: number;
+}
+
 // 부스 관리용 타입
 export interface BoothManagement extends Booth {
   created_at: string;